@@ -14,6 +14,7 @@
 import "@testing-library/jest-dom";
 import {
     addRows,
+    applyDataDelta,
     AlertMessage,
     BlockMessage,
     createAckAction,
@@ -780,6 +781,50 @@ describe("addRows function", () => {
     });
 });
 
+describe("applyDataDelta function", () => {
+    it("should patch and append table rows", () => {
+        const pages = {
+            page1: { data: [{ a: 1, b: 2 }, { a: 3, b: 4 }], rowcount: 2, start: 0 },
+            page2: { data: [{ a: 5 }], rowcount: 2, start: 1 },
+        };
+        const result = applyDataDelta(pages, { page1: { rows: { "1": { b: 5 }, "2": { a: 6, b: 7 } }, rowcount: 3 } });
+        expect(result).toEqual({
+            page1: {
+                data: [
+                    { a: 1, b: 2 },
+                    { a: 3, b: 5 },
+                    { a: 6, b: 7 },
+                ],
+                rowcount: 3,
+                start: 0,
+            },
+        });
+        expect(pages.page1.data[1]).toEqual({ a: 3, b: 4 });
+    });
+    it("should append chart data", () => {
+        const result = applyDataDelta({ chart: { x: [1, 2], y: [3, 4] } }, { chart: { append: { x: [3], y: [5] } } });
+        expect(result).toEqual({ chart: { x: [1, 2, 3], y: [3, 4, 5] } });
+    });
+    it("should not apply changes to unknown pages", () => {
+        expect(applyDataDelta({}, { page: { rows: {}, rowcount: 0 } })).toBeUndefined();
+    });
+    it("should be applied by the reducer", () => {
+        const initialState = { ...INITIAL_STATE, data: { table: { page: { data: [{ a: 1 }], rowcount: 1 } } } };
+        const action = {
+            type: Types.Update,
+            name: "table",
+            payload: { value: { __taipy_delta: { page: { rows: { "0": { a: 2 } }, rowcount: 1 } } } },
+        };
+        expect(taipyReducer(initialState, action as TaipyBaseAction).data.table).toEqual({
+            page: { data: [{ a: 2 }], rowcount: 1 },
+        });
+        const unknownPage = { ...action, payload: { value: { __taipy_delta: { other: { rows: {}, rowcount: 1 } } } } };
+        expect(taipyReducer(initialState, unknownPage as TaipyBaseAction).data.table).toEqual({
+            __taipy_refresh: true,
+        });
+    });
+});
+
 describe("retreiveBlockUi function", () => {
     it("should retrieve block message from localStorage", () => {
         const mockBlockMessage = { action: "testAction", noCancel: false, close: false, message: "testMessage" };
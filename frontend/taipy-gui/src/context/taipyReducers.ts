@@ -314,6 +314,48 @@ export const addRows = (previousRows: Record<string, unknown>[], newRows: Record
         return arr;
     }, previousRows.concat([]));
 
+/**
+ * Apply the changes sent by the backend to the pages of data of a variable.
+ *
+ * Table pages are patched row by row, chart data is appended to.
+ * Returns undefined if a page is unknown: the data then has to be refreshed.
+ */
+export const applyDataDelta = (
+    pages: Record<string, unknown>,
+    delta: Record<string, Record<string, unknown>>
+): Record<string, unknown> | undefined => {
+    const newPages: Record<string, unknown> = {};
+    for (const [pageKey, pageDelta] of Object.entries(delta)) {
+        const page = pages[pageKey] as Record<string, unknown> | undefined;
+        if (!page) {
+            return undefined;
+        }
+        if (pageDelta.rows) {
+            const data = ((page.data || []) as Record<string, unknown>[]).concat([]);
+            Object.entries(pageDelta.rows as Record<string, Record<string, unknown>>).forEach(([idx, cells]) => {
+                const i = parseInt(idx, 10);
+                data[i] = { ...data[i], ...cells };
+            });
+            const newPage: Record<string, unknown> = { ...page, data: data, rowcount: pageDelta.rowcount };
+            if (pageDelta.fullrowcount !== undefined) {
+                newPage.fullrowcount = pageDelta.fullrowcount;
+            }
+            newPages[pageKey] = newPage;
+        } else if (pageDelta.append) {
+            newPages[pageKey] = Object.entries(pageDelta.append as Record<string, unknown[]>).reduce(
+                (pv, [col, values]) => {
+                    pv[col] = ((page[col] || []) as unknown[]).concat(values);
+                    return pv;
+                },
+                { ...page } as Record<string, unknown>
+            );
+        } else {
+            return undefined;
+        }
+    }
+    return newPages;
+};
+
 export const storeBlockUi = (block?: BlockMessage) => () => {
     if (localStorage) {
         if (block) {
@@ -345,9 +387,16 @@ export const taipyReducer = (state: TaipyState, baseAction: TaipyBaseAction): Ta
         case Types.SocketConnected:
             return !!state.isSocketConnected ? state : { ...state, isSocketConnected: true };
         case Types.Update:
-            const newValue = action.payload.value as Record<string, unknown>;
+            let newValue = action.payload.value as Record<string, unknown>;
             const oldValue = (state.data[action.name] as Record<string, unknown>) || {};
             delete oldValue.__taipy_refresh;
+            if (newValue && typeof newValue === "object" && newValue.__taipy_delta) {
+                // only the pages that the backend knows about are kept, others will be requested again
+                newValue = applyDataDelta(
+                    oldValue,
+                    newValue.__taipy_delta as Record<string, Record<string, unknown>>
+                ) || { __taipy_refresh: true };
+            }
             if (typeof action.payload.infinite === "boolean" && action.payload.infinite) {
                 const start = newValue.start;
                 if (typeof start === "number") {
@@ -22,6 +22,9 @@ const uploadFile = (
     uploadData: string | undefined,
     part: number,
     total: number,
+    offset: number,
+    size: number,
+    uploadId: string,
     fileName: string,
     multiple: boolean,
     id: string,
@@ -35,6 +38,9 @@ const uploadFile = (
     fdata.append("blob", blobOrFile, fileName);
     fdata.append("part", part.toString());
     fdata.append("total", total.toString());
+    fdata.append("offset", offset.toString());
+    fdata.append("size", size.toString());
+    fdata.append("upload_id", uploadId);
     fdata.append("var_name", varName);
     context && fdata.append("context", context);
     onAction && fdata.append("on_action", onAction);
@@ -74,6 +80,8 @@ const process = (
             let start = 0;
             let end = BYTES_PER_CHUNK;
             const tot = Math.ceil(size / BYTES_PER_CHUNK);
+            // identifies the chunks of this file on the server
+            const uploadId = `${id}-${Date.now()}-${i}-${Math.random()}`;
 
             while (start < size) {
                 const chunk = blob.slice(start, end);
@@ -89,6 +97,9 @@ const process = (
                     uploadData,
                     Math.floor(start / BYTES_PER_CHUNK),
                     tot,
+                    start,
+                    size,
+                    uploadId,
                     blob.name,
                     i == 0 ? false : files.length > 0,
                     id,
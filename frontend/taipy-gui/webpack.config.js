@@ -13,6 +13,7 @@
 
 // webpack should be in the node_modules directory, install if not.
 const path = require("path");
+const zlib = require("zlib");
 const webpack = require("webpack");
 const CopyWebpackPlugin = require("copy-webpack-plugin");
 const HtmlWebpackPlugin = require("html-webpack-plugin");
@@ -36,7 +37,28 @@ const reactDllPath = resolveApp(basePath + "/" + reactBundle + ".dll.js")
 const taipyDllPath = resolveApp(basePath + "/" + taipyBundle + ".js")
 const taipyGuiBaseExportPath = resolveApp(basePath + "/taipy-gui-base-export");
 
+// Emits the brotli and gzip compressed variants of the bundles.
+// The Taipy server sends them to the clients that accept these encodings.
+class PrecompressPlugin {
+    apply(compiler) {
+        compiler.hooks.thisCompilation.tap("PrecompressPlugin", (compilation) => {
+            compilation.hooks.processAssets.tap(
+                { name: "PrecompressPlugin", stage: webpack.Compilation.PROCESS_ASSETS_STAGE_OPTIMIZE_TRANSFER },
+                (assets) =>
+                    Object.keys(assets)
+                        .filter((name) => /\.(js|css|json|svg)$/.test(name) && assets[name].size() > 1024)
+                        .forEach((name) => {
+                            const content = assets[name].buffer();
+                            compilation.emitAsset(name + ".br", new webpack.sources.RawSource(zlib.brotliCompressSync(content)));
+                            compilation.emitAsset(name + ".gz", new webpack.sources.RawSource(zlib.gzipSync(content, { level: 9 })));
+                        })
+            );
+        });
+    }
+}
+
 module.exports = (env, options) => {
+    const precompressPlugins = options.mode === "production" ? [new PrecompressPlugin()] : [];
     const envVariables = {
         frontend_version: require(resolveApp('package.json')).version,
         frontend_build_date: new Date().toISOString(),
@@ -59,7 +81,8 @@ module.exports = (env, options) => {
                 new webpack.DllPlugin({
                     name: reactBundleName,
                     path: reactManifestPath
-                })
+                }),
+                ...precompressPlugins,
             ]
         },
         {
@@ -107,7 +130,8 @@ module.exports = (env, options) => {
                 new webpack.DllReferencePlugin({
                     name: reactBundleName,
                     manifest: reactManifestPath
-                })
+                }),
+                ...precompressPlugins,
             ]
         },
         {
@@ -168,6 +192,7 @@ module.exports = (env, options) => {
                     filepath: taipyDllPath,
                     hash: true
                 }]),
+                ...precompressPlugins,
             ],
     },
     {
@@ -209,6 +234,7 @@ module.exports = (env, options) => {
         resolve: {
             extensions: [".tsx", ".ts", ".js", ".tsx"],
         },
+        plugins: precompressPlugins,
         // externals: {
         //     "socket.io-client": {
         //         commonjs: "socket.io-client",
@@ -174,6 +174,7 @@ interface DataNodeViewerProps extends  CoreProps {
     chartConfigs?: string;
     scenarios?: Scenarios;
     history?: Array<[string, string, string]>;
+    historyCount?: number;
     data?: DatanodeData;
     tabularData?: TableValueType;
     tabularColumns?: string;
@@ -228,6 +229,18 @@ enum TabValues {
     History,
 }
 
+// number of edits requested at once in the history tab
+const historyPageSize = 50;
+
+const getHistoryContext = (updateDnVars: string, dnId: string, size: number) => {
+    const idVar = getUpdateVar(updateDnVars, "history_id");
+    const sizeVar = getUpdateVar(updateDnVars, "history_size");
+    const context: Record<string, unknown> = {};
+    idVar && (context[idVar] = dnId);
+    sizeVar && (context[sizeVar] = size);
+    return idVar || sizeVar ? context : undefined;
+};
+
 const DataNodeViewer = (props: DataNodeViewerProps) => {
     const {
         id = "",
@@ -288,14 +301,13 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                 if (newValue == TabValues.History) {
                     setHistoryRequested((req) => {
                         if (!req) {
-                            const idVar = getUpdateVar(updateDnVars, "history_id");
                             dispatch(
                                 createRequestUpdateAction(
                                     id,
                                     module,
-                                    getUpdateVarNames(updateVars, "history"),
+                                    getUpdateVarNames(updateVars, "history", "historyCount"),
                                     true,
-                                    idVar ? { [idVar]: dnId } : undefined
+                                    getHistoryContext(updateDnVars, dnId, historyPageSize)
                                 )
                             );
                         }
@@ -386,13 +398,9 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
             editLock.current = dn[DataNodeFullProps.editInProgress];
             setHistoryRequested((req) => {
                 if (req && !isNewDn && tabValue == TabValues.History) {
-                    const idVar = getUpdateVar(updateDnVars, "history_id");
-                    const vars = getUpdateVarNames(updateVars, "history");
-                    Promise.resolve().then(() =>
-                        dispatch(
-                            createRequestUpdateAction(id, module, vars, true, idVar ? { [idVar]: newDnId } : undefined)
-                        )
-                    );
+                    const vars = getUpdateVarNames(updateVars, "history", "historyCount");
+                    const context = getHistoryContext(updateDnVars, newDnId, historyPageSize);
+                    Promise.resolve().then(() => dispatch(createRequestUpdateAction(id, module, vars, true, context)));
                     return true;
                 }
                 return false;
@@ -455,6 +463,22 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
     const [dataRequested, setDataRequested] = useState(false);
     const [propertiesRequested, setPropertiesRequested] = useState(false);
 
+    const historyLength = Array.isArray(props.history) ? props.history.length : 0;
+    const historyCount = props.historyCount ?? historyLength;
+    const loadMoreHistory = useCallback(
+        () =>
+            dispatch(
+                createRequestUpdateAction(
+                    id,
+                    module,
+                    getUpdateVarNames(updateVars, "history", "historyCount"),
+                    true,
+                    getHistoryContext(updateDnVars, dnId, historyLength + historyPageSize)
+                )
+            ),
+        [dispatch, id, module, updateVars, updateDnVars, dnId, historyLength]
+    );
+
     // userExpanded
     const [userExpanded, setUserExpanded] = useState(valid && expanded);
     const onExpand = useCallback(
@@ -940,7 +964,7 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                                             ) : null}
                                             <Grid container>
                                                 <Grid size={0.4} sx={editSx}>
-                                                    <Box>{(props.history || []).length - idx}</Box>
+                                                    <Box>{historyCount - idx}</Box>
                                                 </Grid>
                                                 <Grid size={0.1}></Grid>
                                                 <Grid container size={11.5}>
@@ -961,6 +985,14 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                                             </Grid>
                                         </Fragment>
                                     ))}
+                                    {historyLength < historyCount ? (
+                                        <Grid size={12}>
+                                            <Button variant="text" onClick={loadMoreHistory}>
+                                                Show {Math.min(historyPageSize, historyCount - historyLength)} more
+                                                edits ({historyCount - historyLength} remaining)
+                                            </Button>
+                                        </Grid>
+                                    ) : null}
                                 </Grid>
                             ) : (
                                 "History will come here"
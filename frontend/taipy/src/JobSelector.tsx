@@ -43,7 +43,9 @@ import TableBody from "@mui/material/TableBody";
 import TableCell from "@mui/material/TableCell";
 import TableContainer from "@mui/material/TableContainer";
 import TableHead from "@mui/material/TableHead";
+import TablePagination from "@mui/material/TablePagination";
 import TableRow from "@mui/material/TableRow";
+import TableSortLabel from "@mui/material/TableSortLabel";
 import TextField from "@mui/material/TextField";
 import Toolbar from "@mui/material/Toolbar";
 import Tooltip from "@mui/material/Tooltip";
@@ -85,6 +87,7 @@ const RightButtonSx = { marginLeft: "auto !important" };
 
 interface JobSelectorProps extends CoreProps {
     jobs: Jobs;
+    jobsCount?: number;
     onSelect?: string;
     height: string;
     showId?: boolean;
@@ -120,12 +123,12 @@ enum JobProps {
     not_readable,
     not_editable,
 }
-const JobLength = Object.keys(JobProps).length / 2;
 
 const containerSx = { width: "100%", mb: 2 };
 const selectSx = { height: 50 };
 const containerPopupSx = { width: "619px" };
 const tableWidthSx = { minWidth: 750 };
+const rowsPerPageOptions = [25, 50, 100, 250];
 
 type JobSelectorColumns = {
     id: string;
@@ -344,13 +347,27 @@ const Filter = ({ open, anchorEl, handleFilterClose, handleApplyFilter, columns
     );
 };
 
+type JobSort = {
+    col: number;
+    order: boolean;
+};
+
 interface JobSelectedTableHeadProps {
     jobs: number;
     selected: number;
     handleSelectAllClick?: (event: React.ChangeEvent<HTMLInputElement>) => void;
     columns: JobSelectorColumns[];
+    sort?: JobSort;
+    handleSort: (event: React.MouseEvent<HTMLElement>) => void;
 }
-const JobSelectedTableHead = ({ jobs, selected, handleSelectAllClick, columns }: JobSelectedTableHeadProps) => (
+const JobSelectedTableHead = ({
+    jobs,
+    selected,
+    handleSelectAllClick,
+    columns,
+    sort,
+    handleSort,
+}: JobSelectedTableHeadProps) => (
     <TableHead>
         <TableRow>
             <TableCell padding="checkbox">
@@ -365,10 +382,21 @@ const JobSelectedTableHead = ({ jobs, selected, handleSelectAllClick, columns }:
                 .filter((c) => c.showPrimaryLabel || c.showSecondayLabel)
                 .map((col) => (
                     <TableCell key={col.id}>
-                        {col.secondaryLabel ? (
-                            <ListItemText primary={col.primaryLabel} secondary={col.secondaryLabel} />
-                        ) : (
+                        {col.columnIndex < 0 ? (
                             col.primaryLabel
+                        ) : (
+                            <TableSortLabel
+                                active={sort?.col === col.columnIndex}
+                                direction={sort?.col === col.columnIndex && !sort.order ? "desc" : "asc"}
+                                data-col={col.columnIndex}
+                                onClick={handleSort}
+                            >
+                                {col.secondaryLabel ? (
+                                    <ListItemText primary={col.primaryLabel} secondary={col.secondaryLabel} />
+                                ) : (
+                                    col.primaryLabel
+                                )}
+                            </TableSortLabel>
                         )}
                     </TableCell>
                 ))}
@@ -500,6 +528,9 @@ const JobSelector = (props: JobSelectorProps) => {
     const [selected, setSelected] = useState<string[]>([]);
     const [jobRows, setJobRows] = useState<Jobs>([]);
     const [filters, setFilters] = useState<FilterData[]>();
+    const [sort, setSort] = useState<JobSort>();
+    const [page, setPage] = useState(0);
+    const [rowsPerPage, setRowsPerPage] = useState(rowsPerPageOptions[1]);
     const [anchorEl, setAnchorEl] = useState<HTMLButtonElement | null>(null);
     const [showDetails, setShowDetails] = useState(false);
     const detailId = useRef<string>();
@@ -509,7 +540,24 @@ const JobSelector = (props: JobSelectorProps) => {
 
     const className = useClassNames(props.libClassName, props.dynamicClassName, props.className);
 
-    useDispatchRequestUpdateOnFirstRender(dispatch, id, module, props.updateVars);
+    // jobs are requested page by page, with the filters and sort applied on the server
+    const firstRenderVars = useMemo(
+        () =>
+            (props.updateVars || "")
+                .split(";")
+                .filter((uv) => !uv.startsWith("jobs=") && !uv.startsWith("jobsCount="))
+                .join(";"),
+        [props.updateVars]
+    );
+    useDispatchRequestUpdateOnFirstRender(dispatch, id, module, firstRenderVars);
+
+    const requestJobs = useCallback(
+        (context?: Record<string, unknown>) => {
+            const jobsVars = getUpdateVarNames(props.updateVars || "", "jobs", "jobsCount");
+            jobsVars.length && dispatch(createRequestUpdateAction(id, module, jobsVars, true, context));
+        },
+        [props.updateVars, dispatch, id, module]
+    );
 
     const headerToolbarSx = useMemo(
         () => ({
@@ -735,35 +783,42 @@ const JobSelector = (props: JobSelectorProps) => {
     }, [props.details]);
 
     useEffect(() => {
-        let filteredJobRows = [...(props.jobs || [])];
-        filteredJobRows.length &&
-            filters &&
-            filters
-                .filter((filter) => filter.data && filter.operator)
-                .forEach((filter) => {
-                    filteredJobRows = filteredJobRows.filter((job) => {
-                        let rowColumnValue = "";
-                        if (filter.data === JobProps.status) {
-                            rowColumnValue = Status[job[JobProps.status]].toLowerCase();
-                        } else if (filter.data === JobProps.id) {
-                            rowColumnValue = `${job[JobProps.id].toLowerCase()}${job[JobProps.name].toLowerCase()}`;
-                        } else if (filter.data === JobProps.submitted_id) {
-                            rowColumnValue = `${job[JobProps.submitted_id].toLowerCase()}${job[
-                                JobProps.submitted_label
-                            ].toLowerCase()}`;
-                        } else if (filter.data === JobProps.creation_date) {
-                            rowColumnValue = new Date(job[JobProps.creation_date]).toLocaleString();
-                        } else if (filter.data < JobLength) {
-                            rowColumnValue = job[filter.data].toString().toLowerCase();
-                        }
-                        const includes = rowColumnValue.includes(filter.value.toLowerCase());
-                        return filter.operator === "is" ? includes : !includes;
-                    });
-                });
-        setJobRows(filteredJobRows);
-        const jobIds = filteredJobRows.map((j) => j[JobProps.id]);
+        const filterVar = getUpdateVar(updateJbVars, "filter");
+        const sortVar = getUpdateVar(updateJbVars, "sort");
+        const pageVar = getUpdateVar(updateJbVars, "page");
+        const context: Record<string, unknown> = {};
+        filterVar && (context[filterVar] = (filters || []).filter((filter) => filter.operator));
+        sortVar && (context[sortVar] = sort ? [sort] : []);
+        pageVar && (context[pageVar] = { start: page * rowsPerPage, end: (page + 1) * rowsPerPage });
+        requestJobs(context);
+    }, [filters, sort, page, rowsPerPage, updateJbVars, requestJobs]);
+
+    useEffect(() => {
+        const jobRows = props.jobs || [];
+        setJobRows(jobRows);
+        const jobIds = jobRows.map((j) => j[JobProps.id]);
         setChecked((ids) => ids.filter((id) => jobIds.includes(id)));
-    }, [filters, props.jobs]);
+    }, [props.jobs]);
+
+    const applyFilters = useCallback((filters: FilterData[]) => {
+        setFilters(filters);
+        setPage(0);
+    }, []);
+
+    const handleSort = useCallback((event: React.MouseEvent<HTMLElement>) => {
+        const col = parseInt(event.currentTarget.dataset.col || "", 10);
+        if (!isNaN(col)) {
+            setSort((old) => ({ col: col, order: old?.col === col ? !old.order : true }));
+            setPage(0);
+        }
+    }, []);
+
+    const handleChangePage = useCallback((event: unknown, newPage: number) => setPage(newPage), []);
+
+    const handleChangeRowsPerPage = useCallback((event: React.ChangeEvent<HTMLInputElement>) => {
+        setRowsPerPage(parseInt(event.target.value, 10));
+        setPage(0);
+    }, []);
 
     useEffect(() => {
         if (props.value) {
@@ -780,10 +835,9 @@ const JobSelector = (props: JobSelectorProps) => {
 
     useEffect(() => {
         if (coreChanged?.jobs) {
-            const updateVar = getUpdateVar(props.updateVars, "jobs");
-            updateVar && dispatch(createRequestUpdateAction(id, module, [updateVar], true));
+            requestJobs();
         }
-    }, [coreChanged, props.updateVars, module, dispatch, id]);
+    }, [coreChanged, requestJobs]);
 
     const tableHeightSx = useMemo(() => ({ maxHeight: props.height || "50vh" }), [props.height]);
 
@@ -859,7 +913,7 @@ const JobSelector = (props: JobSelectorProps) => {
                         open={!!anchorEl}
                         anchorEl={anchorEl}
                         handleFilterClose={handleFilterClose}
-                        handleApplyFilter={setFilters}
+                        handleApplyFilter={applyFilters}
                         columns={jobSelectorColumns}
                     />
                 </Toolbar>
@@ -870,6 +924,8 @@ const JobSelector = (props: JobSelectorProps) => {
                             selected={checked.length}
                             handleSelectAllClick={handleCheckAllClick}
                             columns={jobSelectorColumns}
+                            sort={sort}
+                            handleSort={handleSort}
                         />
                         <TableBody>
                             {jobRows.map((row) => (
@@ -895,6 +951,15 @@ const JobSelector = (props: JobSelectorProps) => {
                         </TableBody>
                     </Table>
                 </TableContainer>
+                <TablePagination
+                    component="div"
+                    count={props.jobsCount ?? jobRows.length}
+                    page={page}
+                    rowsPerPage={rowsPerPage}
+                    rowsPerPageOptions={rowsPerPageOptions}
+                    onPageChange={handleChangePage}
+                    onRowsPerPageChange={handleChangeRowsPerPage}
+                />
             </Paper>
             {props.children}
         </Box>
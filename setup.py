@@ -57,7 +57,11 @@ setup(
         ],
         "rdp": ["rdp>=0.8"],
         "arrow": ["pyarrow>=17.0.0,<18.0"],
+        "asgi": ["uvicorn>=0.29,<1.0", "asgiref>=3.7,<4.0"],
+        "orjson": ["orjson>=3.9,<4.0"],
         "mssql": ["pyodbc>=4"],
+        "zstd": ["zstandard>=0.22,<1.0"],
+        "lz4": ["lz4>=4.3,<5.0"],
     },
     cmdclass={"build_py": NPMInstall},
 )
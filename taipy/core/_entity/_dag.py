@@ -10,7 +10,9 @@
 # specific language governing permissions and limitations under the License.
 
 import math
-from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import networkx as nx
 
@@ -30,11 +32,31 @@ class _Edge:
 
 
 class _DAG:
+    # Above this grid width, generations are centered on a grid as wide as the largest one
+    _MAX_GRID_WIDTH = 1024
+    # Number of barycenter sweeps ordering the nodes of each generation
+    _ORDERING_SWEEPS = 4
+    _MAX_CACHED_LAYOUTS = 64
+
+    # Node positions per topology
+    __layouts: "OrderedDict[Tuple, Tuple[int, bool, Dict[str, Tuple[int, float]]]]" = OrderedDict()
+    __layouts_lock = Lock()
+
     def __init__(self, dag: nx.DiGraph):
         self._sorted_nodes = list(nx.topological_generations(dag))
         self._length, self._width = self.__compute_size()
-        self._grid_length, self._grid_width = self.__compute_grid_size()
-        self._nodes = self.__compute_nodes()
+        key = self.__get_topology_key(dag)
+        if (layout := _DAG.__get_layout(key)) is None:
+            self.__order_nodes(dag)
+            self._grid_length, self._grid_width, self._compact = self.__compute_grid_size()
+            self._nodes = self.__compute_nodes()
+            _DAG.__put_layout(
+                key, (self._grid_width, self._compact, {id: (node.x, node.y) for id, node in self._nodes.items()})
+            )
+        else:
+            self._grid_length = self._length
+            self._grid_width, self._compact, positions = layout
+            self._nodes = {node.id: _Node(node, *positions[node.id]) for nodes in self._sorted_nodes for node in nodes}
         self._edges = self.__compute_edges(dag)
 
     @property
@@ -54,29 +76,81 @@ class _DAG:
         return self._edges
 
     def __compute_size(self) -> Tuple[int, int]:
-        return len(self._sorted_nodes), max(len(i) for i in self._sorted_nodes)
+        return len(self._sorted_nodes), max((len(i) for i in self._sorted_nodes), default=0)
+
+    def __get_topology_key(self, dag: nx.DiGraph) -> Tuple:
+        return (
+            tuple(tuple(node.id for node in nodes) for nodes in self._sorted_nodes),
+            tuple(sorted((src.id, dest.id) for src, dest in dag.edges())),
+        )
+
+    @staticmethod
+    def __get_layout(key: Tuple) -> Optional[Tuple[int, bool, Dict[str, Tuple[int, float]]]]:
+        with _DAG.__layouts_lock:
+            if (layout := _DAG.__layouts.get(key)) is not None:
+                _DAG.__layouts.move_to_end(key)
+            return layout
+
+    @staticmethod
+    def __put_layout(key: Tuple, layout: Tuple[int, bool, Dict[str, Tuple[int, float]]]):
+        with _DAG.__layouts_lock:
+            _DAG.__layouts[key] = layout
+            while len(_DAG.__layouts) > _DAG._MAX_CACHED_LAYOUTS:
+                _DAG.__layouts.popitem(last=False)
+
+    def __order_nodes(self, dag: nx.DiGraph):
+        """Order the nodes of each generation by the mean position of their neighbors in the previous one.
+
+        Sweeps alternate downward (predecessors) and upward (successors), to reduce edge crossings.
+        """
+        positions = {node: i for nodes in self._sorted_nodes for i, node in enumerate(nodes)}
+
+        def barycenter(node, neighbors) -> float:
+            neighbor_positions = [positions[n] for n in neighbors(node)]
+            return sum(neighbor_positions) / len(neighbor_positions) if neighbor_positions else positions[node]
+
+        for sweep in range(_DAG._ORDERING_SWEEPS):
+            generations: Iterable[List]
+            if sweep % 2:
+                generations, neighbors = reversed(self._sorted_nodes[:-1]), dag.successors
+            else:
+                generations, neighbors = iter(self._sorted_nodes[1:]), dag.predecessors
+            for nodes in generations:
+                nodes.sort(key=lambda node: barycenter(node, neighbors))
+                positions.update((node, i) for i, node in enumerate(nodes))
 
-    def __compute_grid_size(self) -> Tuple[int, int]:
+    def __compute_grid_size(self) -> Tuple[int, int, bool]:
         if self._width == 1:
-            grd_wdt = 1
-        else:
-            grd_wdt = math.lcm(*[len(i) + 1 if len(i) != self._width else len(i) - 1 for i in self._sorted_nodes]) + 1
-        return len(self._sorted_nodes), grd_wdt
+            return len(self._sorted_nodes), 1, False
+        grd_wdt = 1
+        for size in (len(i) + 1 if len(i) != self._width else len(i) - 1 for i in self._sorted_nodes):
+            grd_wdt = math.lcm(grd_wdt, size)
+            if grd_wdt >= _DAG._MAX_GRID_WIDTH:
+                # the least common multiple grows with each generation of a different width
+                return len(self._sorted_nodes), self._width, True
+        return len(self._sorted_nodes), grd_wdt + 1, False
 
     def __compute_nodes(self) -> Dict[str, _Node]:
         nodes = {}
+        y_incr: float
+        y: float
         for x, same_lvl_nodes in enumerate(self._sorted_nodes):
             lcl_wdt = len(same_lvl_nodes)
-            is_max = lcl_wdt != self.width
-            if self.width != 1:
-                y_incr = (self._grid_width - 1) / (lcl_wdt + 1) if is_max else (self._grid_width - 1) / (lcl_wdt - 1)
-            else:
+            if self._compact:
                 y_incr = 1
-            y = 0 if is_max else -y_incr
+                y = (self.width - lcl_wdt) / 2 - 1
+            else:
+                is_max = lcl_wdt != self.width
+                if self.width != 1:
+                    y_incr = (
+                        (self._grid_width - 1) / (lcl_wdt + 1) if is_max else (self._grid_width - 1) / (lcl_wdt - 1)
+                    )
+                else:
+                    y_incr = 1
+                y = 0 if is_max else -y_incr
             for node in same_lvl_nodes:
                 y += y_incr
                 nodes[node.id] = _Node(node, x, y)
-            x += 1
         return nodes
 
     def __compute_edges(self, dag) -> List[_Edge]:
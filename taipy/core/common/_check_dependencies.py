@@ -23,6 +23,8 @@ def _check_dependency_is_installed(module_name: str, package_name: str) -> None:
     extras = {
         "boto3": "s3",
         "pymongo": "mongo",
+        "zstandard": "zstd",
+        "lz4": "lz4",
     }
     if not util.find_spec(package_name):
         raise RuntimeError(
@@ -0,0 +1,143 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+
+class _ColumnarCache:
+    """Sidecar Parquet copy of the sheets of a file that is expensive to parse.
+
+    The cache is stored in a hidden folder next to the source file. It holds one Parquet file per
+    sheet and a manifest recording the modification time and size of the source file at the
+    time the cache was built. The cache is considered stale as soon as one of them changes.
+
+    Sheets that Arrow cannot represent (object columns mixing several types, for example) are
+    stored as pickled DataFrames instead.
+
+    The same folder can also hold the column types inferred when a text file was first parsed
+    so that later reads can skip type inference. They are also tied to the modification time and
+    size of the file.
+    """
+
+    __MANIFEST = "manifest.json"
+    __SCHEMA = "schema.json"
+    __PARQUET_EXTENSION = ".parquet"
+    __PICKLE_EXTENSION = ".p"
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(self, path: str, variant: str = "") -> None:
+        self._path = path
+        directory, file_name = os.path.split(os.path.abspath(path))
+        self._folder = os.path.join(directory, f".{file_name}.taipy_cache")
+        self._variant = variant
+
+    def read(self, load_all_sheets: Callable[[], Dict[Any, pd.DataFrame]]) -> Dict[Any, pd.DataFrame]:
+        """Return all the sheets, from the cache if it is up-to-date or by calling *load_all_sheets* otherwise."""
+        if (sheets := self.__load()) is not None:
+            return sheets
+        sheets = load_all_sheets()
+        self.__store(sheets)
+        return sheets
+
+    def clear(self) -> None:
+        shutil.rmtree(self._folder, ignore_errors=True)
+
+    def read_schema(self) -> Optional[Dict[Any, str]]:
+        """Return the column types previously stored with `write_schema()`, if any."""
+        schema_path = os.path.join(self._folder, self.__SCHEMA)
+        if not os.path.isfile(schema_path):
+            return None
+        try:
+            with open(schema_path, "r", encoding="utf-8") as f:
+                schema = json.load(f)
+            if schema.get("source") != self.__source_key() or schema.get("variant") != self._variant:
+                return None
+            return dict(schema["columns"])
+        except Exception as e:
+            self.__logger.warning(f"Could not load the cached schema of {self._path}: {e}")
+            return None
+
+    def write_schema(self, dtypes: Dict[Any, Any]) -> None:
+        """Store the column types of a file, merged with the ones already stored."""
+        columns = {**(self.read_schema() or {}), **{column: str(dtype) for column, dtype in dtypes.items()}}
+        if (source_key := self.__source_key()) is None:
+            return
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            with open(os.path.join(self._folder, self.__SCHEMA), "w", encoding="utf-8") as f:
+                # Columns are stored as pairs to keep non-string column names (without header) untouched.
+                json.dump({"source": source_key, "variant": self._variant, "columns": list(columns.items())}, f)
+        except Exception as e:
+            self.__logger.warning(f"Could not store the schema of {self._path}: {e}")
+
+    def __source_key(self) -> Optional[Dict[str, Any]]:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return {"path": os.path.abspath(self._path), "mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+    def __load(self) -> Optional[Dict[Any, pd.DataFrame]]:
+        manifest_path = os.path.join(self._folder, self.__MANIFEST)
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("source") != self.__source_key() or manifest.get("variant") != self._variant:
+                return None
+            sheets = {}
+            for sheet in manifest["sheets"]:
+                file_path = os.path.join(self._folder, sheet["file"])
+                if sheet["file"].endswith(self.__PICKLE_EXTENSION):
+                    sheets[sheet["name"]] = pd.read_pickle(file_path)
+                else:
+                    df = pd.read_parquet(file_path)
+                    df.columns = pd.Index(sheet["columns"])
+                    sheets[sheet["name"]] = df
+            return sheets
+        except Exception as e:
+            self.__logger.warning(f"Could not load the columnar cache of {self._path}: {e}")
+            return None
+
+    def __store(self, sheets: Dict[Any, pd.DataFrame]) -> None:
+        source_key = self.__source_key()
+        if source_key is None:
+            return
+        try:
+            self.clear()
+            os.makedirs(self._folder, exist_ok=True)
+            manifest_sheets: List[Dict[str, Any]] = []
+            for i, (name, df) in enumerate(sheets.items()):
+                columns = list(df.columns)
+                file_name = f"sheet_{i}{self.__PARQUET_EXTENSION}"
+                try:
+                    # Parquet requires string column names: the original ones are kept in the manifest.
+                    df.set_axis([str(j) for j in range(len(columns))], axis=1).to_parquet(
+                        os.path.join(self._folder, file_name), index=False
+                    )
+                except (pa.ArrowException, ValueError):
+                    file_name = f"sheet_{i}{self.__PICKLE_EXTENSION}"
+                    df.to_pickle(os.path.join(self._folder, file_name))
+                manifest_sheets.append({"name": name, "file": file_name, "columns": columns})
+            with open(os.path.join(self._folder, self.__MANIFEST), "w", encoding="utf-8") as f:
+                json.dump({"source": source_key, "variant": self._variant, "sheets": manifest_sheets}, f)
+        except Exception as e:
+            self.__logger.warning(f"Could not build the columnar cache of {self._path}: {e}")
+            self.clear()
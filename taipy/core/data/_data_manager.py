@@ -25,10 +25,12 @@ from ..notification import Event, EventEntityType, EventOperation, Notifier, _ma
 from ..reason import NotGlobalScope, ReasonCollection, WrongConfigType
 from ..scenario.scenario_id import ScenarioId
 from ..sequence.sequence_id import SequenceId
+from ._columnar_cache import _ColumnarCache
 from ._data_fs_repository import _DataFSRepository
 from ._file_datanode_mixin import _FileDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId
+from .pickle import PickleDataNode
 
 
 class _DataManager(_Manager[DataNode], _VersionMixin):
@@ -127,6 +129,9 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             return
         if data_node.is_generated and os.path.exists(data_node.path):
             os.remove(data_node.path)
+            _ColumnarCache(data_node.path).clear()
+            if isinstance(data_node, PickleDataNode) and os.path.exists(data_node._get_buffers_path(data_node.path)):
+                os.remove(data_node._get_buffers_path(data_node.path))
 
     @classmethod
     def _clean_generated_files(cls, data_nodes: Iterable[DataNode]) -> None:
@@ -20,7 +20,9 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import UnknownCSVEngine
 from ..job.job_id import JobId
+from ._columnar_cache import _ColumnarCache
 from ._file_datanode_mixin import _FileDataNodeMixin
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
@@ -39,10 +41,23 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         to write the data to the CSV file.
     - *has_header* (`bool`): If True, indicates that the CSV file has a header.
     - *exposed_type*: The exposed type of the data read from CSV file. The default value is `pandas`.
+    - *engine* (`str`): The parser engine used by pandas to read the CSV file when the exposed type is
+        `pandas` or `numpy`. Possible values are *"c"*, *"python"* or *"pyarrow"*. The default value
+        is None, which lets pandas pick its default engine.
+    - *dtype* (`Union[str, Dict[str, str]]`): The data type(s) of the columns, passed to pandas when
+        reading the CSV file.
+    - *cache_schema* (`bool`): If True, the column types inferred on the first read are stored next
+        to the CSV file and passed to pandas on the following reads to skip type inference. The
+        types are inferred again when the file changes, or if they no longer match its content.
+        The default value is False.
     """
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    __ENGINE_PROPERTY = "engine"
+    __VALID_CSV_ENGINES = ["c", "python", "pyarrow"]
+    __DTYPE_PROPERTY = "dtype"
+    __CACHE_SCHEMA_PROPERTY = "cache_schema"
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -73,6 +88,11 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         if self._HAS_HEADER_PROPERTY not in properties.keys():
             properties[self._HAS_HEADER_PROPERTY] = True
 
+        if (engine := properties.get(self.__ENGINE_PROPERTY)) and engine not in self.__VALID_CSV_ENGINES:
+            raise UnknownCSVEngine(
+                f"Invalid CSV engine: {engine}. Supported engines are {', '.join(self.__VALID_CSV_ENGINES)}"
+            )
+
         properties[self._EXPOSED_TYPE_PROPERTY] = _TabularDataNodeMixin._get_valid_exposed_type(properties)
         self._check_exposed_type(properties[self._EXPOSED_TYPE_PROPERTY])
 
@@ -109,6 +129,9 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__ENCODING_KEY,
+                self.__ENGINE_PROPERTY,
+                self.__DTYPE_PROPERTY,
+                self.__CACHE_SCHEMA_PROPERTY,
             }
         )
 
@@ -164,20 +187,47 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             properties = self.properties
             if properties[self._HAS_HEADER_PROPERTY]:
                 if column_names:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])[column_names]
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])
+                    # Only parse the projected columns, then restore the requested order
+                    return self.__read_csv(path, usecols=column_names)[column_names]
+                return self.__read_csv(path)
             else:
                 if usecols:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None, usecols=usecols)
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None)
+                    return self.__read_csv(path, header=None, usecols=usecols)
+                return self.__read_csv(path, header=None)
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
+    def __read_csv(self, path: str, **kwargs) -> pd.DataFrame:
+        properties = self.properties
+        kwargs["encoding"] = properties[self.__ENCODING_KEY]
+        if engine := properties.get(self.__ENGINE_PROPERTY):
+            kwargs["engine"] = engine
+        dtype = properties.get(self.__DTYPE_PROPERTY)
+        if dtype is not None:
+            kwargs["dtype"] = dtype
+
+        if not properties.get(self.__CACHE_SCHEMA_PROPERTY) or path != self._path:
+            return pd.read_csv(path, **kwargs)
+
+        cache = _ColumnarCache(path, variant=f"header={kwargs.get('header', 0)}")
+        if (schema := cache.read_schema()) and (dtype is None or isinstance(dtype, dict)):
+            if usecols := kwargs.get("usecols"):
+                schema = {column: column_type for column, column_type in schema.items() if column in usecols}
+            try:
+                return pd.read_csv(path, **{**kwargs, "dtype": {**schema, **(dtype or {})}})
+            except (ValueError, TypeError):
+                # The content of the file no longer matches the cached schema
+                pass
+        df = pd.read_csv(path, **kwargs)
+        cache.write_schema(df.dtypes.to_dict())
+        return df
+
     def _append(self, data: Any):
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
         data = self._convert_data_to_dataframe(exposed_type, data)
         data.to_csv(self._path, mode="a", index=False, encoding=properties[self.__ENCODING_KEY], header=False)
+        self.__clear_schema()
 
     def _write(self, data: Any, columns: Optional[List[str]] = None):
         properties = self.properties
@@ -193,3 +243,8 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             encoding=properties[self.__ENCODING_KEY],
             header=properties[self._HAS_HEADER_PROPERTY],
         )
+        self.__clear_schema()
+
+    def __clear_schema(self) -> None:
+        if self.properties.get(self.__CACHE_SCHEMA_PROPERTY):
+            _ColumnarCache(self._path).clear()
@@ -22,6 +22,7 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import ExposedTypeLengthMismatch, NonExistingExcelSheet, SheetNameLengthMismatch
 from ..job.job_id import JobId
+from ._columnar_cache import _ColumnarCache
 from ._file_datanode_mixin import _FileDataNodeMixin
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
@@ -43,10 +44,14 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     - *has_header* (`bool`): If True, indicates that the Excel file has a header.
     - *exposed_type* (`str`): The exposed type of the data read from Excel file. The default value
         is `pandas`.
+    - *columnar_cache* (`bool`): If True, the sheets read as pandas DataFrames or numpy arrays are
+        converted to Parquet files stored next to the Excel file on the first read, and later reads
+        load this columnar copy as long as the Excel file is not modified. The default value is False.
     """
 
     __STORAGE_TYPE = "excel"
     __SHEET_NAME_PROPERTY = "sheet_name"
+    __COLUMNAR_CACHE_PROPERTY = "columnar_cache"
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -111,6 +116,7 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__SHEET_NAME_PROPERTY,
+                self.__COLUMNAR_CACHE_PROPERTY,
             }
         )
 
@@ -236,8 +242,37 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _do_read_excel(
         self, path: str, sheet_names, kwargs
     ) -> Union[Dict[Union[int, str], pd.DataFrame], pd.DataFrame]:
+        if self.properties.get(self.__COLUMNAR_CACHE_PROPERTY) and path == self._path:
+            if (data := self.__read_from_columnar_cache(path, sheet_names, kwargs)) is not None:
+                return data
         return pd.read_excel(path, sheet_name=sheet_names, **kwargs)
 
+    def __read_from_columnar_cache(
+        self, path: str, sheet_names, kwargs
+    ) -> Optional[Union[Dict[Union[int, str], pd.DataFrame], pd.DataFrame]]:
+        cache = _ColumnarCache(path, variant=f"header={kwargs.get('header', 0)}")
+        sheets = cache.read(lambda: pd.read_excel(path, sheet_name=None, **kwargs))
+        if sheet_names is None:
+            return sheets
+
+        all_names = list(sheets.keys())
+
+        def resolve(name):
+            if name in sheets:
+                return name
+            if isinstance(name, int) and -len(all_names) <= name < len(all_names):
+                return all_names[name]
+            return None
+
+        requested = sheet_names if isinstance(sheet_names, (list, tuple, set)) else [sheet_names]
+        resolved = {name: resolve(name) for name in requested}
+        if any(name is None for name in resolved.values()):
+            # Let pandas raise the usual error for missing sheets
+            return None
+        if isinstance(sheet_names, (list, tuple, set)):
+            return {name: sheets[sheet] for name, sheet in resolved.items()}
+        return sheets[resolved[sheet_names]]
+
     def __get_sheet_names_and_header(self, sheet_names):
         kwargs = {}
         properties = self.properties
@@ -12,7 +12,9 @@
 from datetime import datetime, timedelta
 from importlib import util
 from inspect import isclass
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import pandas as pd
 
 from taipy.common.config.common.scope import Scope
 
@@ -47,6 +49,19 @@ class MongoCollectionDataNode(DataNode):
     - *db_driver* (`str`): The database driver.
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into
         database connection string.
+    - *exposed_type* (`str`): If set to *"pandas"*, the documents read are returned in a pandas
+        DataFrame instead of being decoded one by one into custom document objects. The default
+        value is None.
+    - *projection* (`Union[List[str], Dict[str, Any]]`): The fields to retrieve when reading from
+        the collection. The default value is None (all the fields).
+    - *batch_size* (`int`): The number of documents retrieved per batch by the read cursors, and
+        the number of documents sent per insert or upsert request when writing. The default value
+        is None (the pymongo defaults).
+    - *ordered_insert* (`bool`): If False, the documents are inserted with unordered bulk writes,
+        letting the server process them in parallel. The default value is True.
+    - *upsert_key* (`str`): If set, writing data replaces the documents that have the same value
+        for this field and inserts the others, instead of dropping and re-creating the whole
+        collection. The default value is None.
     """
 
     __STORAGE_TYPE = "mongo_collection"
@@ -59,6 +74,13 @@ class MongoCollectionDataNode(DataNode):
     __DB_PORT_KEY = "db_port"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
     __DB_DRIVER_KEY = "db_driver"
+    __EXPOSED_TYPE_KEY = "exposed_type"
+    __PROJECTION_KEY = "projection"
+    __BATCH_SIZE_KEY = "batch_size"
+    __ORDERED_INSERT_KEY = "ordered_insert"
+    __UPSERT_KEY = "upsert_key"
+
+    __EXPOSED_TYPE_PANDAS = "pandas"
 
     __DB_HOST_DEFAULT = "localhost"
     __DB_PORT_DEFAULT = 27017
@@ -150,6 +172,11 @@ class MongoCollectionDataNode(DataNode):
                 self.__DB_PORT_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self.__EXPOSED_TYPE_KEY,
+                self.__PROJECTION_KEY,
+                self.__BATCH_SIZE_KEY,
+                self.__ORDERED_INSERT_KEY,
+                self.__UPSERT_KEY,
             }
         )
 
@@ -160,16 +187,28 @@ class MongoCollectionDataNode(DataNode):
 
     def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND) -> List:
         cursor = self._read_by_query(operators, join_operator)
-        return [self._decoder(row) for row in cursor]
+        return self.__decode_cursor(cursor)
 
     def _read(self):
         cursor = self._read_by_query()
+        return self.__decode_cursor(cursor)
+
+    def __decode_cursor(self, cursor) -> Union[List, pd.DataFrame]:
+        if self.properties.get(self.__EXPOSED_TYPE_KEY) == self.__EXPOSED_TYPE_PANDAS:
+            return pd.DataFrame(list(cursor))
         return [self._decoder(row) for row in cursor]
 
+    def __find(self, query: Optional[Dict] = None):
+        properties = self.properties
+        cursor = self.collection.find(query, properties.get(self.__PROJECTION_KEY))
+        if batch_size := properties.get(self.__BATCH_SIZE_KEY):
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
     def _read_by_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
         """Query from a Mongo collection, exclude the _id field"""
         if not operators:
-            return self.collection.find()
+            return self.__find()
 
         if not isinstance(operators, List):
             operators = [operators]
@@ -197,20 +236,16 @@ class MongoCollectionDataNode(DataNode):
         else:
             raise NotImplementedError(f"Join operator {join_operator} is not supported.")
 
-        return self.collection.find(query)
+        return self.__find(query)
 
     def _append(self, data) -> None:
         """Append data to a Mongo collection."""
-        if not isinstance(data, list):
-            data = [data]
+        data = self.__to_documents(data)
 
         if len(data) == 0:
             return
 
-        if isinstance(data[0], dict):
-            self._insert_dicts(data)
-        else:
-            self._insert_dicts([self._encoder(row) for row in data])
+        self._insert_dicts(data)
 
     def _write(self, data) -> None:
         """Check data against a collection of types to handle insertion on the database.
@@ -218,17 +253,39 @@ class MongoCollectionDataNode(DataNode):
         Arguments:
             data (Any): the data to write to the database.
         """
-        if not isinstance(data, list):
-            data = [data]
+        data = self.__to_documents(data)
+
+        if upsert_key := self.properties.get(self.__UPSERT_KEY):
+            # Upserts never remove documents: there is nothing to do without data
+            if len(data) > 0:
+                self._upsert_dicts(data, upsert_key)
+            return
 
         if len(data) == 0:
             self.collection.drop()
             return
 
-        if isinstance(data[0], dict):
-            self._insert_dicts(data, drop=True)
-        else:
-            self._insert_dicts([self._encoder(row) for row in data], drop=True)
+        self._insert_dicts(data, drop=True)
+
+    def __to_documents(self, data) -> List[Dict]:
+        if isinstance(data, pd.DataFrame):
+            return data.to_dict(orient="records")
+
+        if not isinstance(data, list):
+            data = [data]
+
+        if len(data) == 0 or isinstance(data[0], dict):
+            return data
+        return [self._encoder(row) for row in data]
+
+    def __batches(self, data: List[Dict]) -> Iterator[List[Dict]]:
+        if len(data) == 0:
+            return
+        batch_size = self.properties.get(self.__BATCH_SIZE_KEY) or 0
+        if batch_size <= 0:
+            batch_size = len(data)
+        for i in range(0, len(data), batch_size):
+            yield data[i : i + batch_size]
 
     def _insert_dicts(self, data: List[Dict], drop=False) -> None:
         """
@@ -241,7 +298,26 @@ class MongoCollectionDataNode(DataNode):
         if drop:
             self.collection.drop()
 
-        self.collection.insert_many(data)
+        ordered = self.properties.get(self.__ORDERED_INSERT_KEY, True)
+        for batch in self.__batches(data):
+            self.collection.insert_many(batch, ordered=ordered)
+
+    def _upsert_dicts(self, data: List[Dict], key: str) -> None:
+        """
+        This method will replace the documents of the collection that have the same *key* value as the
+        dictionaries in *data*, and insert the other dictionaries.
+
+        Arguments:
+            data (List[Dict]): a list of dictionaries
+            key (str): the field identifying a document.
+        """
+        from pymongo import ReplaceOne
+
+        ordered = self.properties.get(self.__ORDERED_INSERT_KEY, True)
+        for batch in self.__batches(data):
+            self.collection.bulk_write(
+                [ReplaceOne({key: document[key]}, document, upsert=True) for document in batch], ordered=ordered
+            )
 
     def _check_custom_document(self, custom_document):
         if not isclass(custom_document):
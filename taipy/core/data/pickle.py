@@ -9,14 +9,24 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import bz2
+import gzip
+import lzma
+import mmap
+import os
 import pickle
+import struct
+import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Set
+from typing import IO, Any, Callable, ContextManager, Dict, List, Optional, Set, Tuple
 
 from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..common._check_dependencies import _check_dependency_is_installed
+from ..exceptions.exceptions import UnknownCompressionAlgorithm
 from ._file_datanode_mixin import _FileDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -31,9 +41,44 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         data node.
     - *default_data*: The default data of the data node. It is used at the data node instantiation
         to write the data to the Pickle file.
+    - *compression* (`Optional[str]`): Name of the compression applied to the pickle stream. Possible
+        values are *"gzip"*, *"bz2"*, *"lzma"*, *"zstd"* (requires the *zstandard* package) or *"lz4"*
+        (requires the *lz4* package). The default value is None (no compression). Reading detects the
+        compression of the file, whatever the value of this property.
+    - *out_of_band_buffers* (`bool`): If True, the data is pickled with protocol 5 and the large
+        buffers it holds (numpy arrays, pandas columns, ...) are written uncompressed to a side file
+        (the Pickle file path with a *".buffers"* suffix). On POSIX systems, this side file is
+        memory-mapped when the data is read back, so these buffers are neither copied nor
+        decompressed. On Windows, where a mapped file cannot be replaced, the buffers are read in
+        memory. The default value is False.
     """
 
     __STORAGE_TYPE = "pickle"
+    __COMPRESSION_PROPERTY = "compression"
+    __OUT_OF_BAND_BUFFERS_PROPERTY = "out_of_band_buffers"
+    __BUFFERS_FILE_SUFFIX = ".buffers"
+    __BUFFER_ALIGNMENT = 64
+    # Data written with out-of-band buffers starts with this header and a token that is also written
+    # in its buffers file, so that a reader can check that both files were written together.
+    __OUT_OF_BAND_HEADER = b"TAIPYOOB"
+    __TOKEN_SIZE = 16
+    __NO_BUFFERS_TOKEN = bytes(__TOKEN_SIZE)
+    __READ_ATTEMPTS = 10
+    __MAP_BUFFERS = os.name != "nt"
+    __COMPRESSION_OPENERS: Dict[str, Callable[..., IO[bytes]]] = {
+        "gzip": gzip.open,
+        "bz2": bz2.open,
+        "lzma": lzma.open,
+    }
+    __OPTIONAL_COMPRESSION_PACKAGES = {"zstd": "zstandard", "lz4": "lz4"}
+    __VALID_COMPRESSION_ALGORITHMS = [*__COMPRESSION_OPENERS.keys(), *__OPTIONAL_COMPRESSION_PACKAGES.keys()]
+    __COMPRESSION_MAGIC_NUMBERS = {
+        b"\x1f\x8b": "gzip",
+        b"BZh": "bz2",
+        b"\xfd7zXZ\x00": "lzma",
+        b"\x28\xb5\x2f\xfd": "zstd",
+        b"\x04\x22\x4d\x18": "lz4",
+    }
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -58,6 +103,15 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         if properties is None:
             properties = {}
 
+        if compression := properties.get(self.__COMPRESSION_PROPERTY):
+            if compression not in self.__VALID_COMPRESSION_ALGORITHMS:
+                raise UnknownCompressionAlgorithm(
+                    f"Unsupported compression algorithm: {compression}. "
+                    f"Supported algorithms are {', '.join(self.__VALID_COMPRESSION_ALGORITHMS)}"
+                )
+            if package := self.__OPTIONAL_COMPRESSION_PACKAGES.get(compression):
+                _check_dependency_is_installed("Pickle Data Node", package)
+
         default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
         _FileDataNodeMixin.__init__(self, properties)
 
@@ -87,6 +141,8 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
                 self._DEFAULT_PATH_KEY,
                 self._DEFAULT_DATA_KEY,
                 self._IS_GENERATED_KEY,
+                self.__COMPRESSION_PROPERTY,
+                self.__OUT_OF_BAND_BUFFERS_PROPERTY,
             }
         )
 
@@ -102,9 +158,126 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         if path is None:
             path = self._path
 
-        with open(path, "rb") as pf:
-            return pickle.load(pf)
+        for attempt in range(self.__READ_ATTEMPTS):
+            with open(path, "rb") as f:
+                token = self.__read_token(f)
+                buffers = None
+                if token is not None and token != self.__NO_BUFFERS_TOKEN:
+                    if (buffers := self.__load_buffers(path, token)) is None:
+                        # The data was written again while it was read: its buffers do not match.
+                        time.sleep(0.01 * (attempt + 1))
+                        continue
+                with self.__open(f, "rb", self.__detect_compression(f)) as pf:
+                    return pickle.load(pf, buffers=buffers)
+        raise pickle.UnpicklingError(f"The out-of-band buffers of {path} do not match its data.")
 
     def _write(self, data):
-        with open(self._path, "wb") as pf:
-            pickle.dump(data, pf)
+        start = time.perf_counter()
+        properties = self.properties
+        buffers_path = self._get_buffers_path(self._path)
+        buffers: List[pickle.PickleBuffer] = []
+        # Both files are written aside, then the buffers and the data replace the previous ones.
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "wb") as f:
+            token = None
+            if properties.get(self.__OUT_OF_BAND_BUFFERS_PROPERTY):
+                token = os.urandom(self.__TOKEN_SIZE)
+                f.write(self.__OUT_OF_BAND_HEADER + token)
+            with self.__open(f, "wb", properties.get(self.__COMPRESSION_PROPERTY)) as pf:
+                if token is not None:
+                    pickle.dump(data, pf, protocol=5, buffer_callback=buffers.append)
+                else:
+                    pickle.dump(data, pf)
+            if token is not None and not buffers:
+                # Data without large buffers does not need a buffers file.
+                f.seek(len(self.__OUT_OF_BAND_HEADER))
+                f.write(self.__NO_BUFFERS_TOKEN)
+        if token is not None and buffers:
+            self.__write_buffers(buffers_path, buffers, token)
+        os.replace(tmp_path, self._path)
+        if not buffers and os.path.exists(buffers_path):
+            os.remove(buffers_path)
+
+        buffers_size = os.path.getsize(buffers_path) if buffers else 0
+        self._logger.debug(
+            f"Data node {self.id} written to {self._path} in {time.perf_counter() - start:.3f}s: "
+            f"{os.path.getsize(self._path)} bytes, plus {buffers_size} bytes in {len(buffers)} out-of-band buffers."
+        )
+
+    @classmethod
+    def _get_buffers_path(cls, path: str) -> str:
+        return f"{path}{cls.__BUFFERS_FILE_SUFFIX}"
+
+    @classmethod
+    def __open(cls, file: IO[bytes], mode: str, compression: Optional[str]) -> ContextManager[IO[bytes]]:
+        # The file itself is closed by the caller.
+        if not compression:
+            return nullcontext(file)
+        if opener := cls.__COMPRESSION_OPENERS.get(compression):
+            return opener(file, mode)
+        if compression == "zstd":
+            import zstandard
+
+            return zstandard.open(file, mode, closefd=False)
+        import lz4.frame
+
+        return lz4.frame.open(file, mode)
+
+    @classmethod
+    def __detect_compression(cls, file: IO[bytes]) -> Optional[str]:
+        position = file.tell()
+        header = file.read(8)
+        file.seek(position)
+        return next(
+            (algorithm for magic, algorithm in cls.__COMPRESSION_MAGIC_NUMBERS.items() if header.startswith(magic)),
+            None,
+        )
+
+    @classmethod
+    def __read_token(cls, file: IO[bytes]) -> Optional[bytes]:
+        header_size = len(cls.__OUT_OF_BAND_HEADER)
+        header = file.read(header_size + cls.__TOKEN_SIZE)
+        if header.startswith(cls.__OUT_OF_BAND_HEADER) and len(header) == header_size + cls.__TOKEN_SIZE:
+            return header[header_size:]
+        file.seek(0)
+        return None
+
+    @classmethod
+    def __write_buffers(cls, buffers_path: str, buffers: List[pickle.PickleBuffer], token: bytes) -> None:
+        # Layout: the aligned raw buffers, then the pickled list of (offset, length) pairs, then the token
+        # of the data, then the offset of this list on 8 bytes.
+        # The file is replaced rather than rewritten: the data previously read may still be mapped from it.
+        locations: List[Tuple[int, int]] = []
+        tmp_path = f"{buffers_path}.tmp"
+        with open(tmp_path, "wb") as bf:
+            for buffer in buffers:
+                raw = buffer.raw()
+                bf.write(b"\0" * (-bf.tell() % cls.__BUFFER_ALIGNMENT))
+                locations.append((bf.tell(), raw.nbytes))
+                bf.write(raw)
+            table_offset = bf.tell()
+            pickle.dump(locations, bf)
+            bf.write(token)
+            bf.write(struct.pack("<Q", table_offset))
+        os.replace(tmp_path, buffers_path)
+
+    @classmethod
+    def __load_buffers(cls, path: str, token: bytes) -> Optional[List[memoryview]]:
+        """Return the buffers of the data that has this token, None if its buffers file was replaced."""
+        buffers_path = cls._get_buffers_path(path)
+        try:
+            with open(buffers_path, "rb") as bf:
+                if cls.__MAP_BUFFERS:
+                    # Copy-on-write mapping: the data read is writable without modifying the file.
+                    content = memoryview(mmap.mmap(bf.fileno(), 0, access=mmap.ACCESS_COPY))
+                else:
+                    content = memoryview(bytearray(bf.read()))
+        except FileNotFoundError:
+            return None
+        footer_offset = len(content) - cls.__TOKEN_SIZE - 8
+        if footer_offset < 0 or content[footer_offset:-8] != token:
+            return None
+        (table_offset,) = struct.unpack("<Q", content[-8:])
+        locations = pickle.loads(content[table_offset:footer_offset])
+        return [content[offset : offset + length] for offset, length in locations]
+
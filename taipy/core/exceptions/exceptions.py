@@ -68,6 +68,10 @@ class MissingAppendQueryBuilder(Exception):
     """Raised if no append query build is provided when appending data to a SQLDataNode."""
 
 
+class UnknownCSVEngine(Exception):
+    """Raised if the CSV engine is not known or not supported when create a CSVDataNode."""
+
+
 class UnknownParquetEngine(Exception):
     """Raised if the parquet engine is not known or not supported when create a ParquetDataNode."""
 
@@ -9,9 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from taipy.common.config import Config
 
@@ -59,6 +60,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
     _AUTHORIZED_TAGS_KEY = "authorized_tags"
     _ENTITY_NAME = Scenario.__name__
     _EVENT_ENTITY_TYPE = EventEntityType.SCENARIO
+    _COMPARE_MAX_WORKERS: Optional[int] = None
 
     _repository: _AbstractRepository
 
@@ -395,6 +397,24 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
 
     @classmethod
     def _compare(cls, *scenarios: Scenario, data_node_config_id: Optional[str] = None) -> Dict:
+        dn_comparators = cls.__get_comparators(*scenarios, data_node_config_id=data_node_config_id)
+        results: Dict[str, Dict[str, Any]] = {dn_config_id: {} for dn_config_id in dn_comparators.keys()}
+        for dn_config_id, comparator_name, result in cls.__run_comparators(scenarios, dn_comparators):
+            results[dn_config_id][comparator_name] = result
+        return results
+
+    @classmethod
+    def _compare_iter(
+        cls, *scenarios: Scenario, data_node_config_id: Optional[str] = None
+    ) -> Iterator[Tuple[str, str, Any]]:
+        """Yield (data node config id, comparator name, result) tuples as soon as each comparison completes."""
+        dn_comparators = cls.__get_comparators(*scenarios, data_node_config_id=data_node_config_id)
+        yield from cls.__run_comparators(scenarios, dn_comparators)
+
+    @classmethod
+    def __get_comparators(
+        cls, *scenarios: Scenario, data_node_config_id: Optional[str] = None
+    ) -> Dict[str, List[Callable]]:
         if len(scenarios) < 2:
             raise InsufficientScenarioToCompare("At least two scenarios are required to compare.")
 
@@ -402,25 +422,41 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             raise DifferentScenarioConfigs("Scenarios to compare must have the same configuration.")
 
         if scenario_config := cls.__get_config(scenarios[0]):
-            results = {}
             if data_node_config_id:
                 if data_node_config_id in scenario_config.comparators.keys():
-                    dn_comparators = {data_node_config_id: scenario_config.comparators[data_node_config_id]}
-                else:
-                    raise NonExistingComparator(f"Data node config {data_node_config_id} has no comparator.")
-            else:
-                dn_comparators = scenario_config.comparators
-
-            for data_node_config_id, comparators in dn_comparators.items():
-                data_nodes = [scenario.__getattr__(data_node_config_id).read() for scenario in scenarios]
-                results[data_node_config_id] = {
-                    comparator.__name__: comparator(*data_nodes) for comparator in comparators
-                }
+                    return {data_node_config_id: scenario_config.comparators[data_node_config_id]}
+                raise NonExistingComparator(f"Data node config {data_node_config_id} has no comparator.")
+            return scenario_config.comparators
 
-            return results
+        raise NonExistingScenarioConfig(scenarios[0].config_id)
 
-        else:
-            raise NonExistingScenarioConfig(scenarios[0].config_id)
+    @classmethod
+    def __run_comparators(
+        cls, scenarios: Tuple[Scenario, ...], dn_comparators: Dict[str, List[Callable]]
+    ) -> Iterator[Tuple[str, str, Any]]:
+        with ThreadPoolExecutor(max_workers=cls._COMPARE_MAX_WORKERS) as executor:
+            # Each data node version is read only once, even if it is shared between scenarios
+            # or compared through several data node configs.
+            reads: Dict[Tuple[str, Optional[datetime]], Future] = {}
+            dn_reads: Dict[str, List[Future]] = {}
+            for dn_config_id in dn_comparators.keys():
+                dn_reads[dn_config_id] = []
+                for scenario in scenarios:
+                    data_node = scenario.__getattr__(dn_config_id)
+                    key = (data_node.id, data_node.last_edit_date)
+                    if key not in reads:
+                        reads[key] = executor.submit(data_node.read)
+                    dn_reads[dn_config_id].append(reads[key])
+
+            comparisons: Dict[Future, Tuple[str, str]] = {}
+            for dn_config_id, comparators in dn_comparators.items():
+                data = [read.result() for read in dn_reads[dn_config_id]]
+                for comparator in comparators:
+                    comparisons[executor.submit(comparator, *data)] = (dn_config_id, comparator.__name__)
+
+            for comparison in as_completed(comparisons):
+                dn_config_id, comparator_name = comparisons[comparison]
+                yield dn_config_id, comparator_name, comparison.result()
 
     @staticmethod
     def __get_config(scenario: Scenario):
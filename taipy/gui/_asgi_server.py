@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from importlib import util
+
+import socketio
+from flask import Flask, request
+
+from ._warnings import _warn
+
+
+class _AsgiSocketIO(object):
+    """Socket.IO server running on an asyncio event loop, served by an ASGI server (uvicorn).
+
+    It provides the part of the Flask-SocketIO API that Taipy GUI uses.
+    The websocket I/O is handled by the event loop. The event handlers run in a thread pool, in a
+    Flask request context, so that slow callbacks block neither the loop nor the other clients.
+    The Flask application is served by the same ASGI application.
+    """
+
+    async_mode = "asgi"
+
+    def __init__(self, flask: Flask, max_workers: t.Optional[int] = None, **socketio_config) -> None:
+        socketio_config.pop("async_mode", None)
+        self.__flask = flask
+        self.server = socketio.AsyncServer(async_mode="asgi", **socketio_config)
+        self.__executor = ThreadPoolExecutor(max_workers, thread_name_prefix="taipy-gui")
+        self.__loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self.__uvicorn_server: t.Optional[t.Any] = None
+
+    def on(self, event: str) -> t.Callable[[t.Callable], t.Callable]:
+        """Register the handler of a Socket.IO event."""
+
+        def decorator(handler: t.Callable) -> t.Callable:
+            async def on_event(sid: str, *args):
+                self.__loop = asyncio.get_running_loop()
+                # the connect event comes with the environ and auth data, the Taipy handlers do not use them
+                args = args if event not in ("connect", "disconnect") else ()
+                return await self.__loop.run_in_executor(self.__executor, self.__handle_event, handler, sid, args)
+
+            self.server.on(event, on_event)
+            return handler
+
+        return decorator
+
+    def __handle_event(self, handler: t.Callable, sid: str, args: t.Tuple[t.Any, ...]) -> t.Any:
+        with self.__flask.request_context(self.server.get_environ(sid) or {}):
+            request.sid = sid  # type: ignore[attr-defined]
+            request.namespace = "/"  # type: ignore[attr-defined]
+            return handler(*args)
+
+    def emit(self, event: str, data: t.Any, to: t.Optional[t.Any] = None, **kwargs) -> None:
+        """Send a message from any thread.
+
+        The message is sent by the event loop. There is no client to send it to if the loop did not
+        handle any event yet.
+        """
+        if self.__loop is None or self.__loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.__emit(event, data, to), self.__loop)
+
+    async def __emit(self, event: str, data: t.Any, to: t.Optional[t.Any]) -> None:
+        # messages are encoded with the JSON provider of the Flask application
+        with self.__flask.app_context():
+            await self.server.emit(event, data, to=to)
+
+    def sleep(self, seconds: float = 0) -> None:
+        if seconds:
+            time.sleep(seconds)
+
+    def start_background_task(self, target: t.Callable, *args, **kwargs) -> threading.Thread:
+        thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        return thread
+
+    def get_asgi_app(self) -> t.Any:
+        """Return the ASGI application serving both the Socket.IO server and the Flask application."""
+        if not util.find_spec("asgiref"):
+            raise RuntimeError("The 'asgi' async mode requires the 'asgiref' package (pip install taipy[asgi]).")
+        from asgiref.wsgi import WsgiToAsgi  # type: ignore[reportMissingImports]
+
+        return socketio.ASGIApp(self.server, other_asgi_app=WsgiToAsgi(self.__flask))
+
+    def run(
+        self,
+        app: Flask,
+        host: str,
+        port: int,
+        debug: bool = False,
+        use_reloader: bool = False,
+        ssl_context: t.Optional[t.Any] = None,
+        **kwargs,
+    ) -> None:
+        if not util.find_spec("uvicorn"):
+            raise RuntimeError("The 'asgi' async mode requires the 'uvicorn' package (pip install taipy[asgi]).")
+        import uvicorn  # type: ignore[reportMissingImports]
+
+        if use_reloader:
+            _warn("The 'use_reloader' setting is ignored in the 'asgi' async mode.")
+        ssl_config: t.Dict[str, t.Any] = {}
+        if isinstance(ssl_context, tuple):
+            ssl_config = {"ssl_certfile": ssl_context[0], "ssl_keyfile": ssl_context[1]}
+        elif ssl_context is not None:
+            _warn("The 'asgi' async mode only supports a (certificate file, key file) tuple as 'ssl_context'.")
+        config = uvicorn.Config(
+            self.get_asgi_app(), host=host, port=port, log_level="debug" if debug else "warning", **ssl_config
+        )
+        self.__uvicorn_server = uvicorn.Server(config)
+        try:
+            self.__uvicorn_server.run()
+        finally:
+            self.__uvicorn_server = None
+            self.__executor.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """Request the server to exit. *run()* returns once the connections are closed."""
+        if self.__uvicorn_server is not None:
+            self.__uvicorn_server.should_exit = True
@@ -49,16 +49,21 @@ default_config: Config = {
     "client_url": "http://localhost:{port}",
     "dark_mode": True,
     "dark_theme": None,
+    "data_delta_updates": False,
+    "data_node_cache_size": 256 * 1024 * 1024,
     "debug": False,
     "extended_status": False,
     "favicon": None,
     "flask_log": False,
     "host": "127.0.0.1",
     "light_theme": None,
+    "long_callback_processes": False,
+    "long_callback_workers": 0,
     "margin": "1em",
     "ngrok_token": "",
     "notebook_proxy": True,
     "notification_duration": 3000,
+    "page_render_cache": False,
     "port": 5000,
     "port_auto_ranges": [(49152, 65535)],
     "propagate": True,
@@ -67,7 +72,9 @@ default_config: Config = {
     "run_server": True,
     "server_config": None,
     "single_client": False,
+    "state_memory_budget": 0,
     "state_retention_period": 0,
+    "state_spill_folder": None,
     "system_notification": False,
     "theme": None,
     "time_zone": None,
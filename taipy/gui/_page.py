@@ -14,9 +14,14 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 import typing as t
 import warnings
 
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from .utils._render_cache import _RenderCache, _RenderedPage
+
 if t.TYPE_CHECKING:
     from ._renderers import Page
     from .gui import Gui
@@ -32,38 +37,65 @@ class _Page(object):
         self._style: t.Optional[t.Union[str, t.Dict[str, t.Any]]] = None
         self._route: t.Optional[str] = None
         self._head: t.Optional[list] = None
+        self.__render_cache = _RenderCache()
 
     def render(self, gui: Gui, silent: t.Optional[bool] = False):
         if self._renderer is None:
             raise RuntimeError(f"Can't render page {self._route}: no renderer found")
+        start = time.perf_counter()
+        module_name = self._renderer._get_module_name()
+        cache_key = self.__get_render_cache_key(gui, module_name)
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
-            with gui._set_locals_context(self._renderer._get_module_name()):
-                self._rendered_jsx = self._renderer.render(gui)
-            if not silent:
-                if (
-                    self._rendered_jsx
-                    and isinstance(self._rendered_jsx, str)
-                    and (
-                        result := _DETECT_CLOSING_TAGS.sub(
-                            _SUBSTR_CLOSING_TAG,
-                            self._rendered_jsx.replace(">style</TaipyStyle>", "/>"),
-                        )
-                    )
-                ):
-                    self._rendered_jsx = result
-                if w:
-                    s = "\033[1;31m\n"
-                    s += (
-                        message
-                        := f"--- {len(w)} warning(s) were found for page '{'/' if self._route == gui._get_root_page_name() else self._route}' {self._renderer._get_content_detail(gui)} ---\n"  # noqa: E501
-                    )
-                    for i, wm in enumerate(w):
-                        s += f" - Warning {i + 1}: {wm.message}\n"
-                    s += "-" * len(message)
-                    s += "\033[0m\n"
-                    logging.warning(s)
-        if hasattr(self._renderer, "head"):
-            self._head = list(self._renderer.head)  # type: ignore
+            with gui._set_locals_context(module_name):
+                rendered = None if cache_key is None else self.__render_cache.get(gui, cache_key)
+                if rendered is None:
+                    with gui._record_bindings() as bindings:
+                        jsx = self._renderer.render(gui)
+        is_cached = rendered is not None
+        if rendered is None:
+            if (
+                jsx
+                and isinstance(jsx, str)
+                and (result := _DETECT_CLOSING_TAGS.sub(_SUBSTR_CLOSING_TAG, jsx.replace(">style</TaipyStyle>", "/>")))
+            ):
+                jsx = result
+            head = list(self._renderer.head) if hasattr(self._renderer, "head") else None  # type: ignore
+            messages = [str(wm.message) for wm in w]
+            if cache_key is None:
+                rendered = _RenderedPage(jsx, head, messages)
+            else:
+                rendered = self.__render_cache.put(gui, cache_key, bindings, jsx, head, messages)
+        self._rendered_jsx = rendered.jsx
+        if rendered.head is not None:
+            self._head = list(rendered.head)
+        if not silent and rendered.warnings and not rendered.warned:
+            rendered.warned = True
+            s = "\033[1;31m\n"
+            s += (
+                message
+                := f"--- {len(rendered.warnings)} warning(s) were found for page '{'/' if self._route == gui._get_root_page_name() else self._route}' {self._renderer._get_content_detail(gui)} ---\n"  # noqa: E501
+            )
+            for i, wm in enumerate(rendered.warnings):
+                s += f" - Warning {i + 1}: {wm}\n"
+            s += "-" * len(message)
+            s += "\033[0m\n"
+            logging.warning(s)
+        _TaipyLogger._get_logger().debug(
+            f"Page '{self._route}' rendered in {(time.perf_counter() - start) * 1000:.2f} ms"
+            + (" (cached)" if is_cached else "")
+        )
         # return renderer module_name from frame
-        return self._renderer._get_module_name()
+        return module_name
+
+    def __get_render_cache_key(
+        self, gui: Gui, module_name: t.Optional[str]
+    ) -> t.Optional[t.Tuple[str, t.Optional[str]]]:
+        from ._renderers import Html, Markdown
+
+        if not isinstance(self._renderer, (Markdown, Html)) or not gui._get_config("page_render_cache", False):
+            return None
+        return (self._renderer._content, module_name)
+
+    def _clear_render_cache(self) -> None:
+        self.__render_cache.clear()
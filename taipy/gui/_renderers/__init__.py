@@ -107,6 +107,7 @@ class _Renderer(Page, ABC):
             raise RuntimeError("'set_content()' must be used in an IPython notebook context")
         self.__process_content(content)
         if self._notebook_gui is not None and self._notebook_page is not None:
+            self._notebook_page._clear_render_cache()
             if self._notebook_gui._config.root_page is self._notebook_page:
                 self._notebook_gui._navigate("/", {"tp_reload_all": "true"})
                 return
@@ -10,21 +10,38 @@
 # specific language governing permissions and limitations under the License.
 from __future__ import annotations
 
+import json
+import re
 import typing as t
 from abc import ABC, abstractmethod
 from datetime import date, datetime, time, timedelta
+from importlib import util
 from json import JSONEncoder
 from pathlib import Path
+from uuid import uuid4
 
 import numpy
 import pandas
+from flask import current_app
+from flask import json as flask_json
 from flask.json.provider import DefaultJSONProvider
+from flask.json.provider import _default as _flask_default
 
 from .._warnings import _warn
 from ..icon import Icon
 from ..utils import _date_to_string, _DoNotUpdate, _MapDict, _TaipyBase
 from ..utils.singleton import _Singleton
 
+if util.find_spec("orjson"):
+    import orjson
+
+    _has_orjson = True
+    # Values that the standard encoder does not handle are resolved by the Taipy adapters, as with the
+    # standard encoder
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+else:
+    _has_orjson = False
+
 
 class JsonAdapter(ABC):
     """NOT DOCUMENTED"""
@@ -83,3 +100,55 @@ class _TaipyJsonEncoder(JSONEncoder):
 class _TaipyJsonProvider(DefaultJSONProvider):
     default = staticmethod(_TaipyJsonAdapter().parse)  # type: ignore
     sort_keys = False
+
+
+class _JsonFragment(object):
+    """JSON text that is inserted as is in the websocket messages."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: str) -> None:
+        self.json = json
+
+
+def _to_json(value: t.Any) -> str:
+    """Serialize *value* with the Taipy adapters, using orjson if it is installed."""
+    if _has_orjson:
+        try:
+            return orjson.dumps(value, default=_TaipyJsonAdapter().parse, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # values that orjson cannot handle (big integers, circular references...)
+            pass
+    return json.dumps(value, cls=_TaipyJsonEncoder)
+
+
+class _TaipyWsJson(object):
+    """JSON module used to encode the websocket messages.
+
+    *_JsonFragment* objects are inserted without being serialized again.
+    """
+
+    @staticmethod
+    def dumps(obj: t.Any, **kwargs) -> str:
+        fallback = current_app.json.default if current_app else _flask_default  # type: ignore[attr-defined]
+        fragments: t.List[str] = []
+        token = ""
+
+        def default(o):
+            nonlocal token
+            if isinstance(o, _JsonFragment):
+                if not token:
+                    token = f"__tp_json_{uuid4().hex}_"
+                fragments.append(o.json)
+                return f"{token}{len(fragments) - 1}"
+            return fallback(o)
+
+        kwargs["default"] = default
+        encoded = flask_json.dumps(obj, **kwargs)
+        if not fragments:
+            return encoded
+        return re.sub(f'"{token}(\\d+)"', lambda m: fragments[int(m.group(1))], encoded)
+
+    @staticmethod
+    def loads(s: t.Union[str, bytes], **kwargs) -> t.Any:
+        return flask_json.loads(s, **kwargs)
@@ -37,6 +37,8 @@ ConfigParameter = t.Literal[
     "client_url",
     "dark_mode",
     "dark_theme",
+    "data_delta_updates",
+    "data_node_cache_size",
     "data_url_max_size",
     "debug",
     "extended_status",
@@ -44,10 +46,13 @@ ConfigParameter = t.Literal[
     "flask_log",
     "host",
     "light_theme",
+    "long_callback_processes",
+    "long_callback_workers",
     "margin",
     "ngrok_token",
     "notebook_proxy",
     "notification_duration",
+    "page_render_cache",
     "port",
     "port_auto_ranges",
     "propagate",
@@ -60,7 +65,9 @@ ConfigParameter = t.Literal[
     "theme",
     "time_zone",
     "title",
+    "state_memory_budget",
     "state_retention_period",
+    "state_spill_folder",
     "stylekit",
     "upload_folder",
     "use_arrow",
@@ -111,6 +118,8 @@ Config = t.TypedDict(
         "client_url": str,
         "dark_mode": bool,
         "dark_theme": t.Optional[t.Dict[str, t.Any]],
+        "data_delta_updates": bool,
+        "data_node_cache_size": int,
         "data_url_max_size": t.Optional[int],
         "debug": bool,
         "extended_status": bool,
@@ -118,10 +127,13 @@ Config = t.TypedDict(
         "flask_log": bool,
         "host": str,
         "light_theme": t.Optional[t.Dict[str, t.Any]],
+        "long_callback_processes": bool,
+        "long_callback_workers": int,
         "margin": t.Optional[str],
         "ngrok_token": str,
         "notebook_proxy": bool,
         "notification_duration": int,
+        "page_render_cache": bool,
         "port": t.Union[t.Literal["auto"], int],
         "port_auto_ranges": t.List[t.Union[int, t.Tuple[int, int]]],
         "propagate": bool,
@@ -130,7 +142,9 @@ Config = t.TypedDict(
         "run_server": bool,
         "server_config": t.Optional[ServerConfig],
         "single_client": bool,
+        "state_memory_budget": int,
         "state_retention_period": int,
+        "state_spill_folder": t.Optional[str],
         "stylekit": t.Union[bool, Stylekit],
         "system_notification": bool,
         "theme": t.Optional[t.Dict[str, t.Any]],
@@ -64,6 +64,21 @@ class _DataAccessor(ABC):
     def to_csv(self, var_name: str, value: t.Any) -> t.Optional[str]:
         pass
 
+    def _invalidate_cache(self, var_name: t.Optional[str] = None) -> None:  # noqa: B027
+        """Drop the results cached for *var_name* (or all variables) for all the clients."""
+        pass
+
+    def _forget(self, client_id: str) -> None:  # noqa: B027
+        """Drop everything that is kept for a client that is gone."""
+        pass
+
+    def get_delta(self, var_name: str, value: t.Any, data_format: _DataFormat) -> t.Optional[t.Dict[str, t.Any]]:
+        """Return the changes of the pages of data sent to the current client, per page key.
+
+        None means that the pages have to be fully refreshed.
+        """
+        return None
+
 
 class _InvalidDataAccessor(_DataAccessor):
     @staticmethod
@@ -167,3 +182,14 @@ class _DataAccessors(object):
 
     def to_pandas(self, value: t.Any):
         return self.__get_instance(value).to_pandas(value.get())
+
+    def get_delta(self, var_name: str, value: _TaipyData) -> t.Optional[t.Dict[str, t.Any]]:
+        return self.__get_instance(value).get_delta(var_name, value.get(), self.__data_format)
+
+    def invalidate_cache(self, var_name: str):
+        for inst in {id(inst): inst for inst in self.__access_4_type.values()}.values():
+            inst._invalidate_cache(var_name)
+
+    def forget(self, client_id: str):
+        for inst in {id(inst): inst for inst in self.__access_4_type.values()}.values():
+            inst._forget(client_id)
@@ -11,19 +11,53 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import tempfile
+import time
 import typing as t
+from threading import RLock, Thread
 from types import SimpleNamespace
 
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
 from .._warnings import _warn
+from ..utils._memory import _get_size
 
 if t.TYPE_CHECKING:
     from ..gui import Gui
 
 
+class _SpilledScope:
+    """Stands for a scope that was spilled to disk, in the values of _DataScopes.get_all_scopes().
+
+    Attributes set on a spilled scope (when broadcasting) are kept until the scope is restored.
+    Reading an attribute restores the scope.
+    """
+
+    def __init__(self, scopes: "_DataScopes", id: str) -> None:
+        object.__setattr__(self, "_scopes", scopes)
+        object.__setattr__(self, "_id", id)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._scopes.get_scope(self._id)[0], name)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        self._scopes._set_spilled_attr(self._id, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._scopes.get_scope(self._id)[0], name)
+
+
 class _DataScopes:
     _GLOBAL_ID = "global"
     _META_PRE_RENDER = "pre_render"
     _DEFAULT_METADATA = {_META_PRE_RENDER: False}
+    # Minimum delay between two checks of the memory used by the scopes, in seconds
+    _MEMORY_CHECK_PERIOD = 10
+    # A scope must not have been accessed for that long (in seconds) to be spilled to disk
+    _MIN_IDLE_TIME = 60
 
     def __init__(self, gui: "Gui") -> None:
         self.__gui = gui
@@ -33,6 +67,18 @@ class _DataScopes:
             _DataScopes._GLOBAL_ID: _DataScopes._DEFAULT_METADATA.copy()
         }
         self.__single_client = True
+        self.__lock = RLock()
+        # { scope_name: last access (time.monotonic()) }
+        self.__last_access: t.Dict[str, float] = {}
+        # { scope_name: spill file path }
+        self.__spilled: t.Dict[str, str] = {}
+        # { scope_name: { variable_name: value } } set while the scope was spilled
+        self.__spilled_attrs: t.Dict[str, t.Dict[str, t.Any]] = {}
+        # scopes holding values that cannot be pickled
+        self.__unspillable: t.Set[str] = set()
+        self.__spill_folder: t.Optional[str] = None
+        self.__next_memory_check = 0.0
+        self.__memory_check_thread: t.Optional[Thread] = None
 
     def set_single_client(self, value: bool) -> None:
         self.__single_client = value
@@ -48,15 +94,144 @@ class _DataScopes:
         if not client_id:
             _warn("Empty session id, using global scope instead.")
             return self.__scopes[_DataScopes._GLOBAL_ID], self.__scopes_metadata[_DataScopes._GLOBAL_ID]
-        if client_id not in self.__scopes:
-            _warn(
-                f"Session id {client_id} not found in data scope. Taipy will automatically create a scope for this session id but you may have to reload your page."  # noqa: E501
-            )
-            self.create_scope(client_id)
-        return self.__scopes[client_id], self.__scopes_metadata[client_id]
+        now = time.monotonic()
+        # the memory check may spill idle scopes in the background
+        with self.__lock:
+            if client_id not in self.__scopes:
+                if client_id in self.__spilled:
+                    self.__restore_scope(client_id)
+                else:
+                    _warn(
+                        f"Session id {client_id} not found in data scope. Taipy will automatically create a scope for this session id but you may have to reload your page."  # noqa: E501
+                    )
+                    self.create_scope(client_id)
+            self.__last_access[client_id] = now
+            scope = self.__scopes[client_id], self.__scopes_metadata[client_id]
+        if now >= self.__next_memory_check:
+            self.__start_memory_check(now)
+        return scope
 
     def get_all_scopes(self) -> t.Dict[str, SimpleNamespace]:
-        return self.__scopes
+        if not self.__spilled:
+            return self.__scopes
+        with self.__lock:
+            spilled = {id: t.cast(SimpleNamespace, _SpilledScope(self, id)) for id in self.__spilled}
+            return {**self.__scopes, **spilled}
+
+    def get_memory_usage(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Estimate the memory used by the variables of each scope held in memory, in bytes."""
+        return {
+            id: {name: _get_size(value) for name, value in list(vars(scope).items())}
+            for id, scope in list(self.__scopes.items())
+        }
+
+    def get_spilled_count(self) -> int:
+        return len(self.__spilled)
+
+    def __start_memory_check(self, now: float) -> None:
+        # estimating the size of all the variables takes time: it must not delay the request
+        self.__next_memory_check = now + _DataScopes._MEMORY_CHECK_PERIOD
+        budget = self.__gui._get_config("state_memory_budget", 0) or 0
+        if budget <= 0 or (self.__memory_check_thread is not None and self.__memory_check_thread.is_alive()):
+            return
+        self.__memory_check_thread = Thread(target=self.__check_memory, args=(now, budget), daemon=True)
+        self.__memory_check_thread.start()
+
+    def join_memory_check(self, timeout: t.Optional[float] = None) -> None:
+        """Wait for the running memory check, if any, to complete."""
+        if (thread := self.__memory_check_thread) is not None:
+            thread.join(timeout)
+
+    def __check_memory(self, now: float, budget: int) -> None:
+        # the sizes are estimated without the lock, that is only held to spill a scope
+        sizes = {
+            id: sum(usage.values()) for id, usage in self.get_memory_usage().items() if id != _DataScopes._GLOBAL_ID
+        }
+        total = sum(sizes.values())
+        logger = _TaipyLogger._get_logger()
+        logger.debug(f"States use {total} bytes in memory, {len(self.__spilled)} states spilled to disk.")
+        if total <= budget:
+            return
+        idle_ids = sorted(
+            (id for id in sizes if id not in self.__unspillable and self.__is_idle(id, now)),
+            key=lambda id: self.__last_access.get(id, 0),
+        )
+        for id in idle_ids:
+            if total <= budget:
+                break
+            if self.__spill_scope(id, now):
+                total -= sizes[id]
+        if total > budget:
+            logger.info(f"States use {total} bytes in memory, over the {budget} bytes budget.")
+
+    def __is_idle(self, id: str, now: float) -> bool:
+        return now - self.__last_access.get(id, 0) >= _DataScopes._MIN_IDLE_TIME
+
+    def __get_spill_path(self, id: str) -> str:
+        if self.__spill_folder is None:
+            folder = self.__gui._get_config("state_spill_folder", None)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self.__spill_folder = folder or tempfile.mkdtemp(prefix="taipy_states_")
+        return os.path.join(self.__spill_folder, f"{hashlib.sha1(id.encode()).hexdigest()}.pickle")
+
+    def __spill_scope(self, id: str, now: float) -> bool:
+        # the scope is written without the lock, so that the other clients are not blocked meanwhile
+        with self.__lock:
+            # the scope may have been accessed since its size was estimated
+            if (scope := self.__scopes.get(id)) is None or not self.__is_idle(id, now):
+                return False
+            values = dict(vars(scope))
+        path = self.__get_spill_path(id)
+        try:
+            with open(path, "wb") as file:
+                pickle.dump(values, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.__unspillable.add(id)
+            if os.path.exists(path):
+                os.remove(path)
+            _warn(f"State {id} cannot be spilled to disk", e)
+            return False
+        with self.__lock:
+            # the scope may have been accessed or modified while it was written
+            current = vars(scope)
+            if (
+                self.__scopes.get(id) is not scope
+                or not self.__is_idle(id, now)
+                or current.keys() != values.keys()
+                or any(current[name] is not value for name, value in values.items())
+            ):
+                os.remove(path)
+                return False
+            del self.__scopes[id]
+            self.__spilled[id] = path
+        return True
+
+    def __restore_scope(self, id: str) -> None:
+        with self.__lock:
+            if id in self.__scopes or (path := self.__spilled.get(id)) is None:
+                return
+            try:
+                with open(path, "rb") as file:
+                    scope = SimpleNamespace(**pickle.load(file))
+            except Exception as e:
+                # the spilled state is kept: the user variables must not silently disappear
+                raise RuntimeError(f"State {id} cannot be restored from disk") from e
+            for name, value in self.__spilled_attrs.pop(id, {}).items():
+                setattr(scope, name, value)
+            self.__scopes[id] = scope
+            del self.__spilled[id]
+            try:
+                os.remove(path)
+            except OSError as e:  # pragma: no cover
+                _warn(f"Spilled state file {path} cannot be removed", e)
+
+    def _set_spilled_attr(self, id: str, name: str, value: t.Any) -> None:
+        with self.__lock:
+            if id in self.__spilled:
+                self.__spilled_attrs.setdefault(id, {})[name] = value
+                return
+        setattr(self.get_scope(id)[0], name, value)
 
     def create_scope(self, id: str) -> None:
         if self.__single_client:
@@ -64,7 +239,7 @@ class _DataScopes:
         if id is None:
             _warn("Empty session id, might be due to unestablished WebSocket connection.")
             return
-        if id not in self.__scopes:
+        if id not in self.__scopes and id not in self.__spilled:
             self.__scopes[id] = SimpleNamespace()
             self.__scopes_metadata[id] = _DataScopes._DEFAULT_METADATA.copy()
             # Propagate shared variables to the new scope from the global scope
@@ -78,6 +253,13 @@ class _DataScopes:
         if id is None:
             _warn("Empty session id, might be due to unestablished WebSocket connection.")
             return
-        if id in self.__scopes:
-            del self.__scopes[id]
-            del self.__scopes_metadata[id]
+        with self.__lock:
+            if id in self.__scopes:
+                del self.__scopes[id]
+            if path := self.__spilled.pop(id, None):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.__scopes_metadata.pop(id, None)
+            self.__last_access.pop(id, None)
+            self.__spilled_attrs.pop(id, None)
+            self.__unspillable.discard(id)
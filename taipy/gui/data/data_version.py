@@ -0,0 +1,42 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import itertools
+import threading
+import typing as t
+
+
+class _DataVersions(object):
+    """Version of the data bound to each variable.
+
+    The version of a variable changes every time the variable is updated, for all the clients, so
+    that results computed from a data frame modified in place (which keeps its identity) are not
+    reused. Versions are unique across variables.
+    """
+
+    def __init__(self) -> None:
+        self.__versions: t.Dict[str, int] = {}
+        self.__counter = itertools.count(1)
+        # version of the variables that were not updated since all versions last changed
+        self.__base_version = 0
+        self.__lock = threading.Lock()
+
+    def get(self, var_name: str) -> int:
+        return self.__versions.get(var_name, self.__base_version)
+
+    def bump(self, var_name: t.Optional[str] = None) -> None:
+        """Change the version of *var_name*, or of all the variables if None."""
+        with self.__lock:
+            if var_name is None:
+                self.__versions.clear()
+                self.__base_version = next(self.__counter)
+            else:
+                self.__versions[var_name] = next(self.__counter)
@@ -11,13 +11,17 @@
 
 from __future__ import annotations
 
+import threading
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
 
 from ..._warnings import _warn
+from .pyramid import _LodPyramid
 
 
 class Decimator(ABC):
@@ -33,10 +37,18 @@ class Decimator(ABC):
 
     _CHART_MODES: t.List[str] = []
 
+    # A pyramid level must hold at least this number of points per pixel in the zoom window
+    _PYRAMID_OVERSAMPLING = 4
+    # Maximum number of pyramids kept by a decimator
+    _MAX_PYRAMIDS = 8
+    # Key of the decimator instance payload holding the variable and the version of the decimated data
+    _DATA_KEY = "_tp_data_key"
+
     def __init__(
         self,
         threshold: t.Optional[int],
         zoom: t.Optional[bool],
+        pyramid: t.Optional[bool] = False,
         # apply_decimator: t.Optional[t.Callable] = None,
         # on_decimate: t.Optional[t.Callable] = None,
     ) -> None:  # noqa: E501
@@ -47,6 +59,10 @@ class Decimator(ABC):
                 decimator class is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute a multi-resolution pyramid
+                of the data the first time it is decimated. Zoom windows are then served
+                from the level that best fits the window, so that the time spent on a zoom
+                event does not depend on the total number of data points.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
@@ -57,6 +73,11 @@ class Decimator(ABC):
         self._zoom = zoom if zoom is not None else True
         self.__user_defined_on_decimate = None
         self.__user_defined_apply_decimator = None
+        self._pyramid = bool(pyramid)
+        self.__pyramids: OrderedDict[t.Tuple[t.Hashable, str, str], t.Tuple[t.Optional[weakref.ref], _LodPyramid]] = (
+            OrderedDict()
+        )
+        self.__pyramids_lock = threading.Lock()
 
     def _is_applicable(self, data: t.Any, nb_rows_max: int, chart_mode: str):
         if chart_mode not in self._CHART_MODES:
@@ -124,6 +145,55 @@ class Decimator(ABC):
             df.drop(x_column, axis=1, inplace=True)
         return df, is_copied
 
+    def __get_pyramid(
+        self, dataframe: pd.DataFrame, x_column: t.Optional[str], y_column: str, data_key: t.Optional[t.Hashable]
+    ) -> _LodPyramid:
+        # The pyramid is built once per version of the data of a variable, identified by data_key.
+        # Without it, the pyramid is only reused for the very same data frame.
+        key = (data_key if data_key is not None else id(dataframe), x_column or "", y_column)
+        with self.__pyramids_lock:
+            if (entry := self.__pyramids.get(key)) is not None:
+                data_ref, pyramid = entry
+                if data_ref is None or data_ref() is dataframe:
+                    self.__pyramids.move_to_end(key)
+                    return pyramid
+        x = dataframe[x_column].to_numpy() if x_column else dataframe.index.to_numpy()
+        pyramid = _LodPyramid(x, dataframe[y_column].to_numpy())
+        with self.__pyramids_lock:
+            self.__pyramids[key] = (weakref.ref(dataframe) if data_key is None else None, pyramid)
+            self.__pyramids.move_to_end(key)
+            while len(self.__pyramids) > Decimator._MAX_PYRAMIDS:
+                self.__pyramids.popitem(last=False)
+        return pyramid
+
+    def _df_pyramid_relayout(
+        self,
+        dataframe: pd.DataFrame,
+        x_column: t.Optional[str],
+        y_column: str,
+        chart_mode: str,
+        x0: t.Optional[float],
+        x1: t.Optional[float],
+        y0: t.Optional[float],
+        y1: t.Optional[float],
+        nb_rows_max: t.Optional[int],
+        data_key: t.Optional[t.Hashable] = None,
+    ) -> t.Optional[pd.DataFrame]:
+        try:
+            pyramid = self.__get_pyramid(dataframe, x_column, y_column, data_key)
+            positions = pyramid.select(x0, x1, Decimator._PYRAMID_OVERSAMPLING * nb_rows_max if nb_rows_max else 0)
+        except Exception as e:
+            _warn(f"Decimator '{type(self).__name__}' cannot use a pyramid on column '{x_column}'", e)
+            return None
+        df = dataframe.iloc[positions]
+        # y column will be filtered only if chart_mode is not lines+markers (eg. markers)
+        if chart_mode not in ["lines+markers", "lines"]:
+            if y0 is not None:
+                df = df.loc[df[y_column] > y0]
+            if y1 is not None:
+                df = df.loc[df[y_column] < y1]
+        return df
+
     def _df_apply_decimator(
         self,
         dataframe: pd.DataFrame,
@@ -156,18 +226,34 @@ class Decimator(ABC):
             decimator_instance_payload.get("zAxis", ""),
         )
         chart_mode = decimator_instance_payload.get("chartMode", "")
-        if self._zoom and "relayoutData" in decimator_payload is not None and not z_column:
-            relayout_data = decimator_payload.get("relayoutData", {})
-            x0 = relayout_data.get("xaxis.range[0]")
-            x1 = relayout_data.get("xaxis.range[1]")
-            y0 = relayout_data.get("yaxis.range[0]")
-            y1 = relayout_data.get("yaxis.range[1]")
-
+        nb_rows_max = decimator_payload.get("width")
+        is_relayout = self._zoom and "relayoutData" in decimator_payload is not None and not z_column
+        relayout_data = decimator_payload.get("relayoutData", {}) if is_relayout else {}
+        x0 = relayout_data.get("xaxis.range[0]")
+        x1 = relayout_data.get("xaxis.range[1]")
+        y0 = relayout_data.get("yaxis.range[0]")
+        y1 = relayout_data.get("yaxis.range[1]")
+        pyramid_df = None
+        if self._pyramid and not z_column and chart_mode in ["lines+markers", "lines", "markers"]:
+            pyramid_df = self._df_pyramid_relayout(
+                t.cast(pd.DataFrame, df),
+                x_column,
+                y_column,
+                chart_mode,
+                x0,
+                x1,
+                y0,
+                y1,
+                nb_rows_max,
+                decimator_instance_payload.get(Decimator._DATA_KEY),
+            )
+        if pyramid_df is not None:
+            df, is_copied = pyramid_df, True
+        elif is_relayout:
             df, is_copied = self._df_relayout(
                 t.cast(pd.DataFrame, df), x_column, y_column, chart_mode, x0, x1, y0, y1, is_copied
             )
 
-        nb_rows_max = decimator_payload.get("width")
         is_decimator_applied = False
         if nb_rows_max and self._is_applicable(df, nb_rows_max, chart_mode):
             try:
@@ -33,6 +33,7 @@ class LTTB(Decimator):
         n_out: int,
         threshold: t.Optional[int] = None,
         zoom: t.Optional[bool] = True,
+        pyramid: t.Optional[bool] = False,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
     ) -> None:
@@ -44,20 +45,17 @@ class LTTB(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute a multi-resolution pyramid
+                of the data so that zoom events are served in a time that does not depend
+                on the number of data points.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid)
         self._n_out = n_out
 
-    @staticmethod
-    def _areas_of_triangles(a, bs, c):
-        bs_minus_a = bs - a
-        a_minus_bs = a - bs
-        return 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
-
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         n_out = self._n_out
         if n_out >= data.shape[0]:
@@ -66,12 +64,26 @@ class LTTB(Decimator):
         if n_out < 3:
             raise ValueError("Can only down-sample to a minimum of 3 points")
 
-        # Split data into bins
+        # Split data into bins, the same way np.array_split() does:
+        # the first bins hold one more point than the others.
         n_bins = n_out - 2
-        data_bins = np.array_split(data[1:-1], n_bins)
-
-        prev_a = data[0]
-        start_pos = 0
+        # Contiguous copies of the coordinates, so that each bin is a contiguous slice.
+        inner_x = np.ascontiguousarray(data[1:-1, 0], dtype=float)
+        inner_y = np.ascontiguousarray(data[1:-1, 1], dtype=float)
+        bin_size, n_larger_bins = divmod(len(inner_x), n_bins)
+        bin_indexes = np.arange(n_bins)
+        bin_lengths = bin_size + (bin_indexes < n_larger_bins)
+        bin_starts = bin_indexes * bin_size + np.minimum(bin_indexes, n_larger_bins)
+
+        # The centroid of the next bin is needed for each bin: the last bin uses the last point.
+        next_centroids = np.column_stack(
+            (
+                np.append(np.add.reduceat(inner_x, bin_starts)[1:] / bin_lengths[1:], float(data[-1, 0])),
+                np.append(np.add.reduceat(inner_y, bin_starts)[1:] / bin_lengths[1:], float(data[-1, 1])),
+            )
+        )
+        areas = np.empty(bin_size + 1)
+        tmp = np.empty(bin_size + 1)
 
         # Prepare output mask array
         # First and last points are the same as in the input.
@@ -83,17 +95,23 @@ class LTTB(Decimator):
         # In each bin, find the point that makes the largest triangle
         # with the point saved in the previous bin
         # and the centroid of the points in the next bin.
-        for i in range(len(data_bins)):
-            this_bin = data_bins[i]
-            next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
-            a = prev_a
-            bs = this_bin
-            c = next_bin.mean(axis=0)
-
-            areas = LTTB._areas_of_triangles(a, bs, c)
-            bs_pos = np.argmax(areas)
-            prev_a = bs[bs_pos]
-            out_mask[start_pos + bs_pos] = True
-            start_pos += len(this_bin)
+        # Only this selection depends on the previous bin: everything else is computed for all bins at once.
+        selected: np.ndarray = np.empty(n_bins, dtype=int)
+        a_x, a_y = float(data[0, 0]), float(data[0, 1])
+        for i, (start, length, (c_x, c_y)) in enumerate(
+            zip(bin_starts.tolist(), bin_lengths.tolist(), next_centroids.tolist())
+        ):
+            end = start + length
+            # (a_x - c_x) * (b_y - a_y) - (a_x - b_x) * (c_y - a_y), without temporary arrays
+            bin_areas, bin_tmp = areas[:length], tmp[:length]
+            np.subtract(inner_y[start:end], a_y, out=bin_areas)
+            np.multiply(bin_areas, a_x - c_x, out=bin_areas)
+            np.subtract(a_x, inner_x[start:end], out=bin_tmp)
+            np.multiply(bin_tmp, c_y - a_y, out=bin_tmp)
+            np.subtract(bin_areas, bin_tmp, out=bin_areas)
+            bs_pos = int(np.absolute(bin_areas, out=bin_areas).argmax())
+            selected[i] = bs_pos
+            a_x, a_y = float(inner_x[start + bs_pos]), float(inner_y[start + bs_pos])
+        out_mask[bin_starts + selected] = True
 
         return out_mask
@@ -32,6 +32,7 @@ class MinMaxDecimator(Decimator):
         n_out: int,
         threshold: t.Optional[int] = None,
         zoom: t.Optional[bool] = True,
+        pyramid: t.Optional[bool] = False,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
     ):
@@ -43,12 +44,15 @@ class MinMaxDecimator(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute a multi-resolution pyramid
+                of the data so that zoom events are served in a time that does not depend
+                on the number of data points.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid)
         self._n_out = n_out // 2
 
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
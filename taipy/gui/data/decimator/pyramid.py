@@ -0,0 +1,99 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+
+class _LodPyramid(object):
+    """Multi-resolution view of a series, used to serve zoom windows without scanning the whole data.
+
+    The points are sorted on x once. Each level then keeps, for every bucket of consecutive points of
+    the previous level, the points holding the minimum and maximum y values. A level is therefore about
+    `_FACTOR` times smaller than the previous one while keeping the peaks of the series.
+    Levels are stored as positions in the sorted series so that a zoom window is found with a binary
+    search on x.
+    """
+
+    _FACTOR = 4
+    _MIN_LEVEL_SIZE = 1024
+
+    def __init__(self, x: np.ndarray, y: np.ndarray) -> None:
+        if np.issubdtype(x.dtype, np.datetime64):
+            self.__is_date = True
+        elif np.issubdtype(x.dtype, np.number):
+            self.__is_date = False
+        else:
+            raise TypeError(f"Cannot build a decimation pyramid on values of type {x.dtype}.")
+        self.__order: t.Optional[np.ndarray] = None
+        if len(x) > 1 and not (x[1:] >= x[:-1]).all():
+            self.__order = np.argsort(x, kind="stable")
+            x = x[self.__order]
+            y = y[self.__order]
+        self.__x = x
+        self.__levels: t.List[np.ndarray] = []
+        positions = np.arange(len(x))
+        while len(positions) > _LodPyramid._MIN_LEVEL_SIZE:
+            positions = _LodPyramid.__reduce(positions, y)
+            self.__levels.append(positions)
+
+    @staticmethod
+    def __reduce(positions: np.ndarray, y: np.ndarray) -> np.ndarray:
+        # two points (min and max) are kept from each bucket
+        bucket_size = 2 * _LodPyramid._FACTOR
+        n_buckets = len(positions) // bucket_size
+        buckets = positions[: n_buckets * bucket_size].reshape((n_buckets, bucket_size))
+        y_buckets = y[buckets]
+        rows = np.arange(n_buckets)
+        kept = [
+            positions[:1],
+            buckets[rows, np.argmin(y_buckets, axis=1)],
+            buckets[rows, np.argmax(y_buckets, axis=1)],
+            positions[n_buckets * bucket_size :],
+            positions[-1:],
+        ]
+        return np.unique(np.concatenate(kept))
+
+    def __to_x(self, value: t.Any) -> t.Any:
+        return pd.Timestamp(value).to_datetime64() if self.__is_date else float(value)
+
+    def __len__(self) -> int:
+        return len(self.__x)
+
+    @property
+    def nb_levels(self) -> int:
+        return len(self.__levels) + 1
+
+    def select(self, x0: t.Optional[t.Any], x1: t.Optional[t.Any], min_points: int) -> np.ndarray:
+        """Return the positions of the rows to use for the ]x0, x1[ window.
+
+        The coarsest level holding at least *min_points* points in the window is used, or all the
+        points if *min_points* is 0. Positions are returned in the original order of the rows.
+        """
+        start = 0 if x0 is None else int(np.searchsorted(self.__x, self.__to_x(x0), side="right"))
+        end = len(self.__x) if x1 is None else int(np.searchsorted(self.__x, self.__to_x(x1), side="left"))
+        positions = None
+        for level in reversed(self.__levels) if min_points > 0 else []:
+            bounds = np.searchsorted(level, (start, end), side="left")
+            level_start: int = int(bounds[0])
+            level_end: int = int(bounds[1])
+            if level_end - level_start >= min_points:
+                positions = level[level_start:level_end]
+                break
+        if positions is None:
+            positions = np.arange(start, max(start, end))
+        if self.__order is not None:
+            return np.sort(self.__order[positions])
+        return positions
@@ -34,6 +34,7 @@ class RDP(Decimator):
         n_out: t.Optional[int] = None,
         threshold: t.Optional[int] = None,
         zoom: t.Optional[bool] = True,
+        pyramid: t.Optional[bool] = False,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
     ):
@@ -50,25 +51,54 @@ class RDP(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute a multi-resolution pyramid
+                of the data so that zoom events are served in a time that does not depend
+                on the number of data points.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid)
         self._epsilon = epsilon
         self._n_out = n_out
 
     @staticmethod
-    def __dsquared_line_points(P1, P2, points):
+    def __split_segments(data, starts, ends):
         """
-        Calculate only squared distance, only needed for comparison
+        Find the farthest point of all the segments at once.
+
+        Returns the index and squared distance of the farthest point of each segment, for the
+        segments that have points in between their ends, as well as the maximum distance that
+        ignores NaN values.
         """
-        xdiff = P2[0] - P1[0]
-        ydiff = P2[1] - P1[1]
-        nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+        inner = ends - starts > 1
+        starts, ends = starts[inner], ends[inner]
+        lengths = ends - starts - 1
+        segment_starts = np.cumsum(lengths) - lengths
+        # segment of each point in between the ends of a segment, and index of this point in data
+        point_segments = np.repeat(np.arange(len(starts)), lengths)
+        points = np.arange(len(point_segments)) - segment_starts[point_segments] + starts[point_segments] + 1
+        # squared distance to the line going through the ends of the segment, only needed for comparison
+        P1 = data[starts][point_segments]
+        P2 = data[ends][point_segments]
+        xdiff = P2[:, 0] - P1[:, 0]
+        ydiff = P2[:, 1] - P1[:, 1]
+        nom = (ydiff * data[points, 0] - xdiff * data[points, 1] + P2[:, 0] * P1[:, 1] - P2[:, 1] * P1[:, 0]) ** 2
         denom = ydiff**2 + xdiff**2
-        return np.divide(nom, denom)
+        dsq = np.divide(nom, denom)
+        # first point holding the maximum distance of each segment (NaN values win, as in np.argmax)
+        sortable_dsq = np.where(np.isnan(dsq), np.inf, dsq)
+        max_dsq = np.maximum.reduceat(sortable_dsq, segment_starts)
+        is_max = sortable_dsq == max_dsq[point_segments]
+        farthest = np.minimum.reduceat(np.where(is_max, points, len(data)), segment_starts)
+        return (
+            starts,
+            ends,
+            farthest,
+            np.maximum.reduceat(dsq, segment_starts),
+            np.fmax.reduceat(dsq, segment_starts),
+        )
 
     @staticmethod
     def __rdp_epsilon(data, epsilon: int):
@@ -79,35 +109,22 @@ class RDP(Decimator):
         # Assume all points are valid and falsify those which are found
         mask.fill(True)
 
-        # The stack to select start and end index
-        stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]  # type: ignore
-
-        while stack:
-            # Pop the last item
-            (start, end) = stack.pop()
-
-            # nothing to calculate if no points in between
-            if end - start <= 1:
-                continue
-            # Calculate distance to points
-            P1 = data[start]
-            P2 = data[end]
-            points = data[start + 1 : end]
-            dsq = RDP.__dsquared_line_points(P1, P2, points)
-
-            mask_eps = dsq > epsilon**2
-
-            if mask_eps.any():
-                # max point outside eps
-                # Include index that was sliced out
-                # Also include the start index to get absolute index
-                # And not relative
-                mid = np.argmax(dsq) + 1 + start
-                stack.append((start, mid))  # type: ignore
-                stack.append((mid, end))  # type: ignore
-            else:
-                # Points in between are redundant
-                mask[start + 1 : end] = False
+        # All the segments of the same depth are processed at once
+        starts, ends = np.array([0]), np.array([data.shape[0] - 1])
+
+        redundant = np.zeros(data.shape[0] + 1, dtype=int)
+        while len(starts):
+            starts, ends, farthest, _, max_dsq = RDP.__split_segments(data, starts, ends)
+            # segments with a point outside eps are split on their farthest point
+            split = max_dsq > epsilon**2
+            # Points in between are redundant
+            np.add.at(redundant, starts[~split] + 1, 1)
+            np.add.at(redundant, ends[~split], -1)
+            starts, ends = (
+                np.concatenate((starts[split], farthest[split])),
+                np.concatenate((farthest[split], ends[split])),
+            )
+        mask[np.cumsum(redundant[:-1]) > 0] = False
         return mask
 
     @staticmethod
@@ -123,17 +140,13 @@ class RDP(Decimator):
         weights[0] = float("inf")
         weights[M_len - 1] = float("inf")
 
-        stack = [(0, M_len - 1)]
-
-        while stack:
-            (start, end) = stack.pop()
-            if end - start <= 1:
-                continue
-            dsq = RDP.__dsquared_line_points(M[start], M[end], M[start + 1 : end])
-            max_dist_index = np.argmax(dsq) + start + 1
-            weights[max_dist_index] = np.amax(dsq)
-            stack.append((start, max_dist_index))
-            stack.append((max_dist_index, end))
+        # All the segments of the same depth are processed at once
+        starts, ends = np.array([0]), np.array([M_len - 1])
+
+        while len(starts):
+            starts, ends, farthest, max_dsq, _ = RDP.__split_segments(M, starts, ends)
+            weights[farthest] = max_dsq
+            starts, ends = np.concatenate((starts, farthest)), np.concatenate((farthest, ends))
         maxTolerance = np.sort(weights)[M_len - n_out]
 
         return weights >= maxTolerance
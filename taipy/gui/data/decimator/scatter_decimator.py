@@ -87,16 +87,14 @@ class ScatterDecimator(Decimator):
             max_z: float = np.amax(z_col)
             min_max_z_diff = max_z - min_z
             z_grid_map = np.rint((z_col - min_z) * grid_z / min_max_z_diff).astype(int)
-        grid = np.empty(grid_shape, dtype=int)
-        grid.fill(0)
-        if z_grid_map is not None:
-            for i in np.arange(n_rows):
-                if grid[x_grid_map[i], y_grid_map[i], z_grid_map[i]] < self._max_overlap_points:
-                    grid[x_grid_map[i], y_grid_map[i], z_grid_map[i]] += 1
-                    mask[i] = True
-        else:
-            for i in np.arange(n_rows):
-                if grid[x_grid_map[i], y_grid_map[i]] < self._max_overlap_points:
-                    grid[x_grid_map[i], y_grid_map[i]] += 1
-                    mask[i] = True
+        grid_maps = (x_grid_map, y_grid_map) if z_grid_map is None else (x_grid_map, y_grid_map, z_grid_map)
+        cells: np.ndarray = np.asarray(np.ravel_multi_index(grid_maps, grid_shape))
+        # Keep the first points of each cell, in the order of the data:
+        # sort the points by cell and compute the rank of each point within its cell.
+        order: np.ndarray = np.argsort(cells, kind="stable")
+        sorted_cells: np.ndarray = cells[order]
+        cell_starts: np.ndarray = np.flatnonzero(np.concatenate(([True], sorted_cells[1:] != sorted_cells[:-1])))
+        cell_counts: np.ndarray = np.diff(np.append(cell_starts, int(n_rows)))
+        ranks: np.ndarray = np.arange(int(n_rows)) - np.repeat(cell_starts, cell_counts)
+        mask[order[ranks < self._max_overlap_points]] = True
         return mask
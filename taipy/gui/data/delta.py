@@ -0,0 +1,146 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import threading
+import typing as t
+from collections import OrderedDict
+
+
+def _digest(value: t.Any) -> int:
+    return hash(repr(value))
+
+
+def _digest_values(values: t.List[t.Any]) -> bytes:
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+class _SentPage(object):
+    """A page of data as it was last sent to a client: the request payload and digests of the returned data.
+
+    Only digests are kept, not the data itself: the digest of each cell for pages of records, the length
+    and the digest of each column for columns (such as chart data).
+    """
+
+    def __init__(self, payload: t.Dict[str, t.Any], value: t.Dict[str, t.Any]) -> None:
+        self.payload = payload
+        self.start = value.get("start")
+        data = value.get("data")
+        self.rows: t.Optional[t.List[t.Dict[str, int]]] = (
+            [{k: _digest(v) for k, v in row.items()} for row in data] if isinstance(data, list) else None
+        )
+        self.columns: t.Optional[t.Dict[str, t.Tuple[int, bytes]]] = (
+            {col: (len(values), _digest_values(values)) for col, values in data.items()}
+            if isinstance(data, dict)
+            else None
+        )
+
+
+class _DeltaTracker(object):
+    """Keeps track of the pages of data sent to each client, so that only the differences are sent when
+    the data changes.
+
+    Only the *max_pages* last requested pages of a variable are tracked per client: these are the pages
+    that are displayed.
+    """
+
+    def __init__(self, max_pages: int = 4, max_entries: int = 256) -> None:
+        self.__max_pages = max_pages
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[t.Tuple[str, str], OrderedDict[str, _SentPage]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def record(self, client_id: str, var_name: str, payload: t.Dict[str, t.Any], value: t.Dict[str, t.Any]):
+        key = (client_id, var_name)
+        page_key = str(payload.get("pagekey"))
+        page = _SentPage(payload, value)
+        with self.__lock:
+            pages = self.__entries.get(key)
+            if pages is None:
+                pages = OrderedDict()
+                self.__entries[key] = pages
+            pages[page_key] = page
+            pages.move_to_end(page_key)
+            while len(pages) > self.__max_pages:
+                pages.popitem(last=False)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def get_pages(self, client_id: str, var_name: str) -> t.Dict[str, _SentPage]:
+        with self.__lock:
+            return dict(self.__entries.get((client_id, var_name), {}))
+
+    def invalidate(self, client_id: str, var_name: t.Optional[str] = None) -> None:
+        with self.__lock:
+            for key in [k for k in self.__entries if k[0] == client_id and (var_name is None or k[1] == var_name)]:
+                del self.__entries[key]
+
+    def forget(self, client_id: str) -> None:
+        """Drop the pages sent to a client that is gone."""
+        self.invalidate(client_id)
+
+    @staticmethod
+    def diff_records(
+        old: t.List[t.Dict[str, int]], new: t.List[t.Dict[str, t.Any]], max_ratio: float
+    ) -> t.Optional[t.Dict[str, t.Dict[str, t.Any]]]:
+        """Return the cells of *new* that differ from the cells of *old*, given as digests, per row position.
+
+        None is returned if rows were removed or if more than *max_ratio* of the cells changed.
+        """
+        if len(new) < len(old):
+            return None
+        max_cells = max(1, int(max_ratio * sum(len(row) for row in new)))
+        nb_cells = 0
+        rows: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for i, row in enumerate(new):
+            old_row = old[i] if i < len(old) else None
+            if old_row is None:
+                cells = row
+            else:
+                if old_row.keys() - row.keys():
+                    return None
+                cells = {k: v for k, v in row.items() if k not in old_row or old_row[k] != _digest(v)}
+                if not cells:
+                    continue
+            nb_cells += len(cells)
+            if nb_cells > max_cells:
+                return None
+            rows[str(i)] = cells
+        return rows
+
+    @staticmethod
+    def diff_columns(
+        old: t.Dict[str, t.Tuple[int, bytes]], new: t.Dict[str, t.List[t.Any]], max_ratio: float
+    ) -> t.Optional[t.Dict[str, t.List[t.Any]]]:
+        """Return the values appended to the columns of *new*, compared to *old* (the length and digest
+        of each column).
+
+        None is returned if the columns are different, if values other than the last ones changed or if
+        more than *max_ratio* of the values were appended.
+        """
+        if old.keys() != new.keys():
+            return None
+        appended: t.Dict[str, t.List[t.Any]] = {}
+        lengths = set()
+        for col, values in new.items():
+            old_len, old_digest = old[col]
+            if len(values) < old_len or _digest_values(values[:old_len]) != old_digest:
+                return None
+            appended[col] = values[old_len:]
+            lengths.add((old_len, len(values)))
+        if len(lengths) > 1:
+            return None
+        if lengths:
+            old_len, new_len = lengths.pop()
+            if new_len - old_len > max(1, int(max_ratio * new_len)):
+                return None
+        return appended
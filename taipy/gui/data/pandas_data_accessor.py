@@ -26,6 +26,10 @@ from ..utils import _RE_PD_TYPE, _get_date_col_str_name
 from .comparison import _compare_function
 from .data_accessor import _DataAccessor
 from .data_format import _DataFormat
+from .data_version import _DataVersions
+from .decimator.base import Decimator
+from .delta import _DeltaTracker, _SentPage
+from .query_cache import _QueryCache
 
 _has_arrow_module = False
 if util.find_spec("pyarrow"):
@@ -33,6 +37,20 @@ if util.find_spec("pyarrow"):
     import pyarrow as pa
 
 
+class _QueryResult(object):
+    """The rows of a data frame once filtered, aggregated and sorted for a paged request.
+
+    *data* is None if the rows are the ones of the queried data frame, which is not referenced.
+    """
+
+    def __init__(self, data: t.Optional[pd.DataFrame], order: t.Optional[np.ndarray], is_copied: bool) -> None:
+        self.data = data
+        self.order = order
+        self.is_copied = is_copied
+        # Arrow tables of the whole result, per value of handlenan
+        self.arrow_tables: t.Dict[bool, t.Any] = {}
+
+
 class _PandasDataAccessor(_DataAccessor):
     __types = (pd.DataFrame, pd.Series)
 
@@ -40,6 +58,17 @@ class _PandasDataAccessor(_DataAccessor):
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
 
+    __QUERY_KEYS = ("columns", "filters", "aggregates", "applies", "orderby", "sort")
+
+    # above this ratio of changed values, pages are refreshed rather than patched
+    __DELTA_MAX_RATIO = 0.5
+
+    def __init__(self, gui: Gui) -> None:
+        super().__init__(gui)
+        self.__query_cache = _QueryCache()
+        self.__data_versions = _DataVersions()
+        self.__delta_tracker = _DeltaTracker()
+
     def to_pandas(self, value: t.Union[pd.DataFrame, pd.Series]) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
         return self.__to_dataframe(value)
 
@@ -77,6 +106,16 @@ class _PandasDataAccessor(_DataAccessor):
         col_types = data.dtypes[data.dtypes.index.astype(str) == col_name]
         return len(col_types[col_types.astype(str).str.startswith("datetime")]) > 0  # type: ignore
 
+    @staticmethod
+    def __format_dates(column: pd.Series, tz: t.Optional[str], handle_nan: t.Optional[bool]) -> pd.Series:
+        # tz is the time zone of naive dates, None if the dates are time zone aware
+        utc_dates = (column.dt.tz_localize(tz) if tz else column).dt.tz_convert("UTC").dt.tz_localize(None)
+        # vectorized equivalent of strftime(_DataAccessor._WS_DATE_FORMAT)
+        values = np.datetime_as_string(utc_dates.to_numpy(dtype="datetime64[us]"), unit="us", timezone="UTC")
+        formatted = pd.Series(values, index=column.index, dtype=object)
+        formatted[utc_dates.isna().to_numpy()] = "NaT" if handle_nan else None
+        return formatted
+
     def __build_transferred_cols(
         self,
         payload_cols: t.Any,
@@ -134,23 +173,9 @@ class _PandasDataAccessor(_DataAccessor):
                 new_col = _get_date_col_str_name(cols, col)
                 re_type = _RE_PD_TYPE.match(str(col_types[col]))
                 groups = re_type.groups() if re_type else ()
-                if len(groups) > 4 and groups[4]:
-                    new_cols[new_col] = (
-                        dataframe[col]
-                        .dt.tz_convert("UTC")
-                        .dt.strftime(_DataAccessor._WS_DATE_FORMAT)
-                        .astype(str)
-                        .replace("nan", "NaT" if handle_nan else None)
-                    )
-                else:
-                    new_cols[new_col] = (
-                        dataframe[col]
-                        .dt.tz_localize(tz)
-                        .dt.tz_convert("UTC")
-                        .dt.strftime(_DataAccessor._WS_DATE_FORMAT)
-                        .astype(str)
-                        .replace("nan", "NaT" if handle_nan else None)
-                    )
+                new_cols[new_col] = _PandasDataAccessor.__format_dates(
+                    dataframe[col], tz if len(groups) <= 4 or not groups[4] else None, handle_nan
+                )
 
             # remove the date columns from the list of columns
             cols = list(set(cols) - set(date_cols))
@@ -181,7 +206,7 @@ class _PandasDataAccessor(_DataAccessor):
 
     def __format_data(
         self,
-        data: pd.DataFrame,
+        data: t.Any,
         data_format: _DataFormat,
         orient: str,
         start: t.Optional[int] = None,
@@ -205,7 +230,11 @@ class _PandasDataAccessor(_DataAccessor):
             if not _has_arrow_module:
                 raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
             # Convert from pandas to Arrow
-            table = pa.Table.from_pandas(data)  # type: ignore[reportPossiblyUnboundVariable]
+            table = (
+                data
+                if isinstance(data, pa.Table)  # type: ignore[reportPossiblyUnboundVariable]
+                else pa.Table.from_pandas(data, preserve_index=False)  # type: ignore[reportPossiblyUnboundVariable]
+            )
             # Create sink buffer stream
             sink = pa.BufferOutputStream()  # type: ignore[reportPossiblyUnboundVariable]
             # Create Stream writer
@@ -215,7 +244,7 @@ class _PandasDataAccessor(_DataAccessor):
             writer.close()
             # End buffer stream
             buf = sink.getvalue()
-            # Convert buffer to Python bytes and return
+            # Convert buffer to Python bytes: it is sent as a binary frame
             ret["data"] = buf.to_pybytes()
             ret["orient"] = orient
         else:
@@ -233,32 +262,7 @@ class _PandasDataAccessor(_DataAccessor):
             return ret_dict
         return {str(k): v for k, v in self.__to_dataframe(value).dtypes.apply(lambda x: x.name.lower()).items()}
 
-    def __get_data(  # noqa: C901
-        self,
-        var_name: str,
-        df: pd.DataFrame,
-        payload: t.Dict[str, t.Any],
-        data_format: _DataFormat,
-        col_prefix: t.Optional[str] = "",
-    ) -> t.Dict[str, t.Any]:
-        columns = payload.get("columns", [])
-        if col_prefix:
-            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
-        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
-        paged = not payload.get("alldata", False)
-        is_copied = False
-
-        orig_df = df
-        # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in df.columns:
-                is_copied = True
-                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
-
-        fullrowcount = len(df)
-        # filtering
+    def __filter(self, df: pd.DataFrame, payload: t.Dict[str, t.Any]) -> t.Tuple[pd.DataFrame, bool]:
         filters = payload.get("filters")
         if isinstance(filters, list) and len(filters) > 0:
             query = ""
@@ -277,28 +281,149 @@ class _PandasDataAccessor(_DataAccessor):
                     query += " and "
                 query += f"`{col}`{right}"
             try:
-                df = df.query(query)
-                is_copied = True
+                return df.query(query), True
             except Exception as e:
                 _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
+        return df, False
+
+    def __get_query_result(
+        self, var_name: str, df: pd.DataFrame, payload: t.Dict[str, t.Any], columns: t.List[str]
+    ) -> "_QueryResult":
+        client_id = self.__get_client_id()
+        fingerprint = _QueryCache.fingerprint(payload, _PandasDataAccessor.__QUERY_KEYS)
+        version = self.__data_versions.get(var_name)
+        if (query := self.__query_cache.get(client_id, var_name, df, version, fingerprint)) is not None:
+            return query
+        orig_df = df
+        is_copied = False
+        aggregates = payload.get("aggregates")
+        applies = payload.get("applies")
+        aggregate = isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict)
+        if aggregate and _PandasDataAccessor.__INDEX_COL not in df.columns:
+            # the index column needs to be aggregated too
+            is_copied = True
+            df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+        df, is_filtered = self.__filter(df, payload)
+        is_copied = is_copied or is_filtered
+        if aggregate:
+            applies_with_fn = {
+                k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
+                for k, v in t.cast(dict, applies).items()
+            }
+
+            for col in columns:
+                if col not in applies_with_fn.keys():
+                    applies_with_fn[col] = "first"
+            try:
+                df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
+            except Exception:
+                _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+        # deal with sort
+        order: t.Optional[np.ndarray] = None
+        order_by = payload.get("orderby")
+        if isinstance(order_by, str) and len(order_by):
+            try:
+                if df.columns.dtype.name == "int64":
+                    order_by = int(order_by)
+                order = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
+                if payload.get("sort") == "desc":
+                    # reverse order
+                    order = t.cast(np.ndarray, order)[::-1]
+            except Exception:
+                _warn(f"Cannot sort {var_name} on columns {order_by}.")
+                order = None
+        query = _QueryResult(None if df is orig_df else df, order, is_copied)
+        self.__query_cache.set(client_id, var_name, orig_df, version, fingerprint, query)
+        return query
+
+    def __get_client_id(self) -> str:
+        try:
+            return self._gui._get_client_id()
+        except RuntimeError:
+            # outside of a request context
+            return ""
+
+    def _invalidate_cache(self, var_name: t.Optional[str] = None) -> None:
+        self.__data_versions.bump(var_name)
+        self.__query_cache.invalidate(var_name)
+
+    def _forget(self, client_id: str) -> None:
+        self.__query_cache.forget(client_id)
+        self.__delta_tracker.forget(client_id)
+
+    def __get_arrow_page(
+        self,
+        query: _QueryResult,
+        data: pd.DataFrame,
+        columns: t.List[str],
+        payload: t.Dict[str, t.Any],
+        start: int,
+        end: int,
+    ) -> t.Any:
+        handle_nan = bool(payload.get("handlenan", False))
+        table = query.arrow_tables.get(handle_nan)
+        if table is None:
+            # the whole result is converted once (including dates), pages are then sliced out of it
+            df = data
+            if _PandasDataAccessor.__INDEX_COL not in df.columns:
+                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+            df = self.__build_transferred_cols(columns, df, is_copied=True, handle_nan=handle_nan)
+            table = pa.Table.from_pandas(df, preserve_index=False)  # type: ignore[reportPossiblyUnboundVariable]
+            query.arrow_tables[handle_nan] = table
+        if query.order is None:
+            indexes: t.Any = slice(start, end + 1)
+            page = table.slice(start, end - start + 1)
+        else:
+            indexes = query.order[start : end + 1]
+            page = table.take(indexes)
+        styles = payload.get("styles")
+        tooltips = payload.get("tooltips")
+        formats = payload.get("formats")
+        if styles or tooltips or formats:
+            # user functions are only applied to the rows of the page
+            page_df = self.__build_transferred_cols(
+                columns,
+                data.iloc[indexes],
+                styles=styles,
+                tooltips=tooltips,
+                formats=formats,
+                handle_nan=handle_nan,
+            )
+            for col in page_df.columns:
+                if str(col) not in page.column_names:
+                    page = page.append_column(
+                        str(col),
+                        pa.Array.from_pandas(page_df[col]),  # type: ignore[reportPossiblyUnboundVariable]
+                    )
+        return page
+
+    def __get_data(  # noqa: C901
+        self,
+        var_name: str,
+        df: pd.DataFrame,
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+        col_prefix: t.Optional[str] = "",
+    ) -> t.Dict[str, t.Any]:
+        columns = payload.get("columns", [])
+        if col_prefix:
+            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
+        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
+        paged = not payload.get("alldata", False)
+        is_copied = False
+
+        orig_df = df
+        if paged and columns and _PandasDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PandasDataAccessor.__INDEX_COL)
 
+        fullrowcount = len(df)
         dict_ret: t.Optional[t.Dict[str, t.Any]]
         if paged:
-            aggregates = payload.get("aggregates")
-            applies = payload.get("applies")
-            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
-                applies_with_fn = {
-                    k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
-                    for k, v in applies.items()
-                }
-
-                for col in columns:
-                    if col not in applies_with_fn.keys():
-                        applies_with_fn[col] = "first"
-                try:
-                    df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
-                except Exception:
-                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+            # filtering, aggregation and sorting are computed once for a given data and payload
+            query = self.__get_query_result(var_name, df, payload, columns)
+            if query.data is not None:
+                df = query.data
+            is_copied = query.is_copied
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
@@ -332,32 +457,27 @@ class _PandasDataAccessor(_DataAccessor):
                 start = end - diff
                 if start < 0:
                     start = 0
-            # deal with sort
-            order_by = payload.get("orderby")
-            if isinstance(order_by, str) and len(order_by):
-                try:
-                    if df.columns.dtype.name == "int64":
-                        order_by = int(order_by)
-                    new_indexes = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
-                    if payload.get("sort") == "desc":
-                        # reverse order
-                        new_indexes = new_indexes[::-1]
-                    new_indexes = new_indexes[slice(start, end + 1)]
-                except Exception:
-                    _warn(f"Cannot sort {var_name} on columns {order_by}.")
-                    new_indexes = slice(start, end + 1)  # type: ignore
+            new_indexes = query.order[start : end + 1] if query.order is not None else slice(start, end + 1)
+            if data_format is _DataFormat.APACHE_ARROW and _has_arrow_module:
+                df = self.__get_arrow_page(query, df, columns, payload, start, end)
             else:
-                new_indexes = slice(start, end + 1)  # type: ignore
-            df = self.__build_transferred_cols(
-                columns,
-                t.cast(pd.DataFrame, df),
-                styles=payload.get("styles"),
-                tooltips=payload.get("tooltips"),
-                is_copied=is_copied,
-                new_indexes=t.cast(np.ndarray, new_indexes),
-                handle_nan=payload.get("handlenan", False),
-                formats=payload.get("formats"),
-            )
+                page_indexes = new_indexes
+                if _PandasDataAccessor.__INDEX_COL not in df.columns:
+                    # only add the index column to the rows that are sent
+                    df = df.iloc[new_indexes]
+                    df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+                    page_indexes = None
+                    is_copied = True
+                df = self.__build_transferred_cols(
+                    columns,
+                    t.cast(pd.DataFrame, df),
+                    styles=payload.get("styles"),
+                    tooltips=payload.get("tooltips"),
+                    is_copied=is_copied,
+                    new_indexes=t.cast(np.ndarray, page_indexes),
+                    handle_nan=payload.get("handlenan", False),
+                    formats=payload.get("formats"),
+                )
             dict_ret = self.__format_data(
                 df,
                 data_format,
@@ -387,10 +507,18 @@ class _PandasDataAccessor(_DataAccessor):
                         _warn("Pandas accessor compare raised an exception", e)
 
         else:
+            df, is_copied = self.__filter(df, payload)
             ret_payload["alldata"] = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
             decimators = decimator_payload.get("decimators", [])
             decimated_dfs: t.List[pd.DataFrame] = []
+            # identifies the filtered data of this variable, at its current version, for the decimators
+            data_key = (
+                f"{col_prefix}{var_name}",
+                id(orig_df),
+                self.__data_versions.get(var_name),
+                _QueryCache.fingerprint(payload, ("filters",)),
+            )
             for decimator_pl in decimators:
                 if decimator_pl is None:
                     continue
@@ -412,7 +540,7 @@ class _PandasDataAccessor(_DataAccessor):
                     # Run the on_decimate method -> check if the decimator should be applied
                     # -> apply the decimator
                     decimated_df, is_decimator_applied, is_copied = decimator_instance._on_decimate(
-                        df, decimator_pl, decimator_payload, is_copied
+                        df, {**decimator_pl, Decimator._DATA_KEY: data_key}, decimator_payload, is_copied
                     )
                     # add decimated dataframe to the list of decimated
                     decimated_dfs.append(decimated_df)
@@ -487,7 +615,65 @@ class _PandasDataAccessor(_DataAccessor):
                 return ret_payload
             else:
                 value = value[0]
-        return self.__get_data(var_name, self.__to_dataframe(value), payload, data_format)
+        if not self.__is_delta_tracked(payload, data_format):
+            return self.__get_data(var_name, self.__to_dataframe(value), payload, data_format)
+        # keep the payload as it was received: it is used again to compute the changes of this page
+        tracked_payload = {**payload, "columns": list(payload.get("columns", []))}
+        ret_payload = self.__get_data(var_name, self.__to_dataframe(value), payload, data_format)
+        self.__delta_tracker.record(self.__get_client_id(), var_name, tracked_payload, ret_payload["value"])
+        return ret_payload
+
+    def __is_delta_tracked(self, payload: t.Dict[str, t.Any], data_format: _DataFormat) -> bool:
+        if data_format is not _DataFormat.JSON or not self._gui._get_config("data_delta_updates", False):
+            return False
+        if payload.get("infinite") or isinstance(payload.get("compare"), str):
+            return False
+        if payload.get("alldata", False):
+            # decimated data is entirely different when data changes
+            decimators = payload.get("decimatorPayload", {}).get("decimators", [])
+            return not any(d and d.get("decimator") for d in decimators)
+        return True
+
+    def get_delta(self, var_name: str, value: t.Any, data_format: _DataFormat) -> t.Optional[t.Dict[str, t.Any]]:
+        if data_format is not _DataFormat.JSON or not isinstance(value, _PandasDataAccessor.__types):
+            return None
+        client_id = self.__get_client_id()
+        pages = self.__delta_tracker.get_pages(client_id, var_name)
+        if not pages:
+            return None
+        df = self.__to_dataframe(value)
+        deltas: t.Dict[str, t.Any] = {}
+        new_values: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for page_key, page in pages.items():
+            payload = {**page.payload, "columns": list(page.payload.get("columns", []))}
+            new_value = self.__get_data(var_name, df, payload, data_format)["value"]
+            delta = self.__get_page_delta(page, new_value)
+            if delta is None:
+                # the client refreshes its pages, which will be tracked again when requested
+                self.__delta_tracker.invalidate(client_id, var_name)
+                return None
+            deltas[page_key] = delta
+            new_values[page_key] = new_value
+        for page_key, page in pages.items():
+            self.__delta_tracker.record(client_id, var_name, page.payload, new_values[page_key])
+        return deltas
+
+    def __get_page_delta(self, old: _SentPage, new: t.Dict[str, t.Any]) -> t.Optional[t.Dict[str, t.Any]]:
+        new_data = new.get("data")
+        if old.rows is not None and isinstance(new_data, list):
+            if old.start != new.get("start"):
+                return None
+            rows = _DeltaTracker.diff_records(old.rows, new_data, _PandasDataAccessor.__DELTA_MAX_RATIO)
+            if rows is None:
+                return None
+            delta: t.Dict[str, t.Any] = {"rows": rows, "rowcount": new.get("rowcount")}
+            if "fullrowcount" in new:
+                delta["fullrowcount"] = new["fullrowcount"]
+            return delta
+        if old.columns is not None and isinstance(new_data, dict):
+            appended = _DeltaTracker.diff_columns(old.columns, new_data, _PandasDataAccessor.__DELTA_MAX_RATIO)
+            return None if appended is None else {"append": appended}
+        return None
 
     def on_edit(self, value: t.Any, payload: t.Dict[str, t.Any]):
         df = self.to_pandas(value)
@@ -0,0 +1,75 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import threading
+import typing as t
+import weakref
+from collections import OrderedDict
+
+
+class _QueryCache(object):
+    """LRU cache of query results, per client and variable.
+
+    An entry is only returned if it was computed from the very same data object (tracked with a weak
+    reference), at the same version of its variable and from a payload with the same fingerprint.
+    The version of a variable changes when it is updated, so that in-place modifications of the data
+    are taken into account by all the clients.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[t.Tuple[str, str], t.Tuple[t.Any, int, str, t.Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(payload: t.Dict[str, t.Any], keys: t.Iterable[str]) -> str:
+        return json.dumps({k: payload.get(k) for k in keys}, sort_keys=True, default=str)
+
+    def get(self, client_id: str, var_name: str, data: t.Any, version: int, fingerprint: str) -> t.Optional[t.Any]:
+        key = (client_id, var_name)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            data_ref, entry_version, entry_fingerprint, result = entry
+            if data_ref() is not data or entry_version != version or entry_fingerprint != fingerprint:
+                return None
+            self.__entries.move_to_end(key)
+            return result
+
+    def set(self, client_id: str, var_name: str, data: t.Any, version: int, fingerprint: str, result: t.Any) -> None:
+        try:
+            data_ref = weakref.ref(data)
+        except TypeError:
+            return
+        key = (client_id, var_name)
+        with self.__lock:
+            self.__entries[key] = (data_ref, version, fingerprint, result)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, var_name: t.Optional[str] = None) -> None:
+        """Drop the entries of *var_name* (or of all variables) for all the clients."""
+        self.__drop(lambda key: var_name is None or key[1] == var_name)
+
+    def forget(self, client_id: str) -> None:
+        """Drop the entries of a client."""
+        self.__drop(lambda key: key[0] == client_id)
+
+    def __drop(self, predicate: t.Callable[[t.Tuple[str, str]], bool]) -> None:
+        with self.__lock:
+            for key in [k for k in self.__entries if predicate(k)]:
+                del self.__entries[key]
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -26,7 +26,7 @@ from importlib import metadata, util
 from importlib.util import find_spec
 from inspect import currentframe, getabsfile, ismethod, ismodule
 from pathlib import Path
-from threading import Thread, Timer
+from threading import Lock, Thread, Timer
 from types import FrameType, FunctionType, LambdaType, ModuleType, SimpleNamespace
 from urllib.parse import unquote, urlencode, urlparse
 
@@ -38,8 +38,8 @@ from flask import (
     g,
     has_app_context,
     jsonify,
+    make_response,
     request,
-    send_file,
     send_from_directory,
 )
 from werkzeug.utils import secure_filename
@@ -57,7 +57,7 @@ from ._page import _Page
 from ._renderers import _EmptyPage
 from ._renderers._markdown import _TaipyMarkdownExtension
 from ._renderers.factory import _Factory
-from ._renderers.json import _TaipyJsonEncoder
+from ._renderers.json import _JsonFragment, _TaipyJsonEncoder, _to_json
 from ._renderers.utils import _get_columns_dict
 from ._warnings import TaipyGuiWarning, _warn
 from .builder import _ElementApiGenerator
@@ -111,7 +111,11 @@ from .utils import (
 from .utils._adapter import _Adapter
 from .utils._bindings import _Bindings
 from .utils._evaluator import _Evaluator
+from .utils._long_callback_executor import _LongCallbackExecutor
+from .utils._render_cache import _BindingRecorder
+from .utils._upload_sessions import _UploadSessions
 from .utils._variable_directory import _is_moduled_variable, _VariableDirectory
+from .utils._ws_scheduler import _WsScheduler
 from .utils.chart_config_builder import _build_chart_config
 from .utils.table_col_builder import _enhance_columns
 
@@ -360,6 +364,19 @@ class Gui:
 
         # sid from client_id
         self.__client_id_2_sid: t.Dict[str, t.Set[str]] = {}
+        # outgoing messages
+        self.__ws_scheduler = _WsScheduler(
+            self.__emit_ws,
+            lambda fn: self._server._ws.start_background_task(fn),
+            lambda seconds: self._server._ws.sleep(seconds),
+        )
+        # long-running callbacks, created when first used
+        self.__long_callback_executor: t.Optional[_LongCallbackExecutor] = None
+        self.__long_callback_lock = Lock()
+        # bindings made while rendering pages
+        self.__binding_recorder = _BindingRecorder()
+        # chunked file uploads
+        self.__upload_sessions = _UploadSessions()
 
         # Load default config
         self._flask_blueprint: t.List[Blueprint] = []
@@ -653,64 +670,68 @@ class Gui:
             try:
                 del self.__client_id_2_sid[client_id]
                 self._bindings()._delete_scope(client_id)
+                self.__ws_scheduler.forget(client_id)
+                self._get_accessor().forget(client_id)
             except Exception as e:
                 _warn(f"Unexpected error removing state {client_id}", e)
 
     def _manage_message(self, msg_type: _WsType, message: dict) -> None:
-        try:
-            client_id = None
-            if msg_type == _WsType.CLIENT_ID.value:
-                res = self._bindings()._get_or_create_scope(message.get("payload", ""))
-                client_id = res[0] if res[1] else None
-            expected_client_id = client_id or message.get(Gui.__ARG_CLIENT_ID)
-            self.__set_client_id_in_context(expected_client_id)
-            g.ws_client_id = expected_client_id
-            with self._set_locals_context(message.get("module_context") or None):
-                with self._get_authorization():
-                    payload = message.get("payload", {})
-                    if msg_type == _WsType.UPDATE.value:
-                        self.__front_end_update(
-                            str(message.get("name")),
-                            payload.get("value"),
-                            message.get("propagate", True),
-                            payload.get("relvar"),
-                            payload.get("on_change"),
+        # messages sent while processing this message are sent together when it is processed
+        with self.__ws_scheduler.tick():
+            try:
+                client_id = None
+                if msg_type == _WsType.CLIENT_ID.value:
+                    res = self._bindings()._get_or_create_scope(message.get("payload", ""))
+                    client_id = res[0] if res[1] else None
+                expected_client_id = client_id or message.get(Gui.__ARG_CLIENT_ID)
+                self.__set_client_id_in_context(expected_client_id)
+                g.ws_client_id = expected_client_id
+                with self._set_locals_context(message.get("module_context") or None):
+                    with self._get_authorization():
+                        payload = message.get("payload", {})
+                        if msg_type == _WsType.UPDATE.value:
+                            self.__front_end_update(
+                                str(message.get("name")),
+                                payload.get("value"),
+                                message.get("propagate", True),
+                                payload.get("relvar"),
+                                payload.get("on_change"),
+                            )
+                        elif msg_type == _WsType.ACTION.value:
+                            self.__on_action(message.get("name"), message.get("payload"))
+                        elif msg_type == _WsType.DATA_UPDATE.value:
+                            self.__request_data_update(str(message.get("name")), message.get("payload"))
+                        elif msg_type == _WsType.REQUEST_UPDATE.value:
+                            self.__request_var_update(message.get("payload"))
+                        elif msg_type == _WsType.GET_MODULE_CONTEXT.value:
+                            self.__handle_ws_get_module_context(payload)
+                        elif msg_type == _WsType.GET_DATA_TREE.value:
+                            self.__handle_ws_get_data_tree()
+                        elif msg_type == _WsType.APP_ID.value:
+                            self.__handle_ws_app_id(message)
+                        elif msg_type == _WsType.GET_ROUTES.value:
+                            self.__handle_ws_get_routes()
+                        else:
+                            self._manage_external_message(msg_type, message)
+                    self.__send_ack(message.get("ack_id"))
+            except Exception as e:  # pragma: no cover
+                if isinstance(e, AttributeError) and (name := message.get("name")):
+                    try:
+                        names = self._get_real_var_name(name)
+                        var_name = names[0] if isinstance(names, tuple) else names
+                        var_context = names[1] if isinstance(names, tuple) else None
+                        if var_name.startswith("tpec_"):
+                            var_name = var_name[5:]
+                        if var_name.startswith("TpExPr_"):
+                            var_name = var_name[7:]
+                        _warn(
+                            f"A problem occurred while resolving variable '{var_name}'"
+                            + (f" in module '{var_context}'." if var_context else ".")
                         )
-                    elif msg_type == _WsType.ACTION.value:
-                        self.__on_action(message.get("name"), message.get("payload"))
-                    elif msg_type == _WsType.DATA_UPDATE.value:
-                        self.__request_data_update(str(message.get("name")), message.get("payload"))
-                    elif msg_type == _WsType.REQUEST_UPDATE.value:
-                        self.__request_var_update(message.get("payload"))
-                    elif msg_type == _WsType.GET_MODULE_CONTEXT.value:
-                        self.__handle_ws_get_module_context(payload)
-                    elif msg_type == _WsType.GET_DATA_TREE.value:
-                        self.__handle_ws_get_data_tree()
-                    elif msg_type == _WsType.APP_ID.value:
-                        self.__handle_ws_app_id(message)
-                    elif msg_type == _WsType.GET_ROUTES.value:
-                        self.__handle_ws_get_routes()
-                    else:
-                        self._manage_external_message(msg_type, message)
-                self.__send_ack(message.get("ack_id"))
-        except Exception as e:  # pragma: no cover
-            if isinstance(e, AttributeError) and (name := message.get("name")):
-                try:
-                    names = self._get_real_var_name(name)
-                    var_name = names[0] if isinstance(names, tuple) else names
-                    var_context = names[1] if isinstance(names, tuple) else None
-                    if var_name.startswith("tpec_"):
-                        var_name = var_name[5:]
-                    if var_name.startswith("TpExPr_"):
-                        var_name = var_name[7:]
-                    _warn(
-                        f"A problem occurred while resolving variable '{var_name}'"
-                        + (f" in module '{var_context}'." if var_context else ".")
-                    )
-                except Exception as e1:
-                    _warn(f"Resolving  name '{name}' failed", e1)
-            else:
-                _warn(f"Decoding Message has failed: {message}", e)
+                    except Exception as e1:
+                        _warn(f"Resolving  name '{name}' failed", e1)
+                else:
+                    _warn(f"Decoding Message has failed: {message}", e)
 
     # To be expanded by inheriting classes
     # this will be used to handle ws messages that is not handled by the base Gui class
@@ -912,7 +933,13 @@ class Gui:
                 if ret is None:
                     _warn(f"{cb_function_name}() callback function must return a value.")
                 else:
-                    return (ret, 200)
+                    response = make_response(ret)
+                    # let the client revalidate the content it already has
+                    if response.status_code == 200 and not response.is_streamed and not response.direct_passthrough:
+                        response.add_etag()
+                        response.cache_control.no_cache = True
+                        response.make_conditional(request)
+                    return response
             except Exception as e:  # pragma: no cover
                 if not self._call_on_exception(cb_function_name, e):
                     _warn(f"{cb_function_name}() callback function raised an exception", e)
@@ -928,7 +955,7 @@ class Gui:
                 try:
                     resource_name = library.get_resource("/".join(parts[1:]))
                     if resource_name:
-                        return send_file(resource_name)
+                        return _Server._send_static_file(str(resource_name))
                 except Exception as e:
                     last_error = f"\n{e}"  # Check if the resource is served by another library with the same name
         _warn(f"Resource '{resource_name or path}' not accessible for library '{parts[0]}'{last_error}")
@@ -997,32 +1024,34 @@ class Gui:
         if file.filename == "":
             _warn("upload files: No selected file")
             return ("upload files: No selected file", 400)
-        suffix = ""
-        complete = True
-        part = 0
-        if "total" in request.form:
-            total = int(request.form["total"])
-            if total > 1 and "part" in request.form:
-                part = int(request.form["part"])
-                suffix = f".part.{part}"
-                complete = part == total - 1
+        total = int(request.form.get("total", 1))
         if file:  # and allowed_file(file.filename)
             upload_path = Path(self._get_config("upload_folder", tempfile.gettempdir())).resolve()
-            file_path = _get_non_existent_file_path(upload_path, secure_filename(file.filename))
-            file.save(str(upload_path / (file_path.name + suffix)))
-            if complete:
-                if part > 0:
-                    try:
-                        with open(file_path, "wb") as grouped_file:
-                            for nb in range(part + 1):
-                                part_file_path = upload_path / f"{file_path.name}.part.{nb}"
-                                with open(part_file_path, "rb") as part_file:
-                                    grouped_file.write(part_file.read())
-                                # remove file_path after it is merged
-                                part_file_path.unlink()
-                    except EnvironmentError as ee:  # pragma: no cover
-                        _warn(f"Cannot group file after chunk upload for {file.filename}", ee)
-                        return (f"Cannot group file after chunk upload for {file.filename}", 500)
+            file_name = secure_filename(file.filename)
+            if total > 1:
+                offset = request.form.get("offset", None)
+                size = request.form.get("size", None)
+                try:
+                    file_path = self.__upload_sessions.write_chunk(
+                        request.form.get("upload_id", None) or f"{self._get_client_id()}-{file_name}",
+                        upload_path,
+                        file_name,
+                        file.stream,
+                        int(request.form.get("part", 0)),
+                        total,
+                        None if offset is None else int(offset),
+                        None if size is None else int(size),
+                    )
+                except ValueError as ve:
+                    _warn(f"Invalid chunk of uploaded file {file.filename}", ve)
+                    return (f"Invalid chunk of uploaded file {file.filename}", 400)
+                except EnvironmentError as ee:  # pragma: no cover
+                    _warn(f"Cannot write chunk of uploaded file {file.filename}", ee)
+                    return (f"Cannot write chunk of uploaded file {file.filename}", 500)
+            else:
+                file_path = _get_non_existent_file_path(upload_path, file_name)
+                file.save(str(file_path))
+            if file_path is not None:
                 # notify the file is uploaded
                 newvalue = str(file_path)
                 if multiple and var_name:
@@ -1062,6 +1091,10 @@ class Gui:
         if not values:
             return
         for k, v in values.items():
+            if isinstance(v, _TaipyData):
+                # the data may have been modified in place
+                self._get_accessor().invalidate_cache(k)
+                self._get_accessor().invalidate_cache(v.get_name())
             if isinstance(v, (_TaipyData, _TaipyContentHtml)) and v.get_name() in modified_vars:
                 modified_vars.remove(v.get_name())
             elif isinstance(v, _DoNotUpdate):
@@ -1071,7 +1104,8 @@ class Gui:
             resource_handler = get_current_resource_handler()
             custom_page_filtered_types = resource_handler.data_layer_supported_types if resource_handler else ()
             if isinstance(newvalue, (_TaipyData)) or isinstance(newvalue, custom_page_filtered_types):
-                newvalue = {"__taipy_refresh": True}
+                delta = self.__get_data_delta(_var, newvalue)
+                newvalue = {"__taipy_delta": delta} if delta else {"__taipy_refresh": True}
             else:
                 if isinstance(newvalue, (_TaipyContent, _TaipyContentImage)):
                     ret_value = self.__get_content_accessor().get_info(
@@ -1101,7 +1135,10 @@ class Gui:
                     debug_warnings: t.List[warnings.WarningMessage] = []
                     with warnings.catch_warnings(record=True) as warns:
                         warnings.resetwarnings()
-                        json.dumps(newvalue, cls=_TaipyJsonEncoder)
+                        # the value is serialized once: the result is sent as is
+                        encoded = _to_json(newvalue)
+                        if not isinstance(newvalue, dict) or "value" not in newvalue:
+                            newvalue = _JsonFragment(encoded)
                         if len(warns):
                             keep_value = True
                             for w in warns:
@@ -1119,6 +1156,18 @@ class Gui:
         # TODO: What if value == newvalue?
         self.__send_ws_update_with_dict(ws_dict)
 
+    def __get_data_delta(self, var_name: str, value: t.Any) -> t.Optional[t.Dict[str, t.Any]]:
+        # the changes are computed for the pages sent to the current client only
+        if not isinstance(value, _TaipyData) or self._is_broadcasting():
+            return None
+        if not self._get_config("data_delta_updates", False):
+            return None
+        try:
+            return self._get_accessor().get_delta(var_name, value)
+        except Exception as e:  # pragma: no cover
+            _warn(f"Computing the changes of {var_name} failed", e)
+            return None
+
     def __update_state_context(self, payload: dict):
         # apply state context if any
         state_context = payload.get("state_context")
@@ -1280,40 +1329,70 @@ class Gui:
             send_back_only=True,
         )
 
+    def __emit_ws(self, payload: dict, to: t.Any) -> None:
+        try:
+            self._server._ws.emit("message", payload, to=t.cast(str, to))
+            # yield to the server (in cooperative async modes) without blocking
+            self._server._ws.sleep(0)
+        except Exception as e:  # pragma: no cover
+            _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
+
     def __send_ws(self, payload: dict, allow_grouping=True, send_back_only=False) -> None:
         grouping_message = self.__get_message_grouping() if allow_grouping else None
         if grouping_message is None:
-            try:
-                self._server._ws.emit(
-                    "message",
-                    payload,
-                    to=t.cast(str, self.__get_ws_receiver(send_back_only)),
-                )
-                time.sleep(0.001)
-            except Exception as e:  # pragma: no cover
-                _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
+            self.__ws_scheduler.send(self._get_client_id(), payload, self.__get_ws_receiver(send_back_only))
         else:
             grouping_message.append(payload)
 
     def __broadcast_ws(self, payload: dict, client_id: t.Optional[str] = None):
+        # messages already queued must be sent first
+        self.__ws_scheduler.flush()
         try:
             to = list(self.__get_sids(client_id)) if client_id else []
             self._server._ws.emit("message", payload, to=t.cast(str, to) if to else None, include_self=True)
-            time.sleep(0.001)
+            self._server._ws.sleep(0)
         except Exception as e:  # pragma: no cover
             _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
 
     def __send_ack(self, ack_id: t.Optional[str]) -> None:
         if ack_id:
-            try:
-                self._server._ws.emit(
-                    "message",
-                    {"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id},
-                    to=t.cast(str, self.__get_ws_receiver(True)),
+            self.__ws_scheduler.send(
+                self._get_client_id(),
+                {"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id},
+                self.__get_ws_receiver(True),
+            )
+
+    def _get_ws_queue_metrics(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Return the outgoing message queue metrics of each client.
+
+        For each client id, the returned dictionary holds the current (*depth*) and maximum
+        (*max_depth*) number of queued messages, the number of messages *sent* and the number
+        of variable updates that were *coalesced* with a later one.
+        """
+        return self.__ws_scheduler.get_metrics()
+
+    def _ws_tick(self):
+        """Return a context where the messages sent to the clients are coalesced."""
+        return self.__ws_scheduler.tick()
+
+    def _get_long_callback_executor(self) -> _LongCallbackExecutor:
+        with self.__long_callback_lock:
+            if self.__long_callback_executor is None:
+                self.__long_callback_executor = _LongCallbackExecutor(
+                    self._get_config("long_callback_workers", 0),
+                    self._get_config("long_callback_processes", False),
                 )
-                time.sleep(0.001)
-            except Exception as e:  # pragma: no cover
-                _warn(f"Exception raised in WebSocket communication (send ack) in '{self.__frame.f_code.co_name}'", e)
+            return self.__long_callback_executor
+
+    def _get_long_callback_metrics(self) -> t.Dict[str, t.Union[int, float]]:
+        """Return the long-running callback pool metrics.
+
+        The returned dictionary holds the pool size (*workers*), the number of *busy* workers and
+        of *queued* tasks, the number of tasks *submitted*, *completed*, *failed* and *cancelled*,
+        and the total (*total_queue_wait*) and maximum (*max_queue_wait*) time, in seconds, that
+        tasks waited in the queue.
+        """
+        return self._get_long_callback_executor().get_metrics()
 
     def _send_ws_id(self, id: str) -> None:
         self.__send_ws(
@@ -1625,7 +1704,7 @@ class Gui:
             var_name: The name of the variable to change.
             value: The new value for the variable.
         """
-        self.broadcast_callback(lambda s, n, v: s.assign(n, v), [var_name, value])
+        self.broadcast_changes({var_name: value})
 
     @staticmethod
     def __broadcast_changes_fn(state: State, values: dict[str, t.Any]) -> None:
@@ -1633,6 +1712,29 @@ class Gui:
             for n, v in values.items():
                 state.assign(n, v)
 
+    def __broadcast_shared_changes_fn(
+        self, state: State, values: t.Dict[str, t.Any]
+    ) -> t.Optional[t.Tuple[t.Dict[str, str], bool]]:
+        if any("." in n for n in values):
+            return None
+        encoded_names = {n: self._bind_var(n) for n in values}
+        if self.__evaluator.has_state_specific_dependencies(self, set(encoded_names.values())):
+            return None
+        # values are set in all the states, expressions are evaluated once and the update is sent to all clients
+        try:
+            with state:
+                for n, v in values.items():
+                    # sending an update leaves the broadcast mode: set it for each variable
+                    self._set_broadcast()
+                    state.assign(n, v)
+        finally:
+            self._set_broadcast(False)
+        return encoded_names, _is_function(self._get_user_function("on_change"))
+
+    def __broadcast_on_change_fn(self, state: State, encoded_names: t.Dict[str, str], values: t.Dict[str, t.Any]):
+        for n, v in values.items():
+            self._call_on_change(encoded_names[n], v)
+
     def broadcast_changes(self, values: t.Optional[dict[str, t.Any]] = None, **kwargs):
         """Propagates new values for several variables to all states.
 
@@ -1640,6 +1742,9 @@ class Gui:
         of all the variables that are keys in *values*, in their specific `State^` instance. All
         user interfaces reflect the change.
 
+        If the expressions that depend on these variables do not use variables that have a specific
+        value in each state, they are evaluated once and the update is sent once to all clients.
+
         Arguments:
             values: An optional dictionary where each key is the name of a variable to change, and
                 where the associated value is the new value to set for that variable, in each state
@@ -1652,7 +1757,21 @@ class Gui:
             values = values.copy() if values else {}
             for n, v in kwargs.items():
                 values[n] = v
-        self.broadcast_callback(Gui.__broadcast_changes_fn, [values])
+        if not values:
+            return
+        client_ids = [id for id in self.__bindings._get_all_scopes() if id != _DataScopes._GLOBAL_ID]
+        if not client_ids:
+            return
+        shared = self.invoke_callback(client_ids[0], self.__broadcast_shared_changes_fn, [values])
+        if shared is None:
+            # some expressions have a specific value in each state
+            self.broadcast_callback(Gui.__broadcast_changes_fn, [values])
+            return
+        encoded_names, has_on_change = shared
+        if has_on_change:
+            # on_change is still invoked for each state
+            for id in client_ids[1:]:
+                self.invoke_callback(id, self.__broadcast_on_change_fn, [encoded_names, values])
 
     def _is_in_brdcst_callback(self):
         try:
@@ -1664,7 +1783,7 @@ class Gui:
     def _evaluate_expr(
         self, expr: str, lazy_declare: t.Optional[bool] = False, lambda_expr: t.Optional[bool] = False
     ) -> t.Any:
-        return self.__evaluator.evaluate_expr(self, expr, lazy_declare, lambda_expr)
+        return self.__binding_recorder.call(self.__evaluator.evaluate_expr, self, expr, lazy_declare, lambda_expr)
 
     def _re_evaluate_expr(self, var_name: str) -> t.Set[str]:
         return self.__evaluator.re_evaluate_expr(self, var_name)
@@ -1676,10 +1795,13 @@ class Gui:
         return self.__evaluator.get_expr_from_hash(hash_val)
 
     def _evaluate_bind_holder(self, holder: t.Type[_TaipyBase], expr: str) -> str:
-        return self.__evaluator.evaluate_bind_holder(self, holder, expr)
+        return self.__binding_recorder.call(self.__evaluator.evaluate_bind_holder, self, holder, expr)
 
     def _evaluate_holders(self, expr: str) -> t.List[str]:
-        return self.__evaluator.evaluate_holders(self, expr)
+        return self.__binding_recorder.call(self.__evaluator.evaluate_holders, self, expr)
+
+    def _record_bindings(self):
+        return self.__binding_recorder.record()
 
     def _is_expression(self, expr: str) -> bool:
         if self.__evaluator is None:
@@ -2144,6 +2266,9 @@ class Gui:
 
     # Main binding method (bind in markdown declaration)
     def _bind_var(self, var_name: str) -> str:
+        return self.__binding_recorder.call(self.__bind_var, var_name)
+
+    def __bind_var(self, var_name: str) -> str:
         bind_context = None
         if var_name in self._get_locals_bind().keys():
             bind_context = self._get_locals_context()
@@ -2162,6 +2287,9 @@ class Gui:
         return encoded_var_name
 
     def _bind_var_val(self, var_name: str, value: t.Any) -> bool:
+        return self.__binding_recorder.call(self.__bind_var_val, var_name, value)
+
+    def __bind_var_val(self, var_name: str, value: t.Any) -> bool:
         if not _is_moduled_variable(var_name):
             var_name = self.__var_dir.add_var(var_name, self._get_locals_context())
         if not hasattr(self._bindings(), var_name):
@@ -2711,6 +2839,10 @@ class Gui:
                   the Flask reloader (the *use_reloader* option) and Debug mode (the *debug* option).
                 - "eventlet": Use an [*eventlet*](https://flask.palletsprojects.com/en/2.2.x/deploying/eventlet/)
                   event-driven WSGI server.
+                - "asgi": Use an asyncio-based Socket.IO server, run by [uvicorn](https://www.uvicorn.org/).
+                  Websocket messages are handled by the event loop and the callbacks run in a thread pool,
+                  so that a slow callback does not block the other clients. This requires the *asgi* extra
+                  (`pip install taipy[asgi]`).
 
                 The default value is "gevent"<br/>
                 Note that only the "threading" value provides support for the development reloader
@@ -2861,6 +2993,9 @@ class Gui:
         """
         if hasattr(self, "_server") and hasattr(self._server, "_thread") and self._server._is_running:
             self._server.stop_thread()
+            for page in [*self._config.pages, *self._config.partials]:
+                if page is not None:
+                    page._clear_render_cache()
             self.run(**self.__run_kwargs, _reload=True)
             _TaipyLogger._get_logger().info("Gui server has been reloaded.")
 
@@ -2875,6 +3010,10 @@ class Gui:
         if hasattr(self, "_server") and hasattr(self._server, "_thread") and self._server._is_running:
             self._server.stop_thread()
             _TaipyLogger._get_logger().info("Gui server has been stopped.")
+        with self.__long_callback_lock:
+            if self.__long_callback_executor is not None:
+                self.__long_callback_executor.shutdown()
+                self.__long_callback_executor = None
 
     def _get_authorization(self, client_id: t.Optional[str] = None, system: t.Optional[bool] = False):
         try:
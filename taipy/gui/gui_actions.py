@@ -15,6 +15,8 @@ import typing as t
 from ._warnings import _warn
 from .gui import Gui
 from .state import State
+from .utils import _function_name
+from .utils._long_callback_executor import _LongCallbackTask
 
 
 def download(
@@ -329,10 +331,14 @@ def invoke_long_callback(
     user_status_function: t.Optional[t.Callable] = None,
     user_status_function_args: t.Optional[t.Union[t.Tuple, t.List]] = None,
     period=0,
-):
+    pass_task: bool = False,
+) -> t.Optional[_LongCallbackTask]:
     """Invoke a long-running user callback.
 
-    Long-running callbacks are run in a separate thread to not block the application itself.
+    Long-running callbacks are run by a pool of workers to not block the application itself.
+    The size of this pool is set by the *long_callback_workers* configuration parameter, and
+    the *long_callback_processes* parameter selects a pool of processes instead of threads.
+    When all workers are busy, the callbacks are queued and each client gets its turn.
 
     This function expects to be provided a function to run in the background (in *user_function*).<br/>
     It can also be specified a *status function* that is called when the operation performed by
@@ -351,24 +357,36 @@ def invoke_long_callback(
             function that is invoked at the end of and possibly during the runtime of *user_function*:
 
             - The first parameter of this function is set to a `State^` instance.
-            - The second parameter of this function is set to a bool or an int, depending on the
+            - The second parameter of this function is set to a bool, an int or a float, depending on the
               conditions under which it is called:
 
                - If this parameter is set to a bool value, then:
 
                    - If True, this indicates that *user_function* has finished properly.
                         The last argument passed will be the result of the user_function call.
-                   - If False, this indicates that *user_function* failed.
+                   - If False, this indicates that *user_function* failed or was cancelled.
 
                - If this parameter is set to an int value, then this value indicates
                  how many periods (as lengthy as indicated in *period*) have elapsed since *user_function* was
                  started.
+               - If this parameter is set to a float value, then this value is the last progress
+                 reported by *user_function* with the *set_progress()* method of its task.
         user_status_function_args (Optional[List|Tuple]): The remaining arguments of the user status function.
         period (int): The interval, in milliseconds, at which *user_status_function* is called.<br/>
             The default value is 0, meaning no call to *user_status_function* will happen until *user_function*
             terminates (then the second parameter of that call will be ).</br>
             When set to a value smaller than 500, *user_status_function* is called only when *user_function*
             terminates (as if *period* was set to 0).
+        pass_task (bool): If True, the task returned by this function is provided to *user_function*
+            in its *task* keyword argument.<br/>
+            *user_function* can then call *task.is_cancelled()* to stop early, and
+            *task.set_progress()* to report its progress to *user_status_function*. These reports are
+            coalesced and sent to the client at most every 100 milliseconds.<br/>
+            The task cannot be provided to functions running in a pool of processes.
+
+    Returns:
+        The task running *user_function*, or None if it could not be started. Its *cancel()* method
+        prevents a queued task from running, and requests a running task to stop.
     """
     if not state or not isinstance(state._gui, Gui):
         _warn("'invoke_long_callback()' must be called in the context of a callback.")
@@ -381,7 +399,7 @@ def invoke_long_callback(
     state_id = get_state_id(state)
     module_context = get_module_context(state)
     if not isinstance(state_id, str) or not isinstance(module_context, str):
-        return
+        return None
 
     this_gui = state._gui
 
@@ -390,43 +408,60 @@ def invoke_long_callback(
             _warn(f"invoke_long_callback(): Exception raised in function {function_name}()", e)
 
     def callback_on_status(
-        status: t.Union[int, bool],
+        status: t.Union[int, bool, float],
         e: t.Optional[Exception] = None,
         function_name: t.Optional[str] = None,
         function_result: t.Optional[t.Any] = None,
     ):
-        if callable(user_status_function):
-            this_gui.invoke_callback(
-                str(state_id),
-                user_status_function,
-                [status] + list(user_status_function_args) + [function_result],  # type: ignore
-                str(module_context),
-            )
-        if e:
-            this_gui.invoke_callback(
-                str(state_id),
-                callback_on_exception,
-                (
-                    str(function_name),
-                    e,
-                ),
-                str(module_context),
-            )
-
-    def user_function_in_thread(*uf_args):
-        try:
-            res = user_function(*uf_args)
-            callback_on_status(True, function_result=res)
-        except Exception as e:
-            callback_on_status(False, e, user_function.__name__)
-
-    def thread_status(name: str, period_s: float, count: int):
-        active_thread = next((t for t in threading.enumerate() if t.name == name), None)
-        if active_thread:
+        # the updates made by the status function are sent to the client together
+        with this_gui.get_flask_app().app_context(), this_gui._ws_tick():
+            if callable(user_status_function):
+                this_gui.invoke_callback(
+                    str(state_id),
+                    user_status_function,
+                    [status] + list(user_status_function_args) + [function_result],  # type: ignore
+                    str(module_context),
+                )
+            if e:
+                this_gui.invoke_callback(
+                    str(state_id),
+                    callback_on_exception,
+                    (
+                        str(function_name),
+                        e,
+                    ),
+                    str(module_context),
+                )
+
+    def on_done(task: _LongCallbackTask, success: bool, result: t.Any, e: t.Optional[Exception]):
+        if success:
+            callback_on_status(True, function_result=result)
+        else:
+            callback_on_status(False, e, _function_name(user_function) if e else None)
+
+    executor = this_gui._get_long_callback_executor()
+    if pass_task and executor.uses_processes():
+        _warn("invoke_long_callback(): The task cannot be provided to a function running in a process pool.")
+        pass_task = False
+    task = _LongCallbackTask(
+        str(state_id),
+        user_function,
+        list(user_function_args),
+        {},
+        on_done,
+        callback_on_status if callable(user_status_function) else None,
+    )
+    if pass_task:
+        task.kwargs["task"] = task
+    executor.submit(task)
+
+    def task_status(period_s: float, count: int):
+        if not task.is_done():
             callback_on_status(count)
-            threading.Timer(period_s, thread_status, (name, period_s, count + 1)).start()
+            timer = threading.Timer(period_s, task_status, (period_s, count + 1))
+            timer.daemon = True
+            timer.start()
 
-    thread = threading.Thread(target=user_function_in_thread, args=user_function_args)
-    thread.start()
     if isinstance(period, int) and period >= 500 and callable(user_status_function):
-        thread_status(thread.name, period / 1000.0, 0)
+        task_status(period / 1000.0, 0)
+    return task
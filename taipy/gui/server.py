@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import mimetypes
 import os
 import pathlib
 import re
@@ -26,11 +27,11 @@ from random import choices, randint
 from flask import (
     Blueprint,
     Flask,
-    json,
     jsonify,
     make_response,
     render_template,
     request,
+    send_file,
     send_from_directory,
 )
 from flask_cors import CORS
@@ -42,7 +43,8 @@ from werkzeug.serving import is_running_from_reloader
 import __main__
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
-from ._renderers.json import _TaipyJsonProvider
+from ._asgi_server import _AsgiSocketIO
+from ._renderers.json import _TaipyJsonProvider, _TaipyWsJson
 from .config import ServerConfig
 from .custom._page import _ExternalResourceHandlerManager
 from .utils import _is_in_notebook, _is_port_open, _RuntimeManager
@@ -58,6 +60,12 @@ class _Server:
     __OPENING_CURLY = r"\1&#x7B;"
     __CLOSING_CURLY = r"&#x7D;\2"
     _RESOURCE_HANDLER_ARG = "tprh"
+    # Precompressed variants of the static files, by order of preference
+    __PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+    # Cache duration of the static files which URL holds a content hash, in seconds
+    __HASHED_MAX_AGE = 365 * 24 * 3600
+    # Query of the bundles URLs emitted by HtmlWebpackPlugin with hash=true: the compilation hash
+    __RE_CONTENT_HASH_QUERY = re.compile(rb"[0-9a-f]{16,}")
 
     def __init__(
         self,
@@ -93,13 +101,17 @@ class _Server:
             "cors_allowed_origins": "*",
             "ping_timeout": 10,
             "ping_interval": 5,
-            "json": json,
+            "json": _TaipyWsJson,
             "async_mode": async_mode,
             "allow_upgrades": allow_upgrades,
         }
         if "socketio" in server_config and isinstance(server_config["socketio"], dict):
             socketio_config.update(server_config["socketio"])
-        self._ws = SocketIO(self._flask, **socketio_config)
+        self._ws: t.Union[SocketIO, _AsgiSocketIO] = (
+            _AsgiSocketIO(self._flask, **socketio_config)
+            if async_mode == _AsgiSocketIO.async_mode
+            else SocketIO(self._flask, **socketio_config)
+        )
 
         self._apply_patch()
 
@@ -144,6 +156,34 @@ class _Server:
             return self._ignore_matches(file_path)
         return False
 
+    @staticmethod
+    def _send_static_file(file_path: str) -> t.Any:
+        """Send a static file, or its precompressed variant if the client accepts its encoding.
+
+        Files requested with a content hash as their query (the bundles referenced by index.html)
+        can be cached by the client for a long time. Other files, including the resources of
+        extension libraries that are only versioned by the library version, are revalidated using
+        their ETag.
+        """
+        max_age = (
+            _Server.__HASHED_MAX_AGE if _Server.__RE_CONTENT_HASH_QUERY.fullmatch(request.query_string) else None
+        )
+        for encoding, suffix in _Server.__PRECOMPRESSED_ENCODINGS:
+            if encoding in request.accept_encodings and os.path.isfile(file_path + suffix):
+                response = send_file(
+                    file_path + suffix,
+                    mimetype=mimetypes.guess_type(file_path)[0] or "application/octet-stream",
+                    max_age=max_age,
+                )
+                response.headers["Content-Encoding"] = encoding
+                break
+        else:
+            response = send_file(file_path, max_age=max_age)
+        response.vary.add("Accept-Encoding")
+        if max_age:
+            response.cache_control.immutable = True
+        return response
+
     def _get_default_blueprint(
         self,
         static_folder: str,
@@ -205,7 +245,7 @@ class _Server:
             if (file_path := str(os.path.normpath((base_path := static_folder + os.path.sep) + path))).startswith(
                 base_path
             ) and os.path.isfile(file_path):
-                return send_from_directory(base_path, path)
+                return _Server._send_static_file(file_path)
             # use the path mapping to detect and find resources
             for k, v in self.__path_mapping.items():
                 if (
@@ -369,7 +409,9 @@ class _Server:
         if hasattr(self, "_thread") and self._thread.is_alive() and self._is_running:
             self._is_running = False
             with contextlib.suppress(Exception):
-                if self._get_async_mode() == "gevent":
+                if isinstance(self._ws, _AsgiSocketIO):
+                    self._ws.stop()
+                elif self._get_async_mode() == "gevent":
                     if self._ws.wsgi_server is not None:  # type: ignore[reportAttributeAccessIssue]
                         self._ws.wsgi_server.stop()  # type: ignore[reportAttributeAccessIssue]
                     else:
@@ -46,6 +46,7 @@ extras_require = {
         "python-magic-bin>=0.4.14,<0.5;platform_system=='Windows'",
     ],
     "arrow": ["pyarrow>=17.0.0,<18.0"],
+    "orjson": ["orjson>=3.9,<4.0"],
 }
 
 def _build_webapp():
@@ -16,6 +16,7 @@ import builtins
 import re
 import typing as t
 import warnings
+from types import CodeType
 
 from .._warnings import TaipyGuiWarning, _warn
 
@@ -53,11 +54,11 @@ class _Evaluator:
         self.__expr_to_hash: t.Dict[str, str] = {}
         # key = hashed value of the expression, value = expression
         self.__hash_to_expr: t.Dict[str, str] = {}
-        # key = variable name of the expression, key = list of related expressions
+        # key = variable name of the expression, value = related expressions (as ordered keys)
         # ex: {x + y}
-        # "x_TPMDL_0": ["{x + y}"],
-        # "y_TPMDL_0": ["{x + y}"],
-        self.__var_to_expr_list: t.Dict[str, t.List[str]] = {}
+        # "x_TPMDL_0": {"{x + y}": None},
+        # "y_TPMDL_0": {"{x + y}": None},
+        self.__var_to_exprs: t.Dict[str, t.Dict[str, None]] = {}
         # key = expression, value = list of related variables
         # "{x + y}": {"x": "x_TPMDL_", "y": "y_TPMDL_0"}
         self.__expr_to_var_map: t.Dict[str, t.Dict[str, str]] = {}
@@ -67,6 +68,10 @@ class _Evaluator:
         self.__expr_to_holders: t.Dict[str, t.Set[t.Type[_TaipyBase]]] = {}
         # shared variables between multiple clients
         self.__shared_variable = shared_variable
+        # key = source of an expression, value = compiled code
+        self.__source_to_code: t.Dict[str, CodeType] = {}
+        # key = expression, value = source to evaluate when a variable it depends on changes
+        self.__expr_to_source: t.Dict[str, str] = {}
 
     @staticmethod
     def _expr_decode(s: str):
@@ -81,6 +86,21 @@ class _Evaluator:
     def get_shared_variables(self) -> t.List[str]:
         return self.__shared_variable
 
+    def has_state_specific_dependencies(self, gui: Gui, var_names: t.Set[str]) -> bool:
+        """Check if an expression depending on one of *var_names* also depends on a variable that may
+        have a different value in each state (a variable that is not in *var_names* nor shared)."""
+        default_module = gui._get_default_module_name()
+        for var_name in var_names:
+            for expr in self.__var_to_exprs.get(var_name, {}):
+                for dependency in self.__expr_to_var_map.get(expr, {}).values():
+                    if dependency in var_names:
+                        continue
+                    name, module_name = _variable_decode(dependency)
+                    if module_name in (None, default_module) and name in self.__shared_variable:
+                        continue
+                    return True
+        return False
+
     def _is_expression(self, expr: str) -> bool:
         return len(_Evaluator.__EXPR_IS_EXPR.findall(expr)) != 0
 
@@ -158,11 +178,7 @@ class _Evaluator:
         self.__hash_to_expr[expr_hash] = expr
         for var in var_map.values():
             if var not in self.__global_ctx.keys():
-                lst = self.__var_to_expr_list.get(var)
-                if lst is None:
-                    self.__var_to_expr_list[var] = [expr]
-                else:
-                    lst.append(expr)
+                self.__var_to_exprs.setdefault(var, {})[expr] = None
         if expr not in self.__expr_to_var_map:
             self.__expr_to_var_map[expr] = var_map
         # save expr_hash to shared variable if valid
@@ -189,11 +205,7 @@ class _Evaluator:
         # expression is only the first part ...
         expr = expr.split(".")[0]
         self.__expr_to_var_map[holder_expr] = {expr: expr}
-        if a_list := self.__var_to_expr_list.get(expr):
-            if holder_expr not in a_list:
-                a_list.append(holder_expr)
-        else:
-            self.__var_to_expr_list[expr] = [holder_expr]
+        self.__var_to_exprs.setdefault(expr, {})[holder_expr] = None
         return hash_name
 
     def evaluate_holders(self, gui: Gui, expr: str) -> t.List[str]:
@@ -258,7 +270,7 @@ class _Evaluator:
             # entries in var_val are not always seen (NameError) when passed as locals
             ctx.update(var_val)
             with gui._get_authorization():
-                expr_evaluated = eval(not_encoded_expr if is_edge_case else expr_string, ctx)
+                expr_evaluated = eval(self.__compile(not_encoded_expr if is_edge_case else expr_string), ctx)
         except Exception as e:
             _warn(f"Cannot evaluate expression '{not_encoded_expr if is_edge_case else expr_string}'", e)
             expr_evaluated = None
@@ -275,18 +287,14 @@ class _Evaluator:
         if not expr:
             return
 
-        expr_decoded, _ = _variable_decode(expr)
         var_map = self.__expr_to_var_map.get(expr, {})
         eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in var_map.items()}
-        if self._is_expression(expr_decoded):
-            expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-        else:
-            expr_string = expr_decoded
+        expr_string = self.__get_expr_source(expr)
         try:
             ctx: t.Dict[str, t.Any] = {}
             ctx.update(self.__global_ctx)
             ctx.update(eval_dict)
-            expr_evaluated = eval(expr_string, ctx)
+            expr_evaluated = eval(self.__compile(expr_string), ctx)
             _setscopeattr(gui, var_name, expr_evaluated)
             if holder is not None:
                 holder.set(expr_evaluated)
@@ -342,28 +350,30 @@ class _Evaluator:
         if "." in var_name:
             var_name = var_name[: var_name.index(".")]
         # otherwise, that var_name is correct and doesn't require any resolution
-        if var_name not in self.__var_to_expr_list:
+        if var_name not in self.__var_to_exprs:
             # _warn("{var_name} not found.")
             return modified_vars
+        # values of the variables the expressions depend on, read once
+        var_values: t.Dict[str, t.Any] = {}
         # refresh expressions and holders
-        for expr in self.__var_to_expr_list[var_name]:
-            expr_decoded, _ = _variable_decode(expr)
+        for expr in list(self.__var_to_exprs[var_name]):
             hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
             if expr != var_name and not expr.startswith(_TaipyBase._HOLDER_PREFIX):
                 expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
                 if expr_var_map is None:
                     _warn(f"Something is amiss with expression list for {expr}.")
                 else:
-                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
-                    if self._is_expression(expr_decoded):
-                        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-                    else:
-                        expr_string = expr_decoded
+                    eval_dict = {}
+                    for k, v in expr_var_map.items():
+                        if v not in var_values:
+                            var_values[v] = _getscopeattr_drill(gui, gui._bind_var(v))
+                        eval_dict[k] = var_values[v]
+                    expr_string = self.__get_expr_source(expr)
                     try:
                         ctx: t.Dict[str, t.Any] = {}
                         ctx.update(self.__global_ctx)
                         ctx.update(eval_dict)
-                        expr_evaluated = eval(expr_string, ctx)
+                        expr_evaluated = eval(self.__compile(expr_string), ctx)
                         _setscopeattr(gui, hash_expr, expr_evaluated)
                     except Exception as e:
                         _warn(f"Exception raised evaluating {expr_string}", e)
@@ -376,5 +386,20 @@ class _Evaluator:
             modified_vars.add(hash_expr)
         return modified_vars
 
+    def __compile(self, source: str) -> CodeType:
+        if (code := self.__source_to_code.get(source)) is None:
+            code = compile(source, "<string>", "eval")
+            self.__source_to_code[source] = code
+        return code
+
+    def __get_expr_source(self, expr: str) -> str:
+        if (source := self.__expr_to_source.get(expr)) is None:
+            expr_decoded, _ = _variable_decode(expr)
+            source = (
+                'f"' + expr_decoded.replace('"', '\\"') + '"' if self._is_expression(expr_decoded) else expr_decoded
+            )
+            self.__expr_to_source[expr] = source
+        return source
+
     def _get_instance_in_context(self, name: str):
         return self.__global_ctx.get(name)
@@ -0,0 +1,227 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+import time
+import typing as t
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+class _LongCallbackTask(object):
+    """A long-running callback submitted to the `_LongCallbackExecutor`.
+
+    The task is returned by `invoke_long_callback()^`. It can be used to cancel the callback, and
+    it can be given to the callback function itself that can then check whether it was cancelled
+    and report its progress.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        function: t.Callable,
+        args: t.Sequence[t.Any],
+        kwargs: t.Dict[str, t.Any],
+        on_done: t.Callable[["_LongCallbackTask", bool, t.Any, t.Optional[Exception]], None],
+        on_progress: t.Optional[t.Callable[[float], None]] = None,
+        progress_interval: float = 0.1,
+    ) -> None:
+        self.client_id = client_id
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.submitted_at = time.monotonic()
+        self.__on_done = on_done
+        self.__on_progress = on_progress
+        self.__progress_interval = progress_interval
+        self.__progress: t.Optional[float] = None
+        self.__progress_timer: t.Optional[threading.Timer] = None
+        self.__lock = threading.Lock()
+        self.__cancelled = threading.Event()
+        self.__done = threading.Event()
+        self.__executor: t.Optional["_LongCallbackExecutor"] = None
+
+    def cancel(self) -> None:
+        """Request the cancellation of this task.
+
+        A task that has not started yet is never run. A running task is expected to check
+        `is_cancelled()` and return early.
+        """
+        self.__cancelled.set()
+        if self.__executor is not None:
+            self.__executor._remove(self)
+
+    def is_cancelled(self) -> bool:
+        """Return True if the cancellation of this task was requested."""
+        return self.__cancelled.is_set()
+
+    def is_done(self) -> bool:
+        """Return True if this task has completed, failed or was cancelled."""
+        return self.__done.is_set()
+
+    def set_progress(self, progress: float) -> None:
+        """Report the progress of this task.
+
+        Consecutive reports are coalesced: the status function receives, at most every
+        *progress_interval* seconds, the last reported value.
+        """
+        if self.__on_progress is None or self.is_done():
+            return
+        with self.__lock:
+            self.__progress = float(progress)
+            if self.__progress_timer is not None:
+                return
+            self.__progress_timer = threading.Timer(self.__progress_interval, self.__send_progress)
+            self.__progress_timer.daemon = True
+        self.__progress_timer.start()
+
+    def __send_progress(self) -> None:
+        with self.__lock:
+            progress, self.__progress = self.__progress, None
+            self.__progress_timer = None
+        if progress is not None and not self.is_done() and self.__on_progress is not None:
+            self.__on_progress(progress)
+
+    def _attach(self, executor: "_LongCallbackExecutor") -> None:
+        self.__executor = executor
+
+    def _done(self, success: bool, result: t.Any = None, e: t.Optional[Exception] = None) -> None:
+        with self.__lock:
+            self.__done.set()
+            if self.__progress_timer is not None:
+                self.__progress_timer.cancel()
+                self.__progress_timer = None
+        self.__on_done(self, success, result, e)
+
+
+class _LongCallbackExecutor(object):
+    """Bounded executor for long-running callbacks.
+
+    Tasks are queued per client, and the workers pick them in turn from each client that has
+    queued tasks, so that a client submitting many tasks does not delay the tasks of the others.
+    Tasks are run in threads, or in a pool of processes if *use_processes* is True. In that case,
+    the callback function and its arguments must be picklable.
+    """
+
+    def __init__(self, max_workers: int = 0, use_processes: bool = False) -> None:
+        self.__max_workers = max_workers if max_workers > 0 else min(32, (os.cpu_count() or 1) + 4)
+        self.__process_pool = ProcessPoolExecutor(self.__max_workers) if use_processes else None
+        self.__queues: t.OrderedDict[str, t.Deque[_LongCallbackTask]] = OrderedDict()
+        self.__condition = threading.Condition()
+        self.__workers: t.List[threading.Thread] = []
+        self.__idle_workers = 0
+        self.__running = 0
+        self.__is_shutdown = False
+        self.__metrics: t.Dict[str, t.Union[int, float]] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "total_queue_wait": 0.0,
+            "max_queue_wait": 0.0,
+        }
+
+    def uses_processes(self) -> bool:
+        return self.__process_pool is not None
+
+    def submit(self, task: _LongCallbackTask) -> _LongCallbackTask:
+        with self.__condition:
+            if self.__is_shutdown:
+                raise RuntimeError("The long callback executor was shut down.")
+            task._attach(self)
+            queue = self.__queues.get(task.client_id)
+            if queue is None:
+                queue = deque()
+                self.__queues[task.client_id] = queue
+            queue.append(task)
+            self.__metrics["submitted"] += 1
+            if self.__idle_workers == 0 and len(self.__workers) < self.__max_workers:
+                worker = threading.Thread(
+                    target=self.__work, name=f"taipy-long-callback-{len(self.__workers)}", daemon=True
+                )
+                self.__workers.append(worker)
+                worker.start()
+            else:
+                self.__condition.notify()
+        return task
+
+    def _remove(self, task: _LongCallbackTask) -> None:
+        with self.__condition:
+            queue = self.__queues.get(task.client_id)
+            if queue is None or task not in queue:
+                return
+            queue.remove(task)
+            if not queue:
+                del self.__queues[task.client_id]
+            self.__metrics["cancelled"] += 1
+        task._done(False)
+
+    def __next_task(self) -> t.Optional[_LongCallbackTask]:
+        with self.__condition:
+            while not self.__queues:
+                if self.__is_shutdown:
+                    return None
+                self.__idle_workers += 1
+                self.__condition.wait()
+                self.__idle_workers -= 1
+            # round-robin across the clients that have queued tasks
+            client_id, queue = next(iter(self.__queues.items()))
+            task = queue.popleft()
+            del self.__queues[client_id]
+            if queue:
+                self.__queues[client_id] = queue
+            self.__running += 1
+            wait = time.monotonic() - task.submitted_at
+            self.__metrics["total_queue_wait"] += wait
+            self.__metrics["max_queue_wait"] = max(self.__metrics["max_queue_wait"], wait)
+            return task
+
+    def __work(self) -> None:
+        while (task := self.__next_task()) is not None:
+            try:
+                if self.__process_pool is not None:
+                    result = self.__process_pool.submit(task.function, *task.args, **task.kwargs).result()
+                else:
+                    result = task.function(*task.args, **task.kwargs)
+                success, e = not task.is_cancelled(), None
+            except Exception as ex:
+                result, success, e = None, False, ex
+            with self.__condition:
+                self.__running -= 1
+                self.__metrics["completed" if success else "cancelled" if task.is_cancelled() else "failed"] += 1
+            task._done(success, result, e)
+
+    def get_metrics(self) -> t.Dict[str, t.Union[int, float]]:
+        """Return the pool size (*workers*), the number of *busy* workers and of *queued* tasks,
+        the number of tasks *submitted*, *completed*, *failed* and *cancelled*, and the *total*
+        and *max* time spent by tasks in the queue, in seconds."""
+        with self.__condition:
+            return {
+                "workers": self.__max_workers,
+                "busy": self.__running,
+                "queued": sum(len(q) for q in self.__queues.values()),
+                **self.__metrics,
+            }
+
+    def shutdown(self) -> None:
+        """Cancel the queued tasks and stop the workers once the running tasks are done."""
+        with self.__condition:
+            self.__is_shutdown = True
+            tasks = [task for queue in self.__queues.values() for task in queue]
+            self.__queues.clear()
+            self.__metrics["cancelled"] += len(tasks)
+            self.__condition.notify_all()
+        for task in tasks:
+            task.cancel()
+            task._done(False)
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown(wait=False)
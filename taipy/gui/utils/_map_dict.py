@@ -79,6 +79,10 @@ class _MapDict(object):
         else:
             self.__setitem__(attr, value)
 
+    # the update function is bound to the state and is not pickled
+    def __reduce__(self):
+        return (_MapDict, (self._dict,))
+
     def keys(self):
         return self._dict.keys()
 
@@ -0,0 +1,35 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from ._map_dict import _MapDict
+
+
+def _get_size(value: t.Any, depth: int = 3) -> int:
+    """Estimate the memory used by a value, in bytes."""
+    if isinstance(value, _MapDict):
+        value = value._dict
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(t.cast(t.Any, value.memory_usage(deep=True)).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if depth > 0:
+        if isinstance(value, dict):
+            size += sum(_get_size(k, depth - 1) + _get_size(v, depth - 1) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set)):
+            size += sum(_get_size(v, depth - 1) for v in value)
+    return size
@@ -0,0 +1,177 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import typing as t
+from collections import OrderedDict
+from datetime import date, datetime, time
+from enum import Enum
+
+from ._attributes import _getscopeattr_drill
+from ._map_dict import _MapDict
+from .types import _TaipyBase
+
+if t.TYPE_CHECKING:
+    from ..gui import Gui
+
+_UNBOUND = object()
+
+
+class _RecordedBindings(object):
+    """The binding calls made while a page is rendered, and the names of the variables they bound."""
+
+    def __init__(self) -> None:
+        self.calls: t.List[t.Tuple[t.Callable, t.Tuple[t.Any, ...]]] = []
+        self.names: t.List[str] = []
+
+    def add(self, fn: t.Callable, args: t.Tuple[t.Any, ...], result: t.Any) -> None:
+        self.calls.append((fn, args))
+        for name in result if isinstance(result, list) else [result]:
+            if isinstance(name, str) and name not in self.names:
+                self.names.append(name)
+
+    def replay(self) -> None:
+        for fn, args in self.calls:
+            fn(*args)
+
+
+class _BindingRecorder(object):
+    """Records the calls that bind variables in the current scope while a page is rendered.
+
+    Only the outermost calls are recorded: replaying them in another scope creates the same
+    variables, without rendering the page again.
+    """
+
+    def __init__(self) -> None:
+        self.__local = threading.local()
+
+    @contextlib.contextmanager
+    def record(self):
+        previous = (getattr(self.__local, "recording", None), getattr(self.__local, "depth", 0))
+        self.__local.recording = _RecordedBindings()
+        self.__local.depth = 0
+        try:
+            yield self.__local.recording
+        finally:
+            self.__local.recording, self.__local.depth = previous
+
+    def call(self, fn: t.Callable, *args) -> t.Any:
+        recording: t.Optional[_RecordedBindings] = getattr(self.__local, "recording", None)
+        if recording is None or self.__local.depth:
+            return fn(*args)
+        self.__local.depth = 1
+        try:
+            result = fn(*args)
+        finally:
+            self.__local.depth = 0
+        recording.add(fn, args, result)
+        return result
+
+
+class _RenderedPage(object):
+    def __init__(self, jsx: t.Optional[str], head: t.Optional[list], warnings: t.List[str]):
+        self.jsx = jsx
+        self.head = head
+        self.warnings = warnings
+        self.warned = False
+
+
+class _CompiledPage(object):
+    def __init__(self, bindings: _RecordedBindings) -> None:
+        self.bindings = bindings
+        self.rendered: OrderedDict[t.Tuple, _RenderedPage] = OrderedDict()
+
+
+class _RenderCache(object):
+    """Cache of the JSX generated for a page.
+
+    Entries are found from the page source and locals context, then from the values of the
+    variables bound by the page in the current scope: the same JSX is generated as long as these
+    values are the same.
+    Only simple values are compared: pages that bind collections or other objects (such as data
+    frames), which could be modified in place, are always rendered.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.__max_entries = max_entries
+        self.__key: t.Optional[t.Tuple[str, t.Optional[str]]] = None
+        self.__compiled: t.Optional[_CompiledPage] = None
+        self.__lock = threading.Lock()
+
+    def get(self, gui: Gui, key: t.Tuple[str, t.Optional[str]]) -> t.Optional[_RenderedPage]:
+        """Bind the page variables in the current scope and return the matching rendered page, if any."""
+        with self.__lock:
+            compiled = self.__compiled if key == self.__key else None
+        if compiled is None:
+            return None
+        compiled.bindings.replay()
+        fingerprint = _RenderCache.__get_fingerprint(gui, compiled.bindings.names)
+        if fingerprint is None:
+            return None
+        with self.__lock:
+            rendered = compiled.rendered.get(fingerprint)
+            if rendered is not None:
+                compiled.rendered.move_to_end(fingerprint)
+            return rendered
+
+    def put(
+        self,
+        gui: Gui,
+        key: t.Tuple[str, t.Optional[str]],
+        bindings: _RecordedBindings,
+        jsx: t.Optional[str],
+        head: t.Optional[list],
+        warnings: t.List[str],
+    ) -> _RenderedPage:
+        rendered = _RenderedPage(jsx, head, warnings)
+        fingerprint = _RenderCache.__get_fingerprint(gui, bindings.names)
+        if fingerprint is None:
+            return rendered
+        with self.__lock:
+            compiled = self.__compiled if key == self.__key else None
+            if compiled is None or compiled.bindings.names != bindings.names:
+                # the page source or its bindings changed: previous entries cannot be reused
+                compiled = _CompiledPage(bindings)
+                self.__key = key
+                self.__compiled = compiled
+            compiled.rendered[fingerprint] = rendered
+            compiled.rendered.move_to_end(fingerprint)
+            while len(compiled.rendered) > self.__max_entries:
+                compiled.rendered.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__key = None
+            self.__compiled = None
+
+    @staticmethod
+    def __get_fingerprint(gui: Gui, names: t.List[str]) -> t.Optional[t.Tuple]:
+        """Return the values of the variables bound by a page, or None if they are not all simple values."""
+        fingerprint: t.List[t.Tuple[str, type, t.Any]] = []
+        for name in names:
+            try:
+                value = _getscopeattr_drill(gui, name)
+            except AttributeError:
+                value = _UNBOUND
+            if isinstance(value, _TaipyBase):
+                value = _TaipyBase.get(value)
+            if isinstance(value, _MapDict):
+                value = value._dict
+            if value is not _UNBOUND and not (
+                value is None or isinstance(value, (str, int, float, complex, bytes, date, datetime, time, Enum))
+            ):
+                return None
+            fingerprint.append((name, type(value), value))
+        return tuple(fingerprint)
@@ -0,0 +1,123 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import shutil
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from .filename import _get_non_existent_file_path
+
+
+class _UploadSession(object):
+    def __init__(self, path: Path, total: int, size: t.Optional[int]) -> None:
+        self.path = path
+        self.total = total
+        self.size = size
+        self.parts: t.Set[int] = set()
+        # end of the data written so far, where chunks that come without an offset are appended
+        self.end = 0
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class _UploadSessions(object):
+    """Chunked file uploads.
+
+    Each chunk is streamed into the uploaded file at its offset, so that chunks can be received in
+    any order, in parallel or sent again. The file is moved to its final name in the upload folder
+    when all the chunks are received.
+    Sessions that are not updated for *timeout* seconds are dropped, with their file.
+    """
+
+    _COPY_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, timeout: float = 3600) -> None:
+        self.__timeout = timeout
+        self.__sessions: t.Dict[str, _UploadSession] = {}
+        self.__lock = threading.Lock()
+
+    def write_chunk(
+        self,
+        id: str,
+        folder: Path,
+        file_name: str,
+        stream: t.BinaryIO,
+        part: int,
+        total: int,
+        offset: t.Optional[int] = None,
+        size: t.Optional[int] = None,
+    ) -> t.Optional[Path]:
+        """Write a chunk of an uploaded file.
+
+        Returns the path of the uploaded file when all its chunks are received, None otherwise.
+        Raises ValueError if the chunk does not fit in the uploaded file.
+        """
+        if not 0 <= part < total:
+            raise ValueError(f"Invalid part {part} of {total}.")
+        if size is not None and size < 0:
+            raise ValueError(f"Invalid size {size}.")
+        if offset is not None and (size is None or not 0 <= offset <= size):
+            raise ValueError(f"Invalid offset {offset} for size {size}.")
+        session = self.__get_session(id, folder, file_name, total, size)
+        if session.total != total or session.size != size:
+            raise ValueError(f"Chunk of {total} parts and size {size} does not match its upload.")
+        if offset is None:
+            with session.lock:
+                session.end = self.__write(session.path, stream, session.end, size)
+        else:
+            end = self.__write(session.path, stream, offset, size)
+            with session.lock:
+                session.end = max(session.end, end)
+        with self.__lock:
+            session.parts.add(part)
+            session.last_update = time.monotonic()
+            if len(session.parts) < session.total or self.__sessions.get(id) is not session:
+                return None
+            del self.__sessions[id]
+            with open(session.path, "r+b") as file:
+                file.truncate(session.end if size is None else size)
+            file_path = _get_non_existent_file_path(folder, file_name)
+            session.path.replace(file_path)
+            return file_path
+
+    def __get_session(self, id: str, folder: Path, file_name: str, total: int, size: t.Optional[int]) -> _UploadSession:
+        with self.__lock:
+            self.__drop_expired_sessions()
+            if (session := self.__sessions.get(id)) is None:
+                path = folder / f".{file_name}.{hashlib.sha1(id.encode()).hexdigest()[:16]}.upload"
+                # the file grows as chunks are written at their offset: nothing is allocated ahead
+                path.write_bytes(b"")
+                session = self.__sessions[id] = _UploadSession(path, total, size)
+            return session
+
+    @staticmethod
+    def __write(path: Path, stream: t.BinaryIO, offset: int, size: t.Optional[int]) -> int:
+        with open(path, "r+b") as file:
+            file.seek(offset)
+            if size is None:
+                shutil.copyfileobj(stream, file, _UploadSessions._COPY_BUFFER_SIZE)
+                return file.tell()
+            # the chunk must end within the announced size of the file
+            remaining = size - offset
+            while buffer := stream.read(min(_UploadSessions._COPY_BUFFER_SIZE, remaining + 1)):
+                if len(buffer) > remaining:
+                    raise ValueError(f"Chunk at offset {offset} exceeds the size {size}.")
+                file.write(buffer)
+                remaining -= len(buffer)
+            return file.tell()
+
+    def __drop_expired_sessions(self):
+        now = time.monotonic()
+        for id in [id for id, s in self.__sessions.items() if now - s.last_update > self.__timeout]:
+            self.__sessions.pop(id).path.unlink(missing_ok=True)
@@ -0,0 +1,178 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import contextlib
+import itertools
+import threading
+import time
+import typing as t
+
+from ..types import _WsType
+
+
+class _PendingMessages(object):
+    def __init__(self, client_id: str, to: t.Any) -> None:
+        self.client_id = client_id
+        self.to = to
+        # (sequence number, payload) pairs
+        self.messages: t.List[t.Tuple[int, dict]] = []
+        self.since = 0.0
+        self.lock = threading.Lock()
+
+
+class _WsScheduler(object):
+    """Outgoing message scheduler.
+
+    Messages sent to a client while an incoming message is processed (a *tick*) are queued, and
+    sent in the same order when the tick ends. Consecutive variable updates sent to the same
+    receiver are coalesced into a single MULTIPLE_UPDATE message where a variable only appears
+    once, with its last value.
+    Messages that are queued for more than *max_delay* seconds (because a callback takes time to
+    complete) are sent by a background task, so that the client is still updated.
+
+    Messages sent outside of a tick are sent right away.
+    """
+
+    def __init__(
+        self,
+        emit: t.Callable[[dict, t.Any], None],
+        start_background_task: t.Callable[[t.Callable], t.Any],
+        sleep: t.Callable[[float], None],
+        max_delay: float = 0.05,
+    ) -> None:
+        self.__emit = emit
+        self.__start_background_task = start_background_task
+        self.__sleep = sleep
+        self.__max_delay = max_delay
+        self.__pending: t.Dict[t.Tuple[str, t.Any], _PendingMessages] = {}
+        self.__metrics: t.Dict[str, t.Dict[str, int]] = {}
+        self.__lock = threading.Lock()
+        self.__is_flusher_running = False
+        self.__local = threading.local()
+        self.__sequence = itertools.count()
+
+    @contextlib.contextmanager
+    def tick(self):
+        """Queue the messages sent in this context, and send them when it exits."""
+        depth = getattr(self.__local, "depth", 0)
+        if depth == 0:
+            self.__local.keys = {}
+            self.__local.last_key = None
+        self.__local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self.__local.depth = depth
+            if depth == 0:
+                self.flush()
+
+    def is_in_tick(self) -> bool:
+        return getattr(self.__local, "depth", 0) > 0
+
+    def send(self, client_id: str, payload: dict, to: t.Any) -> None:
+        if not self.is_in_tick():
+            self.__emit(payload, to)
+            self.__update_metrics(client_id, sent=1)
+            return
+        key = (client_id, tuple(sorted(to)) if isinstance(to, (list, set)) else to)
+        with self.__lock:
+            pending = self.__pending.get(key)
+            if pending is None:
+                pending = _PendingMessages(client_id, to)
+                self.__pending[key] = pending
+            start_flusher = not self.__is_flusher_running
+            self.__is_flusher_running = True
+        self.__local.keys[key] = pending
+        # only coalesce with the previous message of the tick: the order of the messages is kept
+        can_coalesce = self.__local.last_key == key
+        self.__local.last_key = key
+        with pending.lock:
+            if not pending.messages:
+                pending.since = time.monotonic()
+            coalesced = _WsScheduler.__add(pending.messages, payload, next(self.__sequence), can_coalesce)
+            depth = len(pending.messages)
+        self.__update_metrics(client_id, coalesced=coalesced, depth=depth)
+        if start_flusher:
+            self.__start_background_task(self.__flush_late_messages)
+
+    @staticmethod
+    def __add(messages: t.List[t.Tuple[int, dict]], payload: dict, sequence: int, can_coalesce: bool) -> int:
+        if payload.get("type") == _WsType.MULTIPLE_UPDATE.value:
+            if can_coalesce and messages and messages[-1][1].get("type") == _WsType.MULTIPLE_UPDATE.value:
+                last = messages[-1][1]
+                updates = last["payload"]
+                names = {u.get("name") for u in payload["payload"]}
+                kept = [u for u in updates if u.get("name") not in names]
+                last["payload"] = kept + list(payload["payload"])
+                return len(updates) - len(kept)
+            # the list of updates may be modified: do not change the caller's payload
+            payload = {**payload, "payload": list(payload["payload"])}
+        messages.append((sequence, payload))
+        return 0
+
+    def flush(self) -> None:
+        """Send the messages queued in the current tick, in the order they were sent."""
+        keys = getattr(self.__local, "keys", {})
+        self.__local.keys = {}
+        self.__local.last_key = None
+        queued: t.List[t.Tuple[int, dict, _PendingMessages]] = []
+        for pending in keys.values():
+            with pending.lock:
+                messages, pending.messages = pending.messages, []
+            queued.extend((sequence, message, pending) for sequence, message in messages)
+            if messages:
+                self.__update_metrics(pending.client_id, sent=len(messages), depth=0)
+        for _, message, pending in sorted(queued, key=lambda m: m[0]):
+            self.__emit(message, pending.to)
+
+    def __flush(self, pending: _PendingMessages) -> None:
+        with pending.lock:
+            messages, pending.messages = pending.messages, []
+            for _, message in messages:
+                self.__emit(message, pending.to)
+        if messages:
+            self.__update_metrics(pending.client_id, sent=len(messages), depth=0)
+
+    def __flush_late_messages(self) -> None:
+        while True:
+            self.__sleep(self.__max_delay)
+            now = time.monotonic()
+            with self.__lock:
+                late = [p for p in self.__pending.values() if p.messages and now - p.since >= self.__max_delay]
+                # forget the queues that are empty
+                self.__pending = {k: p for k, p in self.__pending.items() if p.messages}
+                if not self.__pending:
+                    self.__is_flusher_running = False
+                    return
+            for pending in late:
+                self.__flush(pending)
+
+    def __update_metrics(self, client_id: str, sent: int = 0, coalesced: int = 0, depth: t.Optional[int] = None):
+        with self.__lock:
+            metrics = self.__metrics.get(client_id)
+            if metrics is None:
+                metrics = {"depth": 0, "max_depth": 0, "sent": 0, "coalesced": 0}
+                self.__metrics[client_id] = metrics
+            metrics["sent"] += sent
+            metrics["coalesced"] += coalesced
+            if depth is not None:
+                metrics["depth"] = depth
+                metrics["max_depth"] = max(metrics["max_depth"], depth)
+
+    def get_metrics(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Return, per client, the current and maximum number of queued messages, the number of
+        messages sent and the number of variable updates that were coalesced."""
+        with self.__lock:
+            return {client_id: dict(metrics) for client_id, metrics in self.__metrics.items()}
+
+    def forget(self, client_id: str) -> None:
+        with self.__lock:
+            self.__metrics.pop(client_id, None)
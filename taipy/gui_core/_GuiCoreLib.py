@@ -51,9 +51,13 @@ class _GuiCore(ElementLibrary):
     __SCENARIO_VIZ_ERROR_VAR = "__tpgc_sv_error"
     __JOB_SELECTOR_ERROR_VAR = "__tpgc_js_error"
     __JOB_DETAIL_ID_VAR = "__tpgc_jd_id"
+    __JOB_SELECTOR_FILTER_VAR = "__tpgc_js_filter"
+    __JOB_SELECTOR_SORT_VAR = "__tpgc_js_sort"
+    __JOB_SELECTOR_PAGE_VAR = "__tpgc_js_page"
     __DATANODE_VIZ_ERROR_VAR = "__tpgc_dv_error"
     __DATANODE_VIZ_OWNER_ID_VAR = "__tpgc_dv_owner_id"
     __DATANODE_VIZ_HISTORY_ID_VAR = "__tpgc_dv_history_id"
+    __DATANODE_VIZ_HISTORY_SIZE_VAR = "__tpgc_dv_history_size"
     __DATANODE_VIZ_PROPERTIES_ID_VAR = "__tpgc_dv_properties_id"
     __DATANODE_VIZ_DATA_ID_VAR = "__tpgc_dv_data_id"
     __DATANODE_VIZ_DATA_CHART_ID_VAR = "__tpgc_dv_data_chart_id"
@@ -238,7 +242,13 @@ class _GuiCore(ElementLibrary):
                 ),
                 "history": ElementProperty(
                     PropertyType.react,
-                    f"{{{__CTX_VAR_NAME}.get_data_node_history(" + f"{__DATANODE_VIZ_HISTORY_ID_VAR}<tp:uniq:dn>)}}",
+                    f"{{{__CTX_VAR_NAME}.get_data_node_history("
+                    + f"{__DATANODE_VIZ_HISTORY_ID_VAR}<tp:uniq:dn>, {__DATANODE_VIZ_HISTORY_SIZE_VAR}<tp:uniq:dn>)}}",
+                ),
+                "history_count": ElementProperty(
+                    PropertyType.react,
+                    f"{{{__CTX_VAR_NAME}.get_data_node_history_count("
+                    + f"{__DATANODE_VIZ_HISTORY_ID_VAR}<tp:uniq:dn>)}}",
                 ),
                 "tabular_data": ElementProperty(
                     PropertyType.data,
@@ -266,6 +276,7 @@ class _GuiCore(ElementLibrary):
                     PropertyType.string,
                     f"data_id={__DATANODE_VIZ_DATA_ID_VAR}<tp:uniq:dn>;"
                     + f"history_id={__DATANODE_VIZ_HISTORY_ID_VAR}<tp:uniq:dn>;"
+                    + f"history_size={__DATANODE_VIZ_HISTORY_SIZE_VAR}<tp:uniq:dn>;"
                     + f"owner_id={__DATANODE_VIZ_OWNER_ID_VAR}<tp:uniq:dn>;"
                     + f"chart_id={__DATANODE_VIZ_DATA_CHART_ID_VAR}<tp:uniq:dn>;"
                     + f"properties_id={__DATANODE_VIZ_PROPERTIES_ID_VAR}<tp:uniq:dn>;"
@@ -291,7 +302,16 @@ class _GuiCore(ElementLibrary):
                 "height": ElementProperty(PropertyType.string, "50vh"),
             },
             inner_properties={
-                "jobs": ElementProperty(PropertyType.lov, f"{{{__CTX_VAR_NAME}.get_jobs_list()}}"),
+                "jobs": ElementProperty(
+                    PropertyType.lov,
+                    f"{{{__CTX_VAR_NAME}.get_jobs_list({__JOB_SELECTOR_FILTER_VAR}<tp:uniq:jb>, "
+                    + f"{__JOB_SELECTOR_SORT_VAR}<tp:uniq:jb>, {__JOB_SELECTOR_PAGE_VAR}<tp:uniq:jb>)}}",
+                ),
+                "jobs_count": ElementProperty(
+                    PropertyType.react,
+                    f"{{{__CTX_VAR_NAME}.get_jobs_count({__JOB_SELECTOR_FILTER_VAR}<tp:uniq:jb>, "
+                    + f"{__JOB_SELECTOR_SORT_VAR}<tp:uniq:jb>)}}",
+                ),
                 "core_changed": ElementProperty(PropertyType.broadcast, _GuiCoreContext._CORE_CHANGED_NAME),
                 "type": ElementProperty(PropertyType.inner, __JOB_ADAPTER),
                 "on_job_action": ElementProperty(PropertyType.function, f"{{{__CTX_VAR_NAME}.act_on_jobs}}"),
@@ -303,7 +323,10 @@ class _GuiCore(ElementLibrary):
                 "update_jb_vars": ElementProperty(
                     PropertyType.string,
                     f"error_id={__JOB_SELECTOR_ERROR_VAR}<tp:uniq:jb>;"
-                    + f"detail_id={__JOB_DETAIL_ID_VAR}<tp:uniq:jb>;",
+                    + f"detail_id={__JOB_DETAIL_ID_VAR}<tp:uniq:jb>;"
+                    + f"filter={__JOB_SELECTOR_FILTER_VAR}<tp:uniq:jb>;"
+                    + f"sort={__JOB_SELECTOR_SORT_VAR}<tp:uniq:jb>;"
+                    + f"page={__JOB_SELECTOR_PAGE_VAR}<tp:uniq:jb>",
                 ),
             },
         ),
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import datetime
+import heapq
 import json
 import typing as t
 import zoneinfo
@@ -32,6 +33,7 @@ from taipy.core import (
     ScenarioId,
     Sequence,
     SequenceId,
+    Status,
     Submission,
     SubmissionId,
     can_create,
@@ -69,6 +71,7 @@ from ._adapters import (
     _GuiCoreScenarioProperties,
     _invoke_action,
 )
+from ._data_node_cache import _DataNodeReadCache
 from .filters import CustomScenarioFilter
 
 
@@ -82,6 +85,12 @@ class _GuiCoreContext(CoreEventConsumerBase):
     __PROP_SCENARIO_TAGS = "tags"
     __ENTITY_PROPS = (__PROP_CONFIG_ID, __PROP_DATE, __PROP_ENTITY_NAME)
     __ACTION = "action"
+    # indexes in the job rows
+    __JOB_ROW_ID = 0
+    __JOB_ROW_OWNER_ID = 3
+    __JOB_ROW_STATUS = 7
+    __JOB_ROW_LENGTH = 8
+    __HISTORY_PAGE_SIZE = 50
     _CORE_CHANGED_NAME = "core_changed"
     _AUTH_CHANGED_NAME = "auth_changed"
 
@@ -91,7 +100,18 @@ class _GuiCoreContext(CoreEventConsumerBase):
         self.data_nodes_by_owner: t.Optional[t.Dict[t.Optional[str], t.List[DataNode]]] = None
         self.scenario_configs: t.Optional[t.List[t.Tuple[str, str]]] = None
         self.jobs_list: t.Optional[t.List[Job]] = None
+        # lightweight projections of the entities, computed once and dropped when the entity changes
+        self.job_rows: t.Dict[str, t.Tuple] = {}
+        self.scenario_rows: t.Dict[str, t.List] = {}
+        # last filtered and sorted lists, reset when the cached entities change
+        self.__jobs_query: t.Optional[t.Tuple[t.Any, t.List[Job]]] = None
+        self.__scenarios_query: t.Optional[t.Tuple[t.Any, t.List[t.Any]]] = None
+        self.__scenarios_version = 0
         self.client_submission: t.Dict[str, SubmissionStatus] = {}
+        # comments of the edits made by jobs, per job id
+        self.job_edit_comments: t.Dict[str, t.Optional[str]] = {}
+        # values read by the data node viewer, sized when started
+        self.data_node_cache = _DataNodeReadCache()
         # register to taipy core notification
         reg_id, reg_queue = Notifier.register()
         # locks
@@ -111,17 +131,37 @@ class _GuiCoreContext(CoreEventConsumerBase):
         if self.__started:
             return
         self.__started = True
+        self.data_node_cache.max_bytes = self.gui._get_config("data_node_cache_size", 0) or 0
         self.start()
 
     def process_event(self, event: Event):
         self.__lazy_start()
         if event.entity_type is EventEntityType.SCENARIO:
             with self.gui._get_authorization(system=True):
-                self.scenario_refresh(
-                    event.entity_id
-                    if event.operation is EventOperation.DELETION or is_readable(t.cast(ScenarioId, event.entity_id))
-                    else None
+                with self.lock:
+                    self.__patch_scenarios(event)
+                self.broadcast_core_changed(
+                    {
+                        "scenario": event.entity_id
+                        if event.entity_id
+                        and (
+                            event.operation is EventOperation.DELETION
+                            or is_readable(t.cast(ScenarioId, event.entity_id))
+                        )
+                        else True
+                    }
                 )
+        elif event.entity_type is EventEntityType.CYCLE:
+            if event.operation is EventOperation.DELETION:
+                with self.lock:
+                    self.__scenarios_query = None
+                    self.__scenarios_version += 1
+                    if self.scenario_by_cycle is not None:
+                        if _GuiCoreContext.__is_bulk_event(event):
+                            self.scenario_by_cycle = None
+                        else:
+                            for cycle in [c for c in self.scenario_by_cycle if c and c.id == event.entity_id]:
+                                del self.scenario_by_cycle[cycle]
         elif event.entity_type is EventEntityType.SEQUENCE and event.entity_id:
             sequence = None
             try:
@@ -138,26 +178,142 @@ class _GuiCoreContext(CoreEventConsumerBase):
                 _warn(f"Access to sequence {event.entity_id} failed", e)
         elif event.entity_type is EventEntityType.JOB:
             with self.lock:
-                self.jobs_list = None
+                self.__patch_jobs(event)
             # no broadcast because the submission status will do the job
             if event.operation is EventOperation.DELETION:
-                self.broadcast_core_changed({"jobs": True})
+                self.broadcast_core_changed({"jobs": event.entity_id or True})
         elif event.entity_type is EventEntityType.SUBMISSION:
             self.submission_status_callback(event.entity_id, event)
         elif event.entity_type is EventEntityType.DATA_NODE:
+            self.data_node_cache.invalidate(None if _GuiCoreContext.__is_bulk_event(event) else event.entity_id)
             with self.lock:
-                self.data_nodes_by_owner = None
-            self.broadcast_core_changed(
-                {"datanode": event.entity_id if event.operation != EventOperation.DELETION else True}
+                self.__patch_data_nodes(event)
+            self.broadcast_core_changed({"datanode": event.entity_id or True})
+
+    @staticmethod
+    def __is_bulk_event(event: Event) -> bool:
+        # delete_all or delete_by_version: the entities cannot be patched one by one
+        return not event.entity_id or "delete_by_version" in event.metadata
+
+    @staticmethod
+    def __get_entity(entity_id: str, entity_type: t.Type) -> t.Optional[t.Any]:
+        try:
+            entity = core_get(entity_id)
+            return entity if isinstance(entity, entity_type) else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def __patch_grouped_entities(
+        entities_by_key: t.Dict[t.Any, t.List[t.Any]],
+        entity_id: str,
+        deleted: bool,
+        entity_type: t.Type,
+        key_getter: t.Callable[[t.Any], t.Any],
+    ):
+        """Insert, update or delete one entity in entities grouped by key (in place)."""
+        if not deleted:
+            # entities reload themselves when accessed: only unknown entities need to be read
+            if any(e.id == entity_id for entities in entities_by_key.values() for e in entities):
+                return
+            if entity := _GuiCoreContext.__get_entity(entity_id, entity_type):
+                entities_by_key.setdefault(key_getter(entity), []).append(entity)
+            return
+        for key, entities in list(entities_by_key.items()):
+            kept = [e for e in entities if e.id != entity_id]
+            if len(kept) != len(entities):
+                if kept or key is None:
+                    entities_by_key[key] = kept
+                else:
+                    del entities_by_key[key]
+
+    def __patch_scenarios(self, event: Event):
+        self.__scenarios_query = None
+        self.__scenarios_version += 1
+        if _GuiCoreContext.__is_bulk_event(event):
+            self.scenario_rows.clear()
+        else:
+            self.scenario_rows.pop(t.cast(str, event.entity_id), None)
+        if self.scenario_by_cycle is None:
+            return
+        if _GuiCoreContext.__is_bulk_event(event):
+            self.scenario_by_cycle = None
+            self.data_nodes_by_owner = None
+        else:
+            _GuiCoreContext.__patch_grouped_entities(
+                self.scenario_by_cycle,
+                t.cast(str, event.entity_id),
+                event.operation is EventOperation.DELETION,
+                Scenario,
+                lambda s: s.cycle,
+            )
+
+    def __patch_data_nodes(self, event: Event):
+        # scenarios can be filtered on the properties of their data nodes
+        self.__scenarios_query = None
+        self.__scenarios_version += 1
+        if self.data_nodes_by_owner is None:
+            return
+        if _GuiCoreContext.__is_bulk_event(event):
+            self.data_nodes_by_owner = None
+        else:
+            _GuiCoreContext.__patch_grouped_entities(
+                self.data_nodes_by_owner,
+                t.cast(str, event.entity_id),
+                event.operation is EventOperation.DELETION,
+                DataNode,
+                lambda dn: dn.owner_id,
             )
 
+    def __patch_jobs(self, event: Event):
+        self.__jobs_query = None
+        if _GuiCoreContext.__is_bulk_event(event):
+            self.job_rows.clear()
+            if event.operation is EventOperation.DELETION:
+                self.job_edit_comments.clear()
+        else:
+            self.job_rows.pop(t.cast(str, event.entity_id), None)
+            if event.operation is EventOperation.DELETION:
+                self.job_edit_comments.pop(t.cast(str, event.entity_id), None)
+        if self.jobs_list is None:
+            return
+        if _GuiCoreContext.__is_bulk_event(event):
+            self.jobs_list = None
+        else:
+            jobs_by_key = {None: self.jobs_list}
+            _GuiCoreContext.__patch_grouped_entities(
+                jobs_by_key,
+                t.cast(str, event.entity_id),
+                event.operation is EventOperation.DELETION,
+                Job,
+                lambda _: None,
+            )
+            self.jobs_list = jobs_by_key[None]
+
     def broadcast_core_changed(self, payload: t.Dict[str, t.Any], client_id: t.Optional[str] = None):
         self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
 
     def scenario_refresh(self, scenario_id: t.Optional[str]):
         with self.lock:
-            self.scenario_by_cycle = None
-            self.data_nodes_by_owner = None
+            self.__scenarios_query = None
+            self.__scenarios_version += 1
+            if scenario_id is None:
+                self.scenario_by_cycle = None
+                self.data_nodes_by_owner = None
+                self.scenario_rows.clear()
+            else:
+                self.scenario_rows.pop(scenario_id, None)
+                if self.scenario_by_cycle is not None:
+                    _GuiCoreContext.__patch_grouped_entities(
+                        self.scenario_by_cycle, scenario_id, False, Scenario, lambda s: s.cycle
+                    )
+                if self.data_nodes_by_owner is not None and (
+                    scenario := _GuiCoreContext.__get_entity(scenario_id, Scenario)
+                ):
+                    for dn in scenario.data_nodes.values():
+                        _GuiCoreContext.__patch_grouped_entities(
+                            self.data_nodes_by_owner, dn.id, False, DataNode, lambda dn: dn.owner_id
+                        )
         self.broadcast_core_changed({"scenario": scenario_id or True})
 
     def submission_status_callback(self, submission_id: t.Optional[str] = None, event: t.Optional[Event] = None):
@@ -266,14 +422,18 @@ class _GuiCoreContext(CoreEventConsumerBase):
         if isinstance(scenario, (tuple, list)):
             return scenario
         try:
-            if isinstance(scenario, Scenario) and is_readable(scenario.id) and core_get(scenario.id) is not None:
-                return [
-                    scenario.id,
-                    scenario.get_simple_label(),
-                    None,
-                    _EntityType.SCENARIO.value,
-                    scenario.is_primary,
-                ]
+            if isinstance(scenario, Scenario) and is_readable(scenario.id):
+                with self.lock:
+                    if (row := self.scenario_rows.get(scenario.id)) is None:
+                        row = [
+                            scenario.id,
+                            scenario.get_simple_label(),
+                            None,
+                            _EntityType.SCENARIO.value,
+                            scenario.is_primary,
+                        ]
+                        self.scenario_rows[scenario.id] = row
+                return list(row)
         except Exception as e:
             _warn(
                 f"Access to {type(scenario).__name__} "
@@ -366,10 +526,21 @@ class _GuiCoreContext(CoreEventConsumerBase):
     ):
         self.__lazy_start()
         cycles_scenarios: t.List[t.Union[Cycle, Scenario]] = []
+        # custom filters are user functions: their result cannot be cached
+        key = (
+            _GuiCoreContext.__get_query_key(filters, sorts)
+            if scenarios is None
+            and not any(CustomScenarioFilter._get_custom(fd.get("col", "")) for fd in filters or [])
+            else None
+        )
         with self.lock:
             # always needed to get scenarios for a cycle in cycle_adapter
             if self.scenario_by_cycle is None:
                 self.scenario_by_cycle = get_cycles_scenarios()
+            if key is not None and self.__scenarios_query is not None and self.__scenarios_query[0] == key:
+                # cycles are adapted in place by the data node tree
+                return [list(e) if isinstance(e, list) else e for e in self.__scenarios_query[1]]
+            version = self.__scenarios_version
             if scenarios is None:
                 for cycle, c_scenarios in self.scenario_by_cycle.items():
                     if cycle is None:
@@ -380,6 +551,12 @@ class _GuiCoreContext(CoreEventConsumerBase):
             cycles_scenarios = scenarios
         adapted_list = self.get_sorted_scenario_list(cycles_scenarios, sorts)
         adapted_list = self.get_filtered_scenario_list(adapted_list, filters)
+        if key is not None:
+            with self.lock:
+                # not stored if the scenarios changed in the meantime
+                if self.__scenarios_version == version:
+                    self.__scenarios_query = (key, adapted_list)
+            return [list(e) if isinstance(e, list) else e for e in adapted_list]
         return adapted_list
 
     def select_scenario(self, state: State, id: str, payload: t.Dict[str, str]):
@@ -797,28 +974,110 @@ class _GuiCoreContext(CoreEventConsumerBase):
 
         return None
 
-    def get_jobs_list(self):
-        self.__lazy_start()
+    @staticmethod
+    def __get_query_key(*args: t.Any) -> str:
+        return json.dumps(args, default=lambda v: v._dict if isinstance(v, _MapDict) else str(v))
+
+    def __get_job_row(self, job: Job) -> t.Optional[t.Tuple]:
+        """Return the cached projection of a job, shared by all the clients (called with the lock).
+
+        The authorization checks depend on the client: `job_adapter()` adds them to the row.
+        """
+        if (row := self.job_rows.get(job.id)) is not None:
+            return row
+        try:
+            entity = core_get(job.owner_id)
+            row = (
+                job.id,
+                job.get_simple_label(),
+                [],
+                entity.id if entity else "",
+                entity.get_simple_label() if entity else "",
+                job.submit_id,
+                job.creation_date,
+                job.status.value,
+            )
+            self.job_rows[job.id] = row
+            return row
+        except Exception as e:
+            _warn(f"Access to job ({job.id}) failed", e)
+        return None
+
+    @staticmethod
+    def __is_job_column(col: t.Any) -> bool:
+        return isinstance(col, int) and 0 <= col < _GuiCoreContext.__JOB_ROW_LENGTH
+
+    @staticmethod
+    def __get_job_filter_value(row: t.Tuple, col: int) -> str:
+        if col == _GuiCoreContext.__JOB_ROW_ID or col == _GuiCoreContext.__JOB_ROW_OWNER_ID:
+            return f"{row[col]}{row[col + 1]}".lower()
+        if col == _GuiCoreContext.__JOB_ROW_STATUS:
+            return Status(row[col]).name.lower()
+        return str(row[col]).lower()
+
+    def __get_jobs(
+        self,
+        filters: t.Optional[t.List[t.Dict[str, t.Any]]],
+        sorts: t.Optional[t.List[t.Dict[str, t.Any]]],
+    ) -> t.List[Job]:
+        key = _GuiCoreContext.__get_query_key(filters, sorts)
         with self.lock:
             if self.jobs_list is None:
                 self.jobs_list = get_jobs()
-            return self.jobs_list
+            if self.__jobs_query is not None and self.__jobs_query[0] == key:
+                return self.__jobs_query[1]
+            rows = [(job, row) for job in self.jobs_list if (row := self.__get_job_row(job)) is not None]
+            for fd in filters or []:
+                if not _GuiCoreContext.__is_job_column(fd.get("data")) or not fd.get("operator"):
+                    continue
+                col = t.cast(int, fd.get("data"))
+                val = str(fd.get("value", "")).lower()
+                is_in = fd.get("operator") == "is"
+                rows = [r for r in rows if (val in _GuiCoreContext.__get_job_filter_value(r[1], col)) is is_in]
+            for sd in reversed(sorts or []):
+                if not _GuiCoreContext.__is_job_column(sd.get("col")):
+                    continue
+                col = t.cast(int, sd.get("col"))
+                try:
+                    rows = sorted(rows, key=lambda r: (r[1][col] is None, r[1][col]), reverse=not sd.get("order", True))
+                except TypeError as e:
+                    _warn(f"Error sorting jobs on column {col}", e)
+            jobs = [job for job, _ in rows]
+            self.__jobs_query = (key, jobs)
+            return jobs
+
+    def get_jobs_list(
+        self,
+        filters: t.Optional[t.List[t.Dict[str, t.Any]]] = None,
+        sorts: t.Optional[t.List[t.Dict[str, t.Any]]] = None,
+        page: t.Optional[t.Dict[str, t.Any]] = None,
+    ):
+        """Return the jobs matching the filters, in order, restricted to the page range if any."""
+        self.__lazy_start()
+        jobs = self.__get_jobs(filters, sorts)
+        if page:
+            start = max(int(page.get("start") or 0), 0)
+            end = page.get("end")
+            return jobs[start : None if end is None else max(int(end), start)]
+        return jobs
+
+    def get_jobs_count(
+        self,
+        filters: t.Optional[t.List[t.Dict[str, t.Any]]] = None,
+        sorts: t.Optional[t.List[t.Dict[str, t.Any]]] = None,
+    ) -> int:
+        self.__lazy_start()
+        return len(self.__get_jobs(filters, sorts))
 
     def job_adapter(self, job):
         self.__lazy_start()
         try:
-            if hasattr(job, "id") and is_readable(job.id) and core_get(job.id) is not None:
-                if isinstance(job, Job):
-                    entity = core_get(job.owner_id)
+            if hasattr(job, "id") and is_readable(job.id) and isinstance(job, Job):
+                with self.lock:
+                    row = self.__get_job_row(job)
+                if row is not None:
                     return (
-                        job.id,
-                        job.get_simple_label(),
-                        [],
-                        entity.id if entity else "",
-                        entity.get_simple_label() if entity else "",
-                        job.submit_id,
-                        job.creation_date,
-                        job.status.value,
+                        *row,
                         _get_reason(is_deletable(job)),
                         _get_reason(is_readable(job)),
                         _get_reason(is_editable(job)),
@@ -972,28 +1231,43 @@ class _GuiCoreContext(CoreEventConsumerBase):
                         cycles_scenarios.append(entity)
         return sorted(cycles_scenarios, key=_get_entity_property("creation_date", Scenario))
 
-    def get_data_node_history(self, id: str):
+    def __get_job_edit_comment(self, job_id: str) -> t.Optional[str]:
+        if job_id not in self.job_edit_comments:
+            job = core_get(job_id)
+            self.job_edit_comments[job_id] = (
+                f"Execution of task {job.task.get_simple_label()}." if isinstance(job, Job) and job.task else None
+            )
+        return self.job_edit_comments[job_id]
+
+    def get_data_node_history(self, id: str, size: t.Optional[int] = None):
+        """Return the *size* most recent edits of a data node."""
         self.__lazy_start()
         if id and (dn := core_get(id)) and isinstance(dn, DataNode):
+            size = int(size) if size and int(size) > 0 else _GuiCoreContext.__HISTORY_PAGE_SIZE
             res = []
-            for e in dn.edits:
+            # only the jobs of the requested edits are read
+            for e in heapq.nlargest(size, dn.edits, key=lambda e: e.get("timestamp")):
                 job_id = e.get("job_id")
-                job: t.Optional[Job] = None
+                comment: t.Optional[str] = None
                 if job_id:
                     if not (reason := is_readable(job_id)):
                         job_id += f" is not readable: {_get_reason(reason)}."
                     else:
-                        job = core_get(job_id)
+                        comment = self.__get_job_edit_comment(job_id)
                 res.append(
                     (
                         e.get("timestamp"),
                         job_id if job_id else e.get("writer_identifier", ""),
-                        f"Execution of task {job.task.get_simple_label()}."
-                        if job and job.task
-                        else e.get("comment", ""),
+                        comment or e.get("comment", ""),
                     )
                 )
-            return sorted(res, key=lambda r: r[0], reverse=True)
+            return res
+        return _DoNotUpdate()
+
+    def get_data_node_history_count(self, id: str):
+        self.__lazy_start()
+        if id and (dn := core_get(id)) and isinstance(dn, DataNode):
+            return len(dn.edits)
         return _DoNotUpdate()
 
     def __check_readable_editable(self, state: State, id: str, ent_type: str, var: t.Optional[str]):
@@ -1054,7 +1328,8 @@ class _GuiCoreContext(CoreEventConsumerBase):
                     else payload.get("value")
                 )
                 # user_value = payload.get("user_value")
-                data = self.__read_tabular_data(datanode)
+                # not read from the cache: the value is modified in place
+                data = datanode.read()
                 new_data: t.Any = None
                 if isinstance(data, (pd.DataFrame, pd.Series)):
                     if isinstance(data, pd.DataFrame):
@@ -1133,7 +1408,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         return None
 
     def __read_tabular_data(self, datanode: DataNode):
-        return datanode.read()
+        return self.data_node_cache.read(datanode)
 
     def get_data_node_tabular_data(self, id: str):
         self.__lazy_start()
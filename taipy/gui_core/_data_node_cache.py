@@ -0,0 +1,104 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from collections import OrderedDict
+from threading import Lock
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+from taipy.core import DataNode
+from taipy.core.data._file_datanode_mixin import _FileDataNodeMixin
+from taipy.gui.utils._memory import _get_size
+
+
+class _DataNodeReadCache(object):
+    """Cache of the values read from data nodes, shared by all the clients.
+
+    Entries are identified by the data node id and its last edit date, and evicted (least recently
+    used first) when their total size exceeds *max_bytes*.
+    Cached values are shared: they must not be modified in place.
+    Only file-based data nodes are cached: the last edit date of the other data nodes (SQL, Mongo,
+    generic...) does not change when their data is modified outside of Taipy.
+    """
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        self.max_bytes = max_bytes
+        self.__entries: OrderedDict[t.Tuple[str, t.Any], t.Tuple[t.Any, int]] = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+        # one lock per data node being read, so that a value is read once when requested by several clients
+        self.__read_locks: t.Dict[str, Lock] = {}
+
+    def read(self, datanode: DataNode) -> t.Any:
+        if self.max_bytes <= 0 or not isinstance(datanode, _FileDataNodeMixin):
+            return datanode.read()
+        key = (datanode.id, datanode.last_edit_date)
+        with self.__lock:
+            read_lock = self.__read_locks.setdefault(datanode.id, Lock())
+        with read_lock:
+            with self.__lock:
+                if (entry := self.__entries.get(key)) is not None:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return entry[0]
+                self.__misses += 1
+            value = datanode.read()
+            self.__put(key, value)
+        return value
+
+    def __put(self, key: t.Tuple[str, t.Any], value: t.Any):
+        size = _get_size(value)
+        if size > self.max_bytes:
+            return
+        with self.__lock:
+            self.__remove(key[0])
+            self.__entries[key] = (value, size)
+            self.__size += size
+            evicted = 0
+            while self.__size > self.max_bytes:
+                _, (_, evicted_size) = self.__entries.popitem(last=False)
+                self.__size -= evicted_size
+                evicted += 1
+            if evicted:
+                _TaipyLogger._get_logger().debug(
+                    f"Data node cache: {evicted} entries evicted, hit rate {self.__get_hit_rate():.0%}."
+                )
+
+    def __remove(self, datanode_id: str):
+        for key in [k for k in self.__entries if k[0] == datanode_id]:
+            self.__size -= self.__entries.pop(key)[1]
+
+    def invalidate(self, datanode_id: t.Optional[str] = None):
+        """Drop the cached value of a data node, or all the values if *datanode_id* is None."""
+        with self.__lock:
+            if datanode_id is None:
+                self.__entries.clear()
+                self.__size = 0
+                self.__read_locks.clear()
+            else:
+                self.__remove(datanode_id)
+                self.__read_locks.pop(datanode_id, None)
+
+    def __get_hit_rate(self) -> float:
+        return self.__hits / (self.__hits + self.__misses) if self.__hits + self.__misses else 0.0
+
+    def get_stats(self) -> t.Dict[str, t.Any]:
+        with self.__lock:
+            return {
+                "entries": len(self.__entries),
+                "size": self.__size,
+                "max_bytes": self.max_bytes,
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "hit_rate": self.__get_hit_rate(),
+            }
@@ -10,6 +10,8 @@
 # specific language governing permissions and limitations under the License.
 from typing import List
 
+import networkx as nx
+
 from taipy.common.config.common.scope import Scope
 from taipy.core import DataNode, Sequence, SequenceId, Task, TaskId
 from taipy.core._entity._dag import _DAG
@@ -292,3 +294,30 @@ class TestDAG:
         assert_edge_exists("t1", "s3", dag)
         assert_edge_exists("s2", "t2", dag)
         assert_edge_exists("t2", "s4", dag)
+
+    def test_get_dag_with_many_generations(self):
+        class _Entity:
+            def __init__(self, id: str):
+                self.id = id
+
+        # generations of 1 to 13 nodes: the least common multiple of their widths is far too large for a grid
+        generations = [[_Entity(f"n_{g}_{i}") for i in range(g % 13 + 1)] for g in range(100)]
+        graph = nx.DiGraph()
+        for previous, nodes in zip(generations, generations[1:]):
+            graph.add_edges_from((previous[i % len(previous)], node) for i, node in enumerate(nodes))
+
+        dag = _DAG(graph)
+
+        assert dag.length == 100
+        assert dag.width == 13
+        assert dag._grid_width == 13
+        assert len(dag.nodes) == sum(len(nodes) for nodes in generations)
+        for g, nodes in enumerate(generations):
+            ys = sorted(dag.nodes[node.id].y for node in nodes)
+            assert all(dag.nodes[node.id].x == g for node in nodes)
+            assert 0 <= ys[0] and ys[-1] <= 12
+            assert len(set(ys)) == len(nodes)
+        # the layout is computed once per topology
+        assert {id: (n.x, n.y) for id, n in _DAG(graph).nodes.items()} == {
+            id: (n.x, n.y) for id, n in dag.nodes.items()
+        }
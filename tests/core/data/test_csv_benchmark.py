@@ -0,0 +1,114 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Benchmark of CSV data node reads on wide files.
+
+The reads are done with the C and pyarrow engines, on all the columns or on a projection of two
+columns, and with inferred or cached column types. The tests check that every read returns the
+same data as pandas, on a few file sizes. Sizes are given as <rows>x<columns>; larger files can be
+benchmarked with:
+
+    TAIPY_CSV_BENCHMARK_SIZES=100000x200,10000x2000 python tests/core/data/test_csv_benchmark.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.common.config.common.scope import Scope
+from taipy.core.data.csv import CSVDataNode
+
+_SIZES = [
+    tuple(int(n) for n in s.split("x"))
+    for s in os.environ.get("TAIPY_CSV_BENCHMARK_SIZES", "1000x50,1000x500,10000x200").split(",")
+]
+_PROJECTION = ["c1", "c0"]
+
+
+def _write_wide_csv(path: str, n_rows: int, n_columns: int) -> None:
+    rng = np.random.default_rng(n_rows * n_columns)
+    data = {f"c{i}": rng.normal(0, 100, n_rows) for i in range(n_columns)}
+    # A few integer and text columns so that type inference has more than floats to detect
+    for i in range(0, n_columns, 10):
+        data[f"c{i}"] = rng.integers(0, 1000, n_rows)
+    for i in range(5, n_columns, 10):
+        data[f"c{i}"] = rng.choice(["a", "b", "c"], n_rows)
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def _cases():
+    yield "c", {"engine": "c"}, False, False
+    yield "pyarrow", {"engine": "pyarrow"}, False, False
+    yield "c_projected", {"engine": "c"}, True, False
+    yield "pyarrow_projected", {"engine": "pyarrow"}, True, False
+    yield "inferred", {}, False, False
+    yield "cached_schema", {"cache_schema": True}, False, True
+    yield "cached_schema_projected", {"cache_schema": True}, True, True
+
+
+def _has_engine(properties) -> bool:
+    return properties.get("engine") != "pyarrow" or importlib.util.find_spec("pyarrow") is not None
+
+
+def _data_node(path: str, properties, warm_up: bool) -> CSVDataNode:
+    csv_dn = CSVDataNode("wide", Scope.SCENARIO, properties={"path": path, **properties})
+    if warm_up:
+        # The first read infers the column types and stores them
+        csv_dn.read()
+    return csv_dn
+
+
+def _read(csv_dn: CSVDataNode, projected: bool) -> pd.DataFrame:
+    if projected:
+        return csv_dn._read_as_pandas_dataframe(csv_dn.path, column_names=_PROJECTION)
+    return csv_dn.read()
+
+
+def _timed(fn, data):
+    start = time.perf_counter()
+    result = fn(data)
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("size", _SIZES, ids=[f"{r}x{c}" for r, c in _SIZES])
+@pytest.mark.parametrize("name, properties, projected, warm_up", list(_cases()), ids=[c[0] for c in _cases()])
+def test_wide_csv_read_matches_pandas(name, properties, projected, warm_up, size, tmp_path):
+    if not _has_engine(properties):
+        pytest.skip("pyarrow is not installed")
+    path = str(tmp_path / "wide.csv")
+    _write_wide_csv(path, *size)
+    csv_dn = _data_node(path, properties, warm_up)
+
+    data, _ = _timed(lambda dn: _read(dn, projected), csv_dn)
+    expected = pd.read_csv(path)
+    if projected:
+        expected = expected[_PROJECTION]
+    pd.testing.assert_frame_equal(data, expected, check_dtype=False, check_exact=False)
+
+
+if __name__ == "__main__":
+    print(f"{'read':<24} {'size':>12} {'time (s)':>10}")  # noqa: T201
+    with tempfile.TemporaryDirectory() as directory:
+        for n_rows, n_columns in _SIZES:
+            path = os.path.join(directory, f"wide_{n_rows}x{n_columns}.csv")
+            _write_wide_csv(path, n_rows, n_columns)
+            for name, properties, projected, warm_up in _cases():
+                if not _has_engine(properties):
+                    print(f"{name:<24} {f'{n_rows}x{n_columns}':>12} {'-':>10}")  # noqa: T201
+                    continue
+                csv_dn = _data_node(path, properties, warm_up)
+                _, elapsed = _timed(lambda dn: _read(dn, projected), csv_dn)  # noqa: B023
+                print(f"{name:<24} {f'{n_rows}x{n_columns}':>12} {elapsed:>10.3f}")  # noqa: T201
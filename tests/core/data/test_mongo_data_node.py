@@ -15,6 +15,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 import mongomock
+import pandas as pd
 import pymongo
 import pytest
 from bson import ObjectId
@@ -371,3 +372,60 @@ class TestMongoCollectionDataNode:
             mongo_dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_as_pandas_with_projection(self, properties):
+        custom_properties = {**properties, "exposed_type": "pandas", "projection": {"_id": 0, "foo": 1}}
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=custom_properties)
+        mongo_dn.write(pd.DataFrame({"foo": [1, 2, 3], "bar": [4, 5, 6]}))
+
+        with patch.object(mongo_dn, "_decoder") as decoder_mock:
+            data = mongo_dn.read()
+            assert decoder_mock.call_count == 0
+        pd.testing.assert_frame_equal(data, pd.DataFrame({"foo": [1, 2, 3]}))
+
+        filtered_data = mongo_dn.filter(("foo", 1, Operator.GREATER_THAN))
+        pd.testing.assert_frame_equal(filtered_data, pd.DataFrame({"foo": [2, 3]}))
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_in_unordered_batches(self, properties):
+        custom_properties = {**properties, "batch_size": 2, "ordered_insert": False}
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=custom_properties)
+        data = [{"foo": i} for i in range(5)]
+
+        with patch.object(mongo_dn.collection, "insert_many", wraps=mongo_dn.collection.insert_many) as insert_mock:
+            mongo_dn.write(data)
+            assert [len(c.args[0]) for c in insert_mock.call_args_list] == [2, 2, 1]
+            assert all(c.kwargs["ordered"] is False for c in insert_mock.call_args_list)
+
+        assert sorted(row.foo for row in mongo_dn.read()) == list(range(5))
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_with_upsert_key(self, properties):
+        custom_properties = {**properties, "upsert_key": "foo", "batch_size": 2}
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=custom_properties)
+        mongo_dn.write([{"foo": 1, "bar": 1}, {"foo": 2, "bar": 2}, {"foo": 3, "bar": 3}])
+
+        with patch.object(mongo_dn.collection, "drop") as drop_mock:
+            mongo_dn.write([{"foo": 2, "bar": 20}, {"foo": 4, "bar": 40}])
+            assert drop_mock.call_count == 0
+
+        assert sorted((row.foo, row.bar) for row in mongo_dn.read()) == [(1, 1), (2, 20), (3, 3), (4, 40)]
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    @pytest.mark.parametrize("batch_size", [None, 0, 2])
+    def test_write_empty_data_with_upsert_key(self, properties, batch_size):
+        custom_properties = {**properties, "upsert_key": "foo", "batch_size": batch_size}
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=custom_properties)
+        mongo_dn.write([{"foo": 1, "bar": 1}])
+
+        with patch.object(mongo_dn.collection, "bulk_write") as bulk_write_mock:
+            mongo_dn.write([])
+            mongo_dn.write(pd.DataFrame())
+            assert bulk_write_mock.call_count == 0
+
+        assert [(row.foo, row.bar) for row in mongo_dn.read()] == [(1, 1)]
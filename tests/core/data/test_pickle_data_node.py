@@ -14,8 +14,10 @@ import pathlib
 import pickle
 from datetime import datetime, timedelta
 from time import sleep
+from unittest import mock
 
 import freezegun
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -26,7 +28,7 @@ from taipy.common.config.exceptions.exceptions import InvalidConfigurationId
 from taipy.core.data._data_manager import _DataManager
 from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.pickle import PickleDataNode
-from taipy.core.exceptions.exceptions import NoData
+from taipy.core.exceptions.exceptions import NoData, UnknownCompressionAlgorithm
 from taipy.core.reason import NoFileToDownload, NotAFile
 
 
@@ -206,6 +208,98 @@ class TestPickleDataNodeEntity:
         assert ".data" not in dn.path
         assert os.path.exists(dn.path)
 
+    @pytest.mark.parametrize("compression", [None, "gzip", "bz2", "lzma", "zstd", "lz4"])
+    def test_read_and_write_with_compression(self, compression, tmp_path):
+        if compression in ("zstd", "lz4"):
+            pytest.importorskip("zstandard" if compression == "zstd" else "lz4")
+        path = str(tmp_path / "compressed.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "compression": compression})
+        data = pd.DataFrame({"a": np.zeros(10_000), "b": ["x"] * 10_000})
+        dn.write(data)
+        assert_frame_equal(dn.read(), data)
+        if compression:
+            assert os.path.getsize(path) < len(pickle.dumps(data))
+
+        # The compression is detected when reading, whatever the property value
+        assert_frame_equal(PickleDataNode("foo", Scope.SCENARIO, properties={"path": path}).read(), data)
+
+    def test_raise_error_unknown_compression_algorithm(self):
+        with pytest.raises(UnknownCompressionAlgorithm):
+            PickleDataNode("foo", Scope.SCENARIO, properties={"compression": "foo"})
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_read_and_write_with_out_of_band_buffers(self, compression, tmp_path):
+        path = str(tmp_path / "oob.p")
+        dn = PickleDataNode(
+            "foo", Scope.SCENARIO, properties={"path": path, "out_of_band_buffers": True, "compression": compression}
+        )
+        array = np.arange(100_000, dtype="float64")
+        df = pd.DataFrame({"a": np.arange(1_000), "b": np.ones(1_000)})
+        dn.write({"array": array, "df": df, "text": "abc"})
+
+        buffers_path = path + ".buffers"
+        assert os.path.isfile(buffers_path)
+        assert os.path.getsize(path) < array.nbytes
+        assert os.path.getsize(buffers_path) >= array.nbytes
+
+        data = dn.read()
+        np.testing.assert_array_equal(data["array"], array)
+        assert_frame_equal(data["df"], df)
+        assert data["text"] == "abc"
+        # The memory-mapped data is writable without modifying the file
+        data["array"][0] = 42
+        assert dn.read()["array"][0] == 0
+
+        # Data without large buffers does not need the side file anymore
+        dn.write("no buffer")
+        assert not os.path.exists(buffers_path)
+        assert dn.read() == "no buffer"
+
+    def test_write_keeps_previously_read_buffers(self, tmp_path):
+        path = str(tmp_path / "oob.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "out_of_band_buffers": True})
+        dn.write({"a": np.zeros(1_000_000)})
+        old = dn.read()["a"]
+
+        dn.write({"a": np.full(1_000_000, 7.0)})
+        assert not old.any()
+        assert (dn.read()["a"] == 7.0).all()
+
+        # A shorter buffers file does not invalidate the arrays read before
+        dn.write({"a": np.ones(10)})
+        assert not old.any()
+        np.testing.assert_array_equal(dn.read()["a"], np.ones(10))
+
+    @pytest.mark.parametrize("map_buffers", [True, False])
+    def test_write_keeps_previously_read_buffers_mapped_or_not(self, map_buffers, tmp_path):
+        # Buffers are only memory-mapped on POSIX systems: on Windows, a mapped file cannot be replaced
+        path = str(tmp_path / "oob.p")
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "out_of_band_buffers": True})
+        with mock.patch.object(PickleDataNode, "_PickleDataNode__MAP_BUFFERS", map_buffers):
+            dn.write({"a": np.zeros(1_000)})
+            old = dn.read()["a"]
+            old[0] = 1.0
+            dn.write({"a": np.full(1_000, 7.0)})
+            assert old.sum() == 1.0
+            assert (dn.read()["a"] == 7.0).all()
+
+    def test_read_does_not_mix_data_and_buffers_of_different_writes(self, tmp_path):
+        path = str(tmp_path / "oob.p")
+        buffers_path = path + ".buffers"
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path, "out_of_band_buffers": True})
+        dn.write({"a": np.zeros(1_000)})
+        with open(buffers_path, "rb") as f:
+            old_buffers = f.read()
+        dn.write({"a": np.ones(1_000)})
+        # The buffers file of the previous write is found along with the new data
+        with open(buffers_path, "wb") as f:
+            f.write(old_buffers)
+        with mock.patch("taipy.core.data.pickle.time.sleep"):
+            with pytest.raises(pickle.UnpicklingError):
+                dn.read()
+        assert not os.path.exists(path + ".tmp")
+        assert not os.path.exists(buffers_path + ".tmp")
+
     def test_is_downloadable(self):
         path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.p")
         dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": path})
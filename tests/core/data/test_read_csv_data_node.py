@@ -12,6 +12,8 @@
 import dataclasses
 import os
 import pathlib
+import shutil
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -19,7 +21,7 @@ import pytest
 
 from taipy.common.config.common.scope import Scope
 from taipy.core.data.csv import CSVDataNode
-from taipy.core.exceptions.exceptions import NoData
+from taipy.core.exceptions.exceptions import NoData, UnknownCSVEngine
 
 csv_file_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.csv")
 
@@ -114,3 +116,64 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_raise_error_unknown_csv_engine():
+    with pytest.raises(UnknownCSVEngine):
+        CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file_path, "engine": "foo"})
+
+
+@pytest.mark.parametrize("engine", ["c", "python", "pyarrow"])
+def test_read_with_engine_and_dtype(engine):
+    csv_dn = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "engine": engine, "dtype": {"integer": "float64"}}
+    )
+    data = csv_dn.read()
+    assert data["integer"].dtype == "float64"
+    assert pd.DataFrame.equals(data, pd.read_csv(csv_file_path, dtype={"integer": "float64"}))
+
+
+def test_read_projected_columns():
+    csv_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    data = csv_dn._read_as_pandas_dataframe(csv_file_path, column_names=["text", "id"])
+    assert list(data.columns) == ["text", "id"]
+    assert pd.DataFrame.equals(data, pd.read_csv(csv_file_path)[["text", "id"]])
+
+
+def test_read_with_cached_schema(tmp_path):
+    path = str(tmp_path / "example.csv")
+    shutil.copy(csv_file_path, path)
+    csv_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": path, "cache_schema": True})
+
+    expected = pd.read_csv(csv_file_path)
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+        assert pd.DataFrame.equals(csv_dn.read(), expected)
+        assert "dtype" not in read_csv.call_args.kwargs
+        assert pd.DataFrame.equals(csv_dn.read(), expected)
+        assert read_csv.call_args.kwargs["dtype"] == {"id": "object", "integer": "int64", "text": "object"}
+
+    # The cached schema no longer matches the file content, so the types are inferred again
+    csv_dn.write(pd.DataFrame({"id": [1, 2], "integer": [1.5, None], "text": ["a", "b"]}))
+    data = csv_dn.read()
+    assert data["integer"].dtype == "float64"
+    assert csv_dn.read()["integer"].dtype == "float64"
+
+
+def test_cached_schema_is_dropped_when_the_file_changes(tmp_path):
+    path = str(tmp_path / "example.csv")
+    pd.DataFrame({"a": ["x", "y"], "b": [1, 2]}).to_csv(path, index=False)
+    csv_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": path, "cache_schema": True})
+    assert csv_dn.read()["a"].dtype == "object"
+
+    # The new content could still be parsed with the previous types
+    csv_dn.write(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+    data = csv_dn.read()
+    assert data["a"].tolist() == [1, 2]
+    assert data["a"].dtype == "int64"
+    assert data["b"].dtype == "int64"
+
+    # Changes made outside of the data node are detected too
+    pd.DataFrame({"a": ["z"], "b": [1.5]}).to_csv(path, index=False)
+    data = csv_dn.read()
+    assert data["a"].dtype == "object"
+    assert data["b"].dtype == "float64"
@@ -11,7 +11,9 @@
 
 import os
 import pathlib
+import shutil
 from typing import Dict
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -734,3 +736,48 @@ def test_read_multi_sheet_without_header_multiple_custom_pandas_numpy_exposed_ty
     multi_data_custom_no_sheet_name = excel_dn_as_pandas_numpy.read()
     assert isinstance(multi_data_custom_no_sheet_name["Sheet1"], pd.DataFrame)
     assert isinstance(multi_data_custom_no_sheet_name["Sheet2"], np.ndarray)
+
+
+@pytest.mark.parametrize("has_header", [True, False])
+def test_read_with_columnar_cache(has_header, tmp_path):
+    path = str(tmp_path / "example.xlsx")
+    shutil.copy(excel_file_path, path)
+    excel_dn = ExcelDataNode(
+        "bar", Scope.SCENARIO, properties={"path": path, "has_header": has_header, "columnar_cache": True}
+    )
+    expected = pd.read_excel(excel_file_path, sheet_name=None, header=0 if has_header else None)
+
+    with mock.patch("pandas.read_excel", wraps=pd.read_excel) as read_excel:
+        first_read = excel_dn.read()
+        second_read = excel_dn.read()
+        assert read_excel.call_count == 1
+
+    assert os.path.isdir(tmp_path / ".example.xlsx.taipy_cache")
+    for data in (first_read, second_read):
+        assert data.keys() == expected.keys()
+        for sheet_name, df in expected.items():
+            pd.testing.assert_frame_equal(data[sheet_name], df)
+
+    excel_dn.properties["sheet_name"] = "Sheet2"
+    excel_dn.properties["exposed_type"] = "numpy"
+    assert np.array_equal(excel_dn.read(), expected["Sheet2"].to_numpy())
+
+    # Writing the Excel file invalidates the cache
+    excel_dn.properties["sheet_name"] = None
+    excel_dn.properties["exposed_type"] = "pandas"
+    excel_dn.write(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+    with mock.patch("pandas.read_excel", wraps=pd.read_excel) as read_excel:
+        data = excel_dn.read()
+        assert read_excel.call_count == 1
+    assert list(data.keys()) == ["Sheet1"]
+    pd.testing.assert_frame_equal(data["Sheet1"], pd.read_excel(path, header=0 if has_header else None))
+
+
+def test_read_with_columnar_cache_missing_sheet(tmp_path):
+    path = str(tmp_path / "example.xlsx")
+    shutil.copy(excel_file_path, path)
+    excel_dn = ExcelDataNode(
+        "bar", Scope.SCENARIO, properties={"path": path, "sheet_name": "abc", "columnar_cache": True}
+    )
+    with pytest.raises(ValueError):
+        excel_dn.read()
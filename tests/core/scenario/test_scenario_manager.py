@@ -1265,6 +1265,36 @@ def test_scenarios_comparison():
         _ScenarioManager._compare(scenario_1, scenario_2, data_node_config_id="abc")
 
 
+def test_scenarios_comparison_reads_each_data_node_once():
+    scenario_config = Config.configure_scenario(
+        "Awesome_scenario",
+        [
+            Config.configure_task(
+                "mult_by_2",
+                mult_by_2,
+                [Config.configure_data_node("foo", "in_memory", Scope.GLOBAL, default_data=1)],
+                Config.configure_data_node("bar", "in_memory", Scope.SCENARIO, default_data=0),
+            )
+        ],
+        comparators={"bar": [subtraction, addition], "foo": [subtraction, addition]},
+    )
+    scenario_1 = _ScenarioManager._create(scenario_config)
+    scenario_2 = _ScenarioManager._create(scenario_config)
+    _ScenarioManager._submit(scenario_1.id)
+    _ScenarioManager._submit(scenario_2.id)
+
+    with patch("taipy.core.data.in_memory.InMemoryDataNode._read", autospec=True) as mck:
+        mck.side_effect = lambda dn: 1 if dn.config_id == "foo" else 2
+        results = _ScenarioManager._compare(scenario_1, scenario_2)
+        # The global "foo" data node is shared by both scenarios, so it is only read once
+        assert mck.call_count == 3
+
+    assert results == {"bar": {"subtraction": 0, "addition": 4}, "foo": {"subtraction": 0, "addition": 2}}
+
+    streamed = list(_ScenarioManager._compare_iter(scenario_1, scenario_2, data_node_config_id="bar"))
+    assert sorted(streamed) == [("bar", "addition", 4), ("bar", "subtraction", 0)]
+
+
 def test_tags():
     cycle_1 = _CycleManager._create(Frequency.DAILY, name="today", creation_date=datetime.now())
     cycle_2 = _CycleManager._create(
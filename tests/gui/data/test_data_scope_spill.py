@@ -0,0 +1,149 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pickle
+from threading import Event, Lock
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from taipy.gui.data.data_scope import _DataScopes
+from taipy.gui.utils import _MapDict
+
+
+def _data_scopes(tmp_path, budget: int) -> _DataScopes:
+    config = {"state_memory_budget": budget, "state_spill_folder": str(tmp_path)}
+    gui = Mock()
+    gui._get_config.side_effect = lambda name, default: config.get(name, default)
+    gui._get_shared_variables.return_value = []
+    scopes = _DataScopes(gui)
+    scopes.set_single_client(False)
+    return scopes
+
+
+def _get_scope(scopes: _DataScopes, id: str, now: float):
+    with patch("taipy.gui.data.data_scope.time.monotonic", return_value=now):
+        scope = scopes.get_scope(id)[0]
+    # the memory is checked in the background
+    scopes.join_memory_check()
+    return scope
+
+
+def test_memory_usage(tmp_path):
+    scopes = _data_scopes(tmp_path, 0)
+    scopes.create_scope("client")
+    scope = scopes.get_scope("client")[0]
+    scope.df = pd.DataFrame({"a": range(1000)})
+    scope.d = _MapDict({"a": list(range(100))})
+    usage = scopes.get_memory_usage()["client"]
+    assert usage["df"] >= 8000
+    assert usage["d"] > 100
+    assert not os.listdir(tmp_path)
+
+
+def test_spill_and_restore(tmp_path):
+    scopes = _data_scopes(tmp_path, 10_000)
+    for id in ("client1", "client2"):
+        scopes.create_scope(id)
+        scope = _get_scope(scopes, id, 1)
+        scope.df = pd.DataFrame({"a": range(1000)})
+        scope.d = _MapDict({"a": 1})
+    # the memory is not checked again before the check period
+    _get_scope(scopes, "client2", 5)
+    assert scopes.get_spilled_count() == 0
+    # client1 is idle, client2 is active
+    _get_scope(scopes, "client2", 1000)
+    assert scopes.get_spilled_count() == 1
+    assert len(os.listdir(tmp_path)) == 1
+    # values set while broadcasting are applied on restore
+    all_scopes = scopes.get_all_scopes()
+    assert set(all_scopes) == {_DataScopes._GLOBAL_ID, "client1", "client2"}
+    for scope in all_scopes.values():
+        scope.shared = 12
+    assert scopes.get_spilled_count() == 1
+    scope = _get_scope(scopes, "client1", 1030)
+    assert scopes.get_spilled_count() == 0
+    assert not os.listdir(tmp_path)
+    assert scope.df.equals(pd.DataFrame({"a": range(1000)}))
+    assert scope.d._dict == {"a": 1}
+    assert scope.shared == 12
+
+
+def test_unpicklable_scope(tmp_path):
+    scopes = _data_scopes(tmp_path, 1)
+    scopes.create_scope("client1")
+    _get_scope(scopes, "client1", 1).lock = Lock()
+    scopes.create_scope("client2")
+    with pytest.warns(UserWarning, match="cannot be spilled"):
+        _get_scope(scopes, "client2", 1000)
+    assert scopes.get_spilled_count() == 0
+    assert _get_scope(scopes, "client1", 2000).lock is not None
+
+
+def test_delete_spilled_scope(tmp_path):
+    scopes = _data_scopes(tmp_path, 1)
+    scopes.create_scope("client1")
+    _get_scope(scopes, "client1", 1).value = 1
+    scopes.create_scope("client2")
+    _get_scope(scopes, "client2", 1000)
+    assert scopes.get_spilled_count() == 1
+    scopes.delete_scope("client1")
+    assert scopes.get_spilled_count() == 0
+    assert not os.listdir(tmp_path)
+
+
+def test_spill_does_not_block_other_clients(tmp_path):
+    scopes = _data_scopes(tmp_path, 1)
+    for id in ("client1", "client2"):
+        scopes.create_scope(id)
+        _get_scope(scopes, id, 1).value = id
+    writing = Event()
+    release = Event()
+    dump = pickle.dump
+
+    def slow_dump(*args, **kwargs):
+        writing.set()
+        release.wait(5)
+        dump(*args, **kwargs)
+
+    with patch("taipy.gui.data.data_scope.pickle.dump", side_effect=slow_dump):
+        with patch("taipy.gui.data.data_scope.time.monotonic", return_value=1000):
+            scopes.get_scope("client2")
+        assert writing.wait(5)
+        # the other clients are served while an idle state is written to disk
+        with patch("taipy.gui.data.data_scope.time.monotonic", return_value=1001):
+            assert scopes.get_scope("client2")[0].value == "client2"
+        # a state modified while it is written is not spilled
+        for scope in scopes.get_all_scopes().values():
+            scope.shared = 12
+        release.set()
+        scopes.join_memory_check()
+    assert scopes.get_spilled_count() == 0
+    assert not os.listdir(tmp_path)
+    assert _get_scope(scopes, "client1", 1002).shared == 12
+
+
+def test_restore_failure(tmp_path):
+    scopes = _data_scopes(tmp_path, 1)
+    scopes.create_scope("client1")
+    _get_scope(scopes, "client1", 1).value = 1
+    scopes.create_scope("client2")
+    _get_scope(scopes, "client2", 1000)
+    assert scopes.get_spilled_count() == 1
+    (path,) = [os.path.join(tmp_path, f) for f in os.listdir(tmp_path)]
+    with open(path, "wb") as file:
+        file.write(b"not a pickle")
+    with pytest.raises(RuntimeError, match="cannot be restored"):
+        _get_scope(scopes, "client1", 1001)
+    # the state is not replaced by an empty one
+    assert scopes.get_spilled_count() == 1
@@ -0,0 +1,171 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Benchmark of the decimators against the original loop-based implementations.
+
+The tests check that the decimators select the same points as the reference implementations
+below, on a few data sizes. Larger sizes can be benchmarked with:
+
+    TAIPY_DECIMATOR_BENCHMARK_SIZES=1000000,10000000 python tests/gui/data/test_decimator_benchmark.py
+"""
+
+import os
+import time
+import typing as t
+
+import numpy as np
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP, MinMaxDecimator, ScatterDecimator
+
+_SIZES = [int(s) for s in os.environ.get("TAIPY_DECIMATOR_BENCHMARK_SIZES", "1000,10000,100000").split(",")]
+# The reference RDP implementation is too slow to run on large data sets
+_RDP_MAX_SIZE = 100_000
+
+
+def _reference_lttb(data: np.ndarray, n_out: int) -> np.ndarray:
+    if n_out >= data.shape[0]:
+        return np.full(len(data), True)
+    n_bins = n_out - 2
+    data_bins = np.array_split(data[1:-1], n_bins)
+    prev_a = data[0]
+    start_pos = 0
+    out_mask = np.full(len(data), False)
+    out_mask[0] = True
+    out_mask[len(data) - 1] = True
+    for i in range(len(data_bins)):
+        this_bin = data_bins[i]
+        next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
+        a = prev_a
+        bs = this_bin
+        c = next_bin.mean(axis=0)
+        areas = 0.5 * abs((a[0] - c[0]) * ((bs - a)[:, 1]) - ((a - bs)[:, 0]) * (c[1] - a[1]))
+        bs_pos = np.argmax(areas)
+        prev_a = bs[bs_pos]
+        out_mask[start_pos + bs_pos] = True
+        start_pos += len(this_bin)
+    return out_mask
+
+
+def _reference_scatter(data: np.ndarray, width: int, height: int, max_overlap_points: int = 3) -> np.ndarray:
+    n_rows = data.shape[0]
+    mask = np.full(n_rows, False)
+    x_col, y_col = data[:, 0], data[:, 1]
+    x_grid_map = np.rint((x_col - np.amin(x_col)) * width / (np.amax(x_col) - np.amin(x_col))).astype(int)
+    y_grid_map = np.rint((y_col - np.amin(y_col)) * height / (np.amax(y_col) - np.amin(y_col))).astype(int)
+    grid = np.zeros((width + 1, height + 1), dtype=int)
+    for i in np.arange(n_rows):
+        if grid[x_grid_map[i], y_grid_map[i]] < max_overlap_points:
+            grid[x_grid_map[i], y_grid_map[i]] += 1
+            mask[i] = True
+    return mask
+
+
+def _reference_dsquared_line_points(P1, P2, points):
+    xdiff = P2[0] - P1[0]
+    ydiff = P2[1] - P1[1]
+    nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+    denom = ydiff**2 + xdiff**2
+    return np.divide(nom, denom)
+
+
+def _reference_rdp_epsilon(data: np.ndarray, epsilon: int) -> np.ndarray:
+    mask = np.full(data.shape[0], True)
+    stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _reference_dsquared_line_points(data[start], data[end], data[start + 1 : end])
+        if (dsq > epsilon**2).any():
+            mid = np.argmax(dsq) + 1 + start
+            stack.append((start, mid))
+            stack.append((mid, end))
+        else:
+            mask[start + 1 : end] = False
+    return mask
+
+
+def _reference_rdp_points(data: np.ndarray, n_out: int) -> np.ndarray:
+    M_len = data.shape[0]
+    weights = np.empty(M_len)
+    weights[0] = float("inf")
+    weights[M_len - 1] = float("inf")
+    stack = [(0, M_len - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _reference_dsquared_line_points(data[start], data[end], data[start + 1 : end])
+        max_dist_index = np.argmax(dsq) + start + 1
+        weights[max_dist_index] = np.amax(dsq)
+        stack.append((start, max_dist_index))
+        stack.append((max_dist_index, end))
+    return weights >= np.sort(weights)[M_len - n_out]
+
+
+def _series(size: int) -> np.ndarray:
+    rng = np.random.default_rng(size)
+    x = np.arange(size, dtype=float)
+    return np.column_stack((x, np.sin(x / (size / 20)) * 100 + rng.normal(0, 5, size)))
+
+
+def _cases():
+    yield "lttb", lambda d: LTTB(2000)._decimate(d, {}), lambda d: _reference_lttb(d, 2000), None
+    yield "minmax", lambda d: MinMaxDecimator(2000)._decimate(d, {}), None, None
+    yield (
+        "scatter",
+        lambda d: ScatterDecimator()._decimate(d, {"width": 400, "height": 300}),
+        lambda d: _reference_scatter(d, 400, 300),
+        None,
+    )
+    yield (
+        "rdp_epsilon",
+        lambda d: RDP(epsilon=5)._decimate(d, {}),
+        lambda d: _reference_rdp_epsilon(d, 5),
+        _RDP_MAX_SIZE,
+    )
+    yield (
+        "rdp_n_out",
+        lambda d: RDP(n_out=2000)._decimate(d, {}),
+        lambda d: _reference_rdp_points(d, 2000),
+        _RDP_MAX_SIZE,
+    )
+
+
+def _timed(fn, data):
+    start = time.perf_counter()
+    result = fn(data)
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("size", _SIZES)
+@pytest.mark.parametrize("name, decimate, reference, max_size", list(_cases()), ids=[c[0] for c in _cases()])
+def test_decimator_matches_reference(name, decimate, reference, max_size, size):
+    data = _series(size)
+    mask, _ = _timed(decimate, data)
+    assert mask.shape == (size,)
+    if reference is not None and (max_size is None or size <= max_size):
+        expected, _ = _timed(reference, data)
+        np.testing.assert_array_equal(mask, expected)
+
+
+if __name__ == "__main__":
+    print(f"{'decimator':<12} {'size':>10} {'time (s)':>10} {'reference (s)':>14}")  # noqa: T201
+    for size in _SIZES:
+        data = _series(size)
+        for name, decimate, reference, max_size in _cases():
+            mask, elapsed = _timed(decimate, data)
+            ref_elapsed = "-"
+            if reference is not None and (max_size is None or size <= max_size):
+                expected, ref_time = _timed(reference, data)
+                ref_elapsed = f"{ref_time:.3f}" + ("" if np.array_equal(mask, expected) else " (differs)")
+            print(f"{name:<12} {size:>10} {elapsed:>10.3f} {ref_elapsed:>14}")  # noqa: T201
@@ -11,8 +11,10 @@
 
 import inspect
 import os
+import weakref
 from datetime import datetime
 from importlib import util
+from unittest.mock import patch
 
 import pandas
 from flask import g
@@ -48,6 +50,36 @@ def test_simple_data_with_arrow(gui: Gui, helpers, small_dataframe):
         assert isinstance(data, bytes)
 
 
+def test_arrow_pages_are_sliced_from_cached_table(gui: Gui, helpers):
+    if util.find_spec("pyarrow"):
+        import pyarrow as pa
+
+        accessor = _PandasDataAccessor(gui)
+        pd = pandas.DataFrame(
+            data={
+                "value": range(100),
+                "date": pandas.date_range("2024-01-01", periods=100, freq="D", tz="UTC"),
+            }
+        )
+        query = {"columns": ["value", "date"], "orderby": "value", "sort": "desc"}
+        format_dates = _PandasDataAccessor._PandasDataAccessor__format_dates  # type: ignore[attr-defined]
+        with patch.object(_PandasDataAccessor, "_PandasDataAccessor__format_dates", wraps=format_dates) as mock_dates:
+            pages = [
+                accessor.get_data("x", pd, {**query, "start": start, "end": start + 9}, _DataFormat.APACHE_ARROW)
+                for start in (0, 50)
+            ]
+            # dates are converted once, when the Arrow table is built
+            assert mock_dates.call_count == 1
+        for start, page in zip((0, 50), pages):
+            value = page["value"]
+            assert value["rowcount"] == 100
+            assert value["orient"] == "records"
+            rows = pa.ipc.open_stream(value["data"]).read_all().to_pylist()
+            assert [row["value"] for row in rows] == list(range(99 - start, 89 - start, -1))
+            assert [row["_tp_index"] for row in rows] == list(range(99 - start, 89 - start, -1))
+            assert rows[0]["date_str"] == pd["date"][99 - start].strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
 def test_get_all_simple_data(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(data=small_dataframe)
@@ -134,6 +166,121 @@ def test_sort(gui: Gui, helpers, small_dataframe):
     assert data[0]["name"] == "C"
 
 
+def test_sort_pages_are_cached(gui: Gui, helpers):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(100)], "value": range(100)})
+    query = {
+        "columns": ["name", "value"],
+        "orderby": "value",
+        "sort": "desc",
+        "filters": [{"col": "value", "action": ">=", "value": 10}],
+    }
+    with patch.object(pandas.DataFrame, "query", autospec=True, side_effect=pandas.DataFrame.query) as mock_query:
+        data = accessor.get_data("x", pd, {**query, "start": 0, "end": 9}, _DataFormat.JSON)["value"]
+        assert data["rowcount"] == 90
+        assert [row["value"] for row in data["data"]] == list(range(99, 89, -1))
+        data = accessor.get_data("x", pd, {**query, "start": 80, "end": 89}, _DataFormat.JSON)["value"]
+        assert [row["value"] for row in data["data"]] == list(range(19, 9, -1))
+        assert [row["_tp_index"] for row in data["data"]] == list(range(19, 9, -1))
+        assert mock_query.call_count == 1
+
+        # in place modifications are only taken into account once the cache is invalidated
+        pd.loc[99, "value"] = -1
+        accessor._invalidate_cache("x")
+        data = accessor.get_data("x", pd, {**query, "start": 0, "end": 9}, _DataFormat.JSON)["value"]
+        assert data["rowcount"] == 89
+        assert data["data"][0]["value"] == 98
+        assert mock_query.call_count == 2
+
+        # another data frame is never served from the cache
+        data = accessor.get_data("x", pd.copy(), {**query, "start": 0, "end": 9}, _DataFormat.JSON)["value"]
+        assert data["data"][0]["value"] == 98
+        assert mock_query.call_count == 3
+
+
+def test_cache_invalidation_is_shared_by_clients(gui: Gui, helpers):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(10)], "value": range(10)})
+    query = {"columns": ["name", "value"], "orderby": "value", "sort": "desc", "start": 0, "end": 4}
+    gui.run(run_server=False)
+    with gui.get_flask_app().test_request_context("/"):
+        for client_id in ["client1", "client2"]:
+            g.client_id = client_id
+            data = accessor.get_data("x", pd, query, _DataFormat.JSON)["value"]["data"]
+            assert data[0]["value"] == 9
+        # a shared data frame is modified in place, then updated by one client
+        pd.loc[0, "value"] = 100
+        g.client_id = "client1"
+        accessor._invalidate_cache("x")
+        g.client_id = "client2"
+        data = accessor.get_data("x", pd, query, _DataFormat.JSON)["value"]["data"]
+        assert data[0]["value"] == 100
+
+
+def test_cache_does_not_keep_data(gui: Gui, helpers):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(10)], "value": range(10)})
+    query = {"columns": ["name", "value"], "orderby": "value", "sort": "desc", "start": 0, "end": 4}
+    accessor.get_data("x", pd, query, _DataFormat.JSON)
+    pd_ref = weakref.ref(pd)
+    del pd
+    assert pd_ref() is None
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(10)], "value": range(10)})
+    with patch.object(pandas.DataFrame, "query", autospec=True, side_effect=pandas.DataFrame.query) as mock_query:
+        filtered = {**query, "filters": [{"col": "value", "action": ">=", "value": 5}]}
+        accessor.get_data("x", pd, filtered, _DataFormat.JSON)
+        accessor._forget("")
+        accessor.get_data("x", pd, filtered, _DataFormat.JSON)
+        assert mock_query.call_count == 2
+
+
+def test_page_deltas(gui: Gui, helpers):
+    gui._config.config["data_delta_updates"] = True
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(5)], "value": range(5)})
+    table = {"columns": ["name", "value"], "pagekey": "0-9", "start": 0, "end": 9}
+    chart = {"columns": ["name", "value"], "pagekey": "chart", "alldata": True}
+    accessor.get_data("x", pd, table, _DataFormat.JSON)
+    accessor.get_data("x", pd, chart, _DataFormat.JSON)
+    assert accessor.get_delta("y", pd, _DataFormat.JSON) is None
+
+    # one row is appended
+    pd = pandas.concat([pd, pandas.DataFrame(data={"name": ["N005"], "value": [5]})], ignore_index=True)
+    delta = accessor.get_delta("x", pd, _DataFormat.JSON)
+    assert delta == {
+        "0-9": {"rows": {"5": {"name": "N005", "value": 5, "_tp_index": 5}}, "rowcount": 6},
+        "chart": {"append": {"name": ["N005"], "value": [5]}},
+    }
+
+    # existing values changed: the chart has to be refreshed
+    pd.loc[1, "value"] = 10
+    assert accessor.get_delta("x", pd, _DataFormat.JSON) is None
+    assert accessor.get_delta("x", pd, _DataFormat.JSON) is None
+
+    accessor.get_data("x", pd, table, _DataFormat.JSON)
+    pd.loc[2, "value"] = 20
+    delta = accessor.get_delta("x", pd, _DataFormat.JSON)
+    assert delta == {"0-9": {"rows": {"2": {"value": 20}}, "rowcount": 6}}
+
+    # too many changes
+    pd["name"] = pd["name"].str.lower()
+    pd["value"] = -pd["value"]
+    assert accessor.get_delta("x", pd, _DataFormat.JSON) is None
+
+
+def test_page_deltas_are_forgotten_with_the_client(gui: Gui, helpers):
+    gui._config.config["data_delta_updates"] = True
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"N{i:03}" for i in range(5)], "value": range(5)})
+    chart = {"columns": ["name", "value"], "pagekey": "chart", "alldata": True}
+    accessor.get_data("x", pd, chart, _DataFormat.JSON)
+    pd = pandas.concat([pd, pandas.DataFrame(data={"name": ["N005"], "value": [5]})], ignore_index=True)
+    assert accessor.get_delta("x", pd, _DataFormat.JSON) == {"chart": {"append": {"name": ["N005"], "value": [5]}}}
+    # the client is gone
+    accessor._forget("")
+    assert accessor.get_delta("x", pd, _DataFormat.JSON) is None
+
+
 def test_aggregate(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(data=small_dataframe)
@@ -11,10 +11,12 @@
 
 import contextlib
 import inspect
+from unittest.mock import patch
 
 import pytest
 
 from taipy.gui import Gui
+from taipy.gui._renderers.json import _to_json
 
 
 @contextlib.contextmanager
@@ -136,3 +138,74 @@ def test_broadcast_callback(gui: Gui):
     assert len(res) == 2
     assert res.get("test scope", None) == "Hello World"
     assert res.get("another scope", None) == "Hello World"
+
+
+def test_broadcast_changes_shared_path(gui: Gui):
+    v1 = 1  # noqa: F841
+    changes = []
+
+    def on_change(state, name, value):
+        changes.append((name, value))
+
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", "<|{v1}|><|{v1 * 2}|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ids = [gui._bindings()._get_or_create_scope(f"s{i}")[0] for i in range(5)]
+    for id in ids:
+        flask_client.get(f"/taipy-jsx/test?client_id={id}")
+    with (
+        patch("taipy.gui.gui._to_json", wraps=_to_json) as to_json,
+        patch.object(gui._server._ws, "emit") as emit,
+    ):
+        gui.broadcast_changes(v1=3)
+    # values are serialized and sent once for all the clients
+    assert to_json.call_count == 2
+    assert emit.call_count == 1
+    for id in ids:
+        with get_state(gui, id) as state:
+            assert state.v1 == 3
+            scope = gui._bindings()._get_all_scopes()[id]
+            assert [v for k, v in vars(scope).items() if k.startswith("tp_")] == [6]
+    # on_change is invoked for every state
+    assert changes == [("v1", 3)] * len(ids)
+
+
+def test_broadcast_changes_state_specific(gui: Gui):
+    v1 = 1  # noqa: F841
+    v2 = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", "<|{v1}|><|{v1 + v2}|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    s1 = gui._bindings()._get_or_create_scope("s1")[0]
+    s2 = gui._bindings()._get_or_create_scope("s2")[0]
+    flask_client.get(f"/taipy-jsx/test?client_id={s1}")
+    flask_client.get(f"/taipy-jsx/test?client_id={s2}")
+    with get_state(gui, s1) as state1:
+        state1.v2 = 20
+    gui.broadcast_changes(v1=2)
+    for id, expected in ((s1, 22), (s2, 12)):
+        with get_state(gui, id) as state:
+            assert state.v1 == 2
+            scope = gui._bindings()._get_all_scopes()[id]
+            assert [v for k, v in vars(scope).items() if k.startswith("tp_")] == [expected]
+
+
+def test_broadcast_changes_shared_path_several_variables(gui: Gui):
+    v1 = 1  # noqa: F841
+    v2 = 2  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", "<|{v1}|><|{v2}|><|{v1 + v2}|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ids = [gui._bindings()._get_or_create_scope(f"s{i}")[0] for i in range(3)]
+    for id in ids:
+        flask_client.get(f"/taipy-jsx/test?client_id={id}")
+    gui.broadcast_changes(v1=10, v2=20)
+    for id in ids:
+        with get_state(gui, id) as state:
+            assert state.v1 == 10
+            assert state.v2 == 20
+            scope = gui._bindings()._get_all_scopes()[id]
+            assert [v for k, v in vars(scope).items() if k.startswith("tp_")] == [30]
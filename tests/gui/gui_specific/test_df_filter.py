@@ -9,8 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
 from taipy.gui.data.decimator.lttb import LTTB
 from taipy.gui.data.decimator.minmax import MinMaxDecimator
+from taipy.gui.data.decimator.pyramid import _LodPyramid
 from taipy.gui.data.decimator.rdp import RDP
 from taipy.gui.data.decimator.scatter_decimator import ScatterDecimator
 
@@ -40,3 +47,50 @@ def test_data_filter_5(csvdata):
         csvdata[:1500], None, "Daily hospital occupancy", "", {"width": 200, "height": 100}, False
     )
     assert df.shape[0] == 1150
+
+
+def test_data_filter_pyramid():
+    x = np.arange(100_000, dtype=float)
+    df = pd.DataFrame({"x": x[::-1], "y": np.sin(x / 100)})
+    decimator = MinMaxDecimator(100, pyramid=True)
+    instance_payload = {"xAxis": "x", "yAxis": "y", "chartMode": "lines"}
+    payload = {"width": 100, "relayoutData": {"xaxis.range[0]": 20_000, "xaxis.range[1]": 30_000}}
+    with patch("taipy.gui.data.decimator.base._LodPyramid", wraps=_LodPyramid) as mock_pyramid:
+        for _ in range(2):
+            pyramid_df, applied, _ = decimator._on_decimate_df(df, instance_payload, payload)
+            assert applied
+            assert pyramid_df.shape[0] == 100
+            assert pyramid_df["x"].between(20_000, 30_000, inclusive="neither").all()
+            # rows are kept in their original order
+            assert pyramid_df["x"].is_monotonic_decreasing
+        # the pyramid is only built once for a given data frame
+        assert mock_pyramid.call_count == 1
+    # the peaks of the zoomed window are kept
+    zoomed_df = df[(df["x"] > 20_000) & (df["x"] < 30_000)]
+    assert pyramid_df["y"].max() == pytest.approx(zoomed_df["y"].max(), abs=1e-3)
+    assert pyramid_df["y"].min() == pytest.approx(zoomed_df["y"].min(), abs=1e-3)
+
+
+def test_data_filter_pyramid_per_data_version():
+    x = np.arange(100_000, dtype=float)
+    df = pd.DataFrame({"x": x, "y": np.sin(x / 100)})
+    decimator = MinMaxDecimator(100, pyramid=True)
+    payload = {"width": 100, "relayoutData": {"xaxis.range[0]": 20_000, "xaxis.range[1]": 30_000}}
+
+    def decimate(data, data_key):
+        instance_payload = {"xAxis": "x", "yAxis": "y", "chartMode": "lines", "_tp_data_key": data_key}
+        return decimator._on_decimate_df(data, instance_payload, payload)[0]
+
+    with patch("taipy.gui.data.decimator.base._LodPyramid", wraps=_LodPyramid) as mock_pyramid:
+        # copies of the same version of the data of a variable share their pyramid
+        decimate(df.copy(), ("x", 1))
+        decimate(df.copy(), ("x", 1))
+        assert mock_pyramid.call_count == 1
+        # a new version of the data, of the same length, has its own pyramid
+        df["y"] = -df["y"]
+        decimate(df, ("x", 2))
+        assert mock_pyramid.call_count == 2
+        # the pyramids of other variables do not replace it
+        decimate(df.copy(), ("z", 1))
+        decimate(df, ("x", 2))
+        assert mock_pyramid.call_count == 3
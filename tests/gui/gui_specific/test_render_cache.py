@@ -0,0 +1,100 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+import taipy.gui.builder as tgb
+from taipy.gui import Gui, Markdown
+
+
+def _render(gui: Gui, client_id: str):
+    gui._bindings()._get_or_create_scope(client_id)
+    flask_client = gui._server.test_client()
+    response = flask_client.get(f"/taipy-jsx/test?client_id={client_id}")
+    assert response.status_code == 200
+    return response.get_json().get("jsx")
+
+
+def test_render_cache(gui: Gui):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{x}|input|>\n<|{x * 2}|text|>"))
+    gui.run(run_server=False, page_render_cache=True)
+    page = gui._get_page("test")
+    with patch.object(Markdown, "render", autospec=True, side_effect=Markdown.render) as render:
+        jsx = _render(gui, "client1")
+        assert render.call_count == 1
+        # same values in another scope: the page is not rendered again, but its variables are bound
+        assert _render(gui, "client2") == jsx
+        assert render.call_count == 1
+        with gui.get_flask_app().app_context():
+            gui._Gui__set_client_id_in_context("client2")  # type: ignore[attr-defined]
+            expr_hash = gui._evaluate_expr("{x * 2}")
+            assert getattr(gui._get_data_scope(), expr_hash) == 20
+            state = gui._Gui__state  # type: ignore[attr-defined]
+            assert state.x == 10
+            state.x = 12
+        # different values: the page is rendered
+        _render(gui, "client2")
+        assert render.call_count == 2
+        page._clear_render_cache()  # type: ignore[union-attr]
+        _render(gui, "client1")
+        assert render.call_count == 3
+
+
+def test_render_cache_disabled_by_default(gui: Gui):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{x}|input|>"))
+    gui.run(run_server=False)
+    with patch.object(Markdown, "render", autospec=True, side_effect=Markdown.render) as render:
+        _render(gui, "client1")
+        _render(gui, "client2")
+        assert render.call_count == 2
+
+
+def test_render_cache_ignores_pages_with_collections(gui: Gui):
+    values = [1, 2, 3]  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{values}|selector|lov={values}|>"))
+    gui.run(run_server=False, page_render_cache=True)
+    with patch.object(Markdown, "render", autospec=True, side_effect=Markdown.render) as render:
+        _render(gui, "client1")
+        _render(gui, "client2")
+        # collections can be modified in place: the page is always rendered
+        assert render.call_count == 2
+
+
+def _builder_page():
+    with tgb.Page(frame=None) as page:
+        tgb.text("{x}")  # type: ignore[attr-defined]
+    return page
+
+
+@pytest.mark.parametrize("page_render_cache", [False, True])
+def test_render_markdown_and_builder_pages(gui: Gui, page_render_cache):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{x}|text|>"))
+    gui.add_page("builder", _builder_page())
+    gui.run(run_server=False, page_render_cache=page_render_cache)
+    flask_client = gui._server.test_client()
+    for client_id in ["client1", "client2"]:
+        gui._bindings()._get_or_create_scope(client_id)
+        for page_name in ["test", "builder"]:
+            response = flask_client.get(f"/taipy-jsx/{page_name}?client_id={client_id}")
+            assert response.status_code == 200
+            jsx = response.get_json().get("jsx")
+            assert "<Field" in jsx
+            assert 'defaultValue="10"' in jsx
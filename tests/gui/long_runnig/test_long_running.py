@@ -42,3 +42,34 @@ def test_long_callback(gui: Gui):
         invoke_long_callback(state, heavy_function, (), heavy_function_status)
         invoke_long_callback(state, heavy_function, (2,), heavy_function_status, (), 1000)
         invoke_long_callback(state, heavy_function_with_exception, (), heavy_function_status)
+
+
+def test_long_callback_task(gui: Gui):
+    status = None  # noqa: F841
+
+    def heavy_function(task=None):
+        while not task.is_cancelled():
+            task.set_progress(0.5)
+            sleep(0.05)
+
+    def heavy_function_status(state: State, status):
+        state.status = status
+
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True, long_callback_workers=1)
+    state = gui._Gui__state  # type: ignore[attr-defined]
+
+    with gui.get_flask_app().app_context():
+        task = invoke_long_callback(state, heavy_function, (), heavy_function_status, pass_task=True)
+        queued = invoke_long_callback(state, heavy_function, (), heavy_function_status, pass_task=True)
+        assert task is not None and queued is not None
+        sleep(0.5)
+        assert state.status == 0.5
+        queued.cancel()
+        task.cancel()
+        sleep(0.2)
+        assert task.is_done() and queued.is_done()
+        assert state.status is False
+        metrics = gui._get_long_callback_metrics()
+        assert metrics["workers"] == 1
+        assert metrics["cancelled"] == 2
@@ -0,0 +1,79 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from taipy.gui import Gui, Markdown
+from taipy.gui._renderers import json as taipy_json
+from taipy.gui._renderers.json import _JsonFragment, _TaipyJsonEncoder, _TaipyWsJson, _to_json
+
+_VALUES = [
+    [1, 2.5, "a", None, True],
+    {"a": [1, 2], 3: "b"},
+    datetime(2024, 1, 2, 3, 4, 5),
+    Path("a") / "b",
+    np.int64(4),
+    [np.float32(1.5), (1, 2)],
+    2**70,
+]
+
+
+@pytest.mark.parametrize("value", _VALUES)
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_to_json(value, has_orjson):
+    if has_orjson and not taipy_json._has_orjson:
+        pytest.skip("orjson is not installed")
+    with patch.object(taipy_json, "_has_orjson", has_orjson):
+        assert json.loads(_to_json(value)) == json.loads(json.dumps(value, cls=_TaipyJsonEncoder))
+
+
+def test_ws_json_fragments():
+    fragment = _JsonFragment('{"x": [1, 2]}')
+    encoded = _TaipyWsJson.dumps(["message", {"payload": [{"value": fragment}, {"value": "__tp_json_0"}]}])
+    assert _TaipyWsJson.loads(encoded) == ["message", {"payload": [{"value": {"x": [1, 2]}}, {"value": "__tp_json_0"}]}]
+
+
+def test_values_are_serialized_once(gui: Gui, helpers):
+    def do_something(state, id):
+        state.values = list(range(1000))
+
+    values = [0]  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{values}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    with (
+        patch("taipy.gui.gui._to_json", wraps=_to_json) as to_json,
+        patch.object(_TaipyWsJson, "dumps", wraps=_TaipyWsJson.dumps) as dumps,
+    ):
+        ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    assert [c.args[0] for c in to_json.call_args_list].count(list(range(1000))) == 1
+    # the message holds the serialized value
+    updates = [
+        u
+        for c in dumps.call_args_list
+        if isinstance(c.args[0], list) and c.args[0][1].get("type") == "MU"
+        for u in c.args[0][1]["payload"]
+        if u["name"] == "tpec_TpExPr_values_TPMDL_0"
+    ]
+    assert isinstance(updates[0]["payload"]["value"], _JsonFragment)
+    received_messages = ws_client.get_received()
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_values_TPMDL_0", list(range(1000)))
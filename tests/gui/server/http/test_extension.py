@@ -10,6 +10,9 @@
 # specific language governing permissions and limitations under the License.
 
 
+import gzip
+from pathlib import Path
+
 import pytest
 
 from taipy.gui import Gui
@@ -39,3 +42,48 @@ def test_extension_config_wrong_path(gui: Gui, helpers):
     with pytest.warns(UserWarning):
         ret = flask_client.get("/taipy-extension/taipy_extension_example/titi")
         assert ret.status_code == 404
+
+
+def test_extension_precompressed_resource(gui: Gui, helpers, tmp_path):
+    script = tmp_path / "library.js"
+    script.write_text("console.log('library');")
+    Path(f"{script}.gz").write_bytes(gzip.compress(script.read_bytes()))
+
+    class MyResourceLibrary(MyLibrary):
+        def get_name(self) -> str:
+            return "taipy_extension_resource"
+
+        def get_resource(self, name: str) -> Path:
+            return tmp_path / name
+
+    Gui.add_library(MyResourceLibrary())
+    gui.run(run_server=False, single_client=True)
+    flask_client = gui._server.test_client()
+    ret = flask_client.get("/taipy-extension/taipy_extension_resource/library.js")
+    assert ret.status_code == 200
+    assert ret.data == script.read_bytes()
+    assert "Content-Encoding" not in ret.headers
+    assert ret.cache_control.no_cache
+    ret = flask_client.get(
+        "/taipy-extension/taipy_extension_resource/library.js?v=1", headers={"Accept-Encoding": "gzip, deflate"}
+    )
+    assert ret.status_code == 200
+    assert ret.headers["Content-Encoding"] == "gzip"
+    assert ret.mimetype == "text/javascript"
+    assert gzip.decompress(ret.data) == script.read_bytes()
+    # the library version does not identify the content of the resource: it is revalidated
+    assert not ret.cache_control.immutable
+    assert ret.cache_control.no_cache
+    # only a content hash does
+    ret = flask_client.get("/taipy-extension/taipy_extension_resource/library.js?0123456789abcdef0123")
+    assert ret.status_code == 200
+    assert ret.cache_control.immutable
+    assert ret.cache_control.max_age > 0
+    ret = flask_client.get("/taipy-extension/taipy_extension_resource/library.js?x")
+    assert not ret.cache_control.immutable
+    # the file is not sent again if the client has it
+    ret = flask_client.get(
+        "/taipy-extension/taipy_extension_resource/library.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": ret.headers["ETag"]},
+    )
+    assert ret.status_code == 304
@@ -124,3 +124,64 @@ def test_file_upload_multiple(gui: Gui, helpers):
     assert created_file.exists()
     value = getattr(gui._bindings()._get_all_scopes()[sid], var_name)
     assert len(value) == 2
+
+
+def test_file_upload_multi_part_out_of_order(gui: Gui, helpers):
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    sid = helpers.create_scope_and_get_sid(gui)
+    file_name = "test3.txt"
+    upload_path = pathlib.Path(gui._get_config("upload_folder", tempfile.gettempdir()))
+    file_path = _get_non_existent_file_path(upload_path, file_name)
+    chunks = [(2, b"ghi"), (0, b"abc"), (2, b"ghi"), (1, b"def")]
+    for part, content in chunks:
+        assert not file_path.exists()
+        ret = flask_client.post(
+            f"/taipy-uploads?client_id={sid}",
+            data={
+                "var_name": "varname",
+                "blob": (io.BytesIO(content), file_name),
+                "total": "3",
+                "part": str(part),
+                "offset": str(part * 3),
+                "size": "9",
+                "upload_id": "upload_1",
+            },
+            content_type="multipart/form-data",
+        )
+        assert ret.status_code == 200
+    assert file_path.read_bytes() == b"abcdefghi"
+    assert not list(upload_path.glob(f".{file_name}.*.upload"))
+
+
+@pytest.mark.parametrize(
+    "part, offset, size, content",
+    [
+        ("3", "0", "9", b"abc"),
+        ("-1", "0", "9", b"abc"),
+        ("0", "-3", "9", b"abc"),
+        ("0", "10", "9", b"abc"),
+        ("2", "6", "9", b"ghij"),
+        ("0", "0", None, b"abc"),
+    ],
+)
+def test_file_upload_multi_part_invalid_chunk(gui: Gui, helpers, part, offset, size, content):
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    sid = helpers.create_scope_and_get_sid(gui)
+    file_name = "test4.txt"
+    upload_path = pathlib.Path(gui._get_config("upload_folder", tempfile.gettempdir()))
+    data = {
+        "var_name": "varname",
+        "blob": (io.BytesIO(content), file_name),
+        "total": "3",
+        "part": part,
+        "offset": offset,
+        "upload_id": f"upload_{part}_{offset}_{size}",
+    }
+    if size is not None:
+        data["size"] = size
+    with pytest.warns(UserWarning):
+        ret = flask_client.post(f"/taipy-uploads?client_id={sid}", data=data, content_type="multipart/form-data")
+    assert ret.status_code == 400
+    assert all(f.stat().st_size <= 9 for f in upload_path.glob(f".{file_name}.*.upload"))
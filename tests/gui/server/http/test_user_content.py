@@ -47,3 +47,20 @@ def test_user_content_with_callback(gui: Gui, helpers):
     flask_client = gui._server.test_client()
     ret = flask_client.get(gui._get_user_content_url("path"))
     assert ret.status_code == 200
+
+
+def test_user_content_etag(gui: Gui, helpers):
+    def on_user_content_cb(state, path, args):
+        return "content"
+
+    on_user_content = on_user_content_cb  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    flask_client = gui._server.test_client()
+    ret = flask_client.get(gui._get_user_content_url("path"))
+    assert ret.status_code == 200
+    assert ret.data == b"content"
+    etag = ret.headers["ETag"]
+    ret = flask_client.get(gui._get_user_content_url("path"), headers={"If-None-Match": etag})
+    assert ret.status_code == 304
+    assert ret.data == b""
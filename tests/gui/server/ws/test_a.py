@@ -41,5 +41,35 @@ def test_a_button_pressed(gui: Gui, helpers):
     assert gui._bindings()._get_all_scopes()[sid].x == 20  # type: ignore
     # assert for received message (message that would be sent to the front-end client)
     received_messages = ws_client.get_received()
+    # both updates are coalesced in a single message
+    assert len(received_messages) == 1
     helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 20)
-    helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+
+
+def test_a_button_repeated_updates(gui: Gui, helpers):
+    def do_something(state, id):
+        for _ in range(30):
+            state.x = state.x + 1
+
+    x = 10  # noqa: F841
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    assert gui._bindings()._get_all_scopes()[sid].x == 40  # type: ignore
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 1
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 40)
+    names = [u["name"] for u in received_messages[0]["args"]["payload"]]
+    assert len(names) == len(set(names))
+    metrics = gui._get_ws_queue_metrics()[sid]
+    assert metrics["sent"] == 1
+    assert metrics["coalesced"] >= 29
+    assert metrics["depth"] == 0
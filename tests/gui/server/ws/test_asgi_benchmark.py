@@ -0,0 +1,143 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Connection-scaling benchmark of the 'asgi' async mode.
+
+Many clients connect to the server and trigger an action at the same time, while one of them runs
+a slow callback. The tests check that the other clients are served before the slow callback ends.
+More clients can be benchmarked with:
+
+    TAIPY_ASGI_BENCHMARK_CLIENTS=100,500,1000 python tests/gui/server/ws/test_asgi_benchmark.py
+"""
+
+import asyncio
+import inspect
+import os
+import time
+import typing as t
+import warnings
+
+import pytest
+
+socketio = pytest.importorskip("socketio")
+pytest.importorskip("uvicorn")
+pytest.importorskip("asgiref")
+pytest.importorskip("aiohttp")
+
+from taipy.gui import Gui  # noqa: E402
+
+_CLIENTS = [int(s) for s in os.environ.get("TAIPY_ASGI_BENCHMARK_CLIENTS", "10,50").split(",")]
+_PORT = 5123
+_SLOW_CALLBACK_DURATION = 2.0
+
+
+def _has_ack(message: t.Any, ack_id: str) -> bool:
+    if isinstance(message, dict):
+        if message.get("type") == "ACK" and message.get("id") == ack_id:
+            return True
+        return any(_has_ack(v, ack_id) for v in message.values())
+    if isinstance(message, list):
+        return any(_has_ack(v, ack_id) for v in message)
+    return False
+
+
+async def _client_round_trip(gui: Gui, index: int, action: str) -> t.Tuple[float, float]:
+    """Connect a client, trigger *action* and wait for its acknowledgement.
+
+    Returns the connection and action round-trip durations.
+    """
+    client_id = f"client_{index}"
+    gui._bindings()._get_or_create_scope(client_id)
+    ack_id = f"ack_{index}"
+    acknowledged = asyncio.Event()
+    client = socketio.AsyncClient()
+
+    @client.on("message")
+    def on_message(message):
+        if _has_ack(message, ack_id):
+            acknowledged.set()
+
+    start = time.perf_counter()
+    await client.connect(f"http://127.0.0.1:{_PORT}", transports=["websocket"])
+    connected = time.perf_counter()
+    await client.emit(
+        "message", {"client_id": client_id, "type": "A", "name": "button", "payload": action, "ack_id": ack_id}
+    )
+    await asyncio.wait_for(acknowledged.wait(), timeout=60)
+    done = time.perf_counter()
+    await client.disconnect()
+    return connected - start, done - connected
+
+
+async def _run_clients(gui: Gui, n_clients: int) -> t.List[t.Tuple[float, float]]:
+    slow = asyncio.create_task(_client_round_trip(gui, 0, "slow_action"))
+    # let the slow callback start before the other clients connect
+    await asyncio.sleep(0.2)
+    fast = await asyncio.gather(*[_client_round_trip(gui, i, "fast_action") for i in range(1, n_clients)])
+    await slow
+    return list(fast)
+
+
+def _start_gui() -> Gui:
+    def slow_action(state, id, payload):
+        time.sleep(_SLOW_CALLBACK_DURATION)
+
+    def fast_action(state, id, payload):
+        state.x += 1
+
+    x = 0  # noqa: F841
+    gui = Gui()
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", "<|{x}|>")
+    with warnings.catch_warnings(record=True):
+        gui.run(
+            run_in_thread=True,
+            run_browser=False,
+            async_mode="asgi",
+            port=_PORT,
+            single_client=False,
+            stylekit=False,
+        )
+    while not gui._server._is_running:
+        time.sleep(0.1)
+    # wait for the server to accept connections
+    time.sleep(1)
+    return gui
+
+
+@pytest.mark.teste2e
+@pytest.mark.parametrize("n_clients", _CLIENTS)
+def test_asgi_slow_callback_does_not_block_clients(n_clients, helpers):
+    gui = _start_gui()
+    try:
+        results = asyncio.run(_run_clients(gui, n_clients))
+        assert len(results) == n_clients - 1
+        assert max(r[1] for r in results) < _SLOW_CALLBACK_DURATION
+    finally:
+        gui.stop()
+        helpers.test_cleanup()
+
+
+if __name__ == "__main__":
+    from tests.gui.helpers import Helpers
+
+    print(f"{'clients':>8} {'connect avg (ms)':>17} {'action avg (ms)':>16} {'action max (ms)':>16}")  # noqa: T201
+    for n_clients in _CLIENTS:
+        gui = _start_gui()
+        try:
+            results = asyncio.run(_run_clients(gui, n_clients))
+        finally:
+            gui.stop()
+            Helpers.test_cleanup()
+        connect_avg = sum(r[0] for r in results) * 1000 / len(results)
+        action_avg = sum(r[1] for r in results) * 1000 / len(results)
+        action_max = max(r[1] for r in results) * 1000
+        print(f"{n_clients:>8} {connect_avg:>17.1f} {action_avg:>16.1f} {action_max:>16.1f}")  # noqa: T201
@@ -11,6 +11,8 @@
 
 import inspect
 
+import pandas as pd
+
 from taipy.gui import Gui, Markdown
 
 
@@ -137,3 +139,35 @@ def test_du_table_data_fetched(gui: Gui, helpers, csvdata):
             "format": "JSON",
         },
     )
+
+
+def test_du_table_data_delta(gui: Gui, helpers):
+    def add_row(state, id):
+        state.data = pd.concat([state.data, pd.DataFrame({"value": [3]})], ignore_index=True)
+
+    data = pd.DataFrame({"value": [1, 2]})  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{data}|table|> <|Add|button|on_action=add_row|id=add_row|>"))
+    gui.run(run_server=False, data_delta_updates=True)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.emit(
+        "message",
+        {
+            "client_id": sid,
+            "type": "DU",
+            "name": "_TpD_tpec_TpExPr_data_TPMDL_0",
+            "payload": {"columns": ["value"], "pagekey": "0-100--asc", "start": 0, "end": 99},
+        },
+    )
+    ws_client.get_received()
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "add_row", "payload": "add_row"})
+    received_messages = ws_client.get_received()
+    helpers.assert_outward_ws_message(
+        received_messages[0],
+        "MU",
+        "_TpD_tpec_TpExPr_data_TPMDL_0",
+        {"__taipy_delta": {"0-100--asc": {"rows": {"2": {"value": 3, "_tp_index": 2}}, "rowcount": 3}}},
+    )
@@ -0,0 +1,78 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Benchmark of the re-evaluation of expressions when a variable changes.
+
+The tests check that only the expressions depending on the modified variable are re-evaluated, on
+pages holding a few thousand expressions. Larger sizes can be benchmarked with:
+
+    TAIPY_EVALUATOR_BENCHMARK_SIZES=10000,50000 python tests/gui/utils/test_evaluator_benchmark.py
+"""
+
+import inspect
+import os
+import time
+
+import pytest
+
+from taipy.gui import Gui
+
+_SIZES = [int(s) for s in os.environ.get("TAIPY_EVALUATOR_BENCHMARK_SIZES", "1000,5000").split(",")]
+# Number of variables the expressions depend on
+_NB_VARIABLES = 10
+
+
+def _bind_expressions(gui: Gui, size: int):
+    """Evaluate *size* expressions, each depending on one of the variables, and return their hashes
+    per variable."""
+    hashes: dict = {}
+    for i in range(size):
+        var_name = f"v{i % _NB_VARIABLES}"
+        hashes.setdefault(var_name, set()).add(gui._evaluate_expr(f"{{{var_name} + {i}}}"))
+    return hashes
+
+
+def _timed_re_evaluation(gui: Gui, var_name: str):
+    start = time.perf_counter()
+    modified = gui._re_evaluate_expr(gui._bind_var(var_name))
+    return modified, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("size", _SIZES)
+def test_re_evaluate_dependent_expressions(gui: Gui, size: int):
+    v0, v1, v2, v3, v4, v5, v6, v7, v8, v9 = range(_NB_VARIABLES)  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        hashes = _bind_expressions(gui, size)
+        v0_name = gui._bind_var("v0")
+        setattr(gui._bindings(), v0_name, 100)
+        modified, _ = _timed_re_evaluation(gui, "v0")
+        assert modified == hashes["v0"]
+        assert {getattr(gui._bindings(), h) for h in hashes["v0"]} == {100 + i for i in range(0, size, _NB_VARIABLES)}
+        # other expressions were not re-evaluated
+        assert {getattr(gui._bindings(), h) for h in hashes["v1"]} == {1 + i for i in range(1, size, _NB_VARIABLES)}
+
+
+if __name__ == "__main__":
+    print(f"{'size':>10} {'evaluation (s)':>15} {'re-evaluation (s)':>18}")  # noqa: T201
+    v0, v1, v2, v3, v4, v5, v6, v7, v8, v9 = range(_NB_VARIABLES)
+    for size in _SIZES:
+        Gui._Gui__instance = None  # type: ignore[attr-defined]
+        gui = Gui()
+        gui._set_frame(inspect.currentframe())
+        gui.run(run_server=False, single_client=True)
+        with gui.get_flask_app().app_context():
+            start = time.perf_counter()
+            _bind_expressions(gui, size)
+            elapsed = time.perf_counter() - start
+            _, re_elapsed = _timed_re_evaluation(gui, "v0")
+        print(f"{size:>10} {elapsed:>15.3f} {re_elapsed:>18.3f}")  # noqa: T201
@@ -0,0 +1,128 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+import time
+
+from taipy.gui.utils._long_callback_executor import _LongCallbackExecutor, _LongCallbackTask
+
+
+def _task(client_id, function, args=(), done=None, on_progress=None, progress_interval=0.1):
+    def on_done(task, success, result, e):
+        if done is not None:
+            done.append((client_id, success, result, e))
+
+    return _LongCallbackTask(client_id, function, list(args), {}, on_done, on_progress, progress_interval)
+
+
+def _wait_for(predicate, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end
+        time.sleep(0.01)
+
+
+def test_run_tasks():
+    executor = _LongCallbackExecutor(2)
+    done = []
+    executor.submit(_task("a", lambda x: x * 2, (21,), done))
+    executor.submit(_task("b", lambda: 1 / 0, (), done))
+    _wait_for(lambda: len(done) == 2)
+    results = {d[0]: d for d in done}
+    assert results["a"][1:3] == (True, 42)
+    assert results["b"][1] is False
+    assert isinstance(results["b"][3], ZeroDivisionError)
+    metrics = executor.get_metrics()
+    assert metrics["workers"] == 2
+    assert metrics["submitted"] == 2
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["queued"] == 0
+    executor.shutdown()
+
+
+def test_fair_queue():
+    executor = _LongCallbackExecutor(1)
+    release = threading.Event()
+    order = []
+    done = []
+    executor.submit(_task("a", release.wait, (), done))
+    _wait_for(lambda: executor.get_metrics()["busy"] == 1)
+    for i in range(3):
+        executor.submit(_task("a", order.append, (f"a{i}",), done))
+    executor.submit(_task("b", order.append, ("b0",), done))
+    executor.submit(_task("c", order.append, ("c0",), done))
+    assert executor.get_metrics()["queued"] == 5
+    release.set()
+    _wait_for(lambda: len(done) == 6)
+    # each client gets its turn
+    assert order == ["a0", "b0", "c0", "a1", "a2"]
+    assert executor.get_metrics()["max_queue_wait"] > 0
+    executor.shutdown()
+
+
+def test_cancel():
+    executor = _LongCallbackExecutor(1)
+    release = threading.Event()
+    done = []
+    ran = []
+
+    def work(task=None):
+        release.wait()
+        ran.append(True)
+        return "done"
+
+    running = _task("a", work, (), done)
+    queued = _task("a", ran.append, (False,), done)
+    executor.submit(running)
+    executor.submit(queued)
+    _wait_for(lambda: executor.get_metrics()["busy"] == 1)
+    queued.cancel()
+    assert queued.is_cancelled()
+    assert queued.is_done()
+    running.cancel()
+    release.set()
+    _wait_for(lambda: len(done) == 2)
+    assert ran == [True]
+    assert all(not d[1] for d in done)
+    assert executor.get_metrics()["cancelled"] == 2
+    executor.shutdown()
+
+
+def test_coalesce_progress():
+    executor = _LongCallbackExecutor(1)
+    progress = []
+    done = []
+
+    def work():
+        for i in range(1, 101):
+            task.set_progress(i / 100)
+        time.sleep(0.3)
+
+    task = _task("a", work, (), done, progress.append, 0.05)
+    executor.submit(task)
+    _wait_for(lambda: len(done) == 1)
+    assert progress == [1.0]
+    executor.shutdown()
+
+
+def test_shutdown_cancels_queued_tasks():
+    executor = _LongCallbackExecutor(1)
+    release = threading.Event()
+    done = []
+    executor.submit(_task("a", release.wait, (), done))
+    _wait_for(lambda: executor.get_metrics()["busy"] == 1)
+    queued = executor.submit(_task("b", lambda: None, (), done))
+    executor.shutdown()
+    assert queued.is_cancelled()
+    release.set()
+    _wait_for(lambda: len(done) == 2)
+    assert executor.get_metrics()["cancelled"] == 1
@@ -0,0 +1,102 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from taipy.gui.utils._ws_scheduler import _WsScheduler
+
+
+def _update(*names_values):
+    return {"type": "MU", "payload": [{"name": n, "payload": {"value": v}} for n, v in names_values]}
+
+
+def _scheduler():
+    emitted = []
+    tasks = []
+    scheduler = _WsScheduler(lambda payload, to: emitted.append((payload, to)), tasks.append, lambda s: None)
+    return scheduler, emitted, tasks
+
+
+def test_send_outside_of_tick():
+    scheduler, emitted, tasks = _scheduler()
+    scheduler.send("client", _update(("x", 1)), "sid")
+    scheduler.send("client", _update(("x", 2)), "sid")
+    assert len(emitted) == 2
+    assert not tasks
+    assert scheduler.get_metrics()["client"]["sent"] == 2
+
+
+def test_coalesce_updates_in_tick():
+    scheduler, emitted, tasks = _scheduler()
+    first = _update(("x", 1))
+    with scheduler.tick():
+        scheduler.send("client", first, "sid")
+        scheduler.send("client", _update(("y", 1)), "sid")
+        scheduler.send("client", _update(("x", 2)), "sid")
+        assert not emitted
+        assert scheduler.get_metrics()["client"]["depth"] == 1
+    assert len(emitted) == 1
+    payload, to = emitted[0]
+    assert to == "sid"
+    assert [(u["name"], u["payload"]["value"]) for u in payload["payload"]] == [("y", 1), ("x", 2)]
+    # the caller's payload is left untouched
+    assert len(first["payload"]) == 1
+    metrics = scheduler.get_metrics()["client"]
+    assert metrics == {"depth": 0, "max_depth": 1, "sent": 1, "coalesced": 1}
+    assert len(tasks) == 1
+
+
+def test_keep_order_of_other_messages():
+    scheduler, emitted, _ = _scheduler()
+    with scheduler.tick():
+        scheduler.send("client", _update(("x", 1)), "sid")
+        scheduler.send("client", {"type": "AL", "message": "hello"}, "sid")
+        scheduler.send("client", _update(("x", 2)), "sid")
+        scheduler.send("other", _update(("x", 3)), "other_sid")
+    assert [p["type"] for p, to in emitted if to == "sid"] == ["MU", "AL", "MU"]
+    assert [p["payload"][0]["payload"]["value"] for p, to in emitted if to == "other_sid"] == [3]
+    assert scheduler.get_metrics()["client"]["max_depth"] == 3
+
+
+def test_flush_in_send_order_across_receivers():
+    scheduler, emitted, _ = _scheduler()
+    with scheduler.tick():
+        scheduler.send("client", {"type": "AL", "message": "hello"}, "sid")
+        scheduler.send("client", _update(("x", 1)), ["sid", "sid2"])
+        scheduler.send("client", _update(("x", 2)), ["sid", "sid2"])
+        scheduler.send("client", {"type": "ACK", "id": "ack"}, "sid")
+    assert [(p["type"], to) for p, to in emitted] == [("AL", "sid"), ("MU", ["sid", "sid2"]), ("ACK", "sid")]
+    assert emitted[1][0]["payload"][0]["payload"]["value"] == 2
+
+
+def test_flush_late_messages():
+    scheduler = None
+    emitted = []
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            # a long callback runs in the tick: messages are sent before it completes
+            scheduler._WsScheduler__pending[("client", "sid")].since -= 1  # type: ignore
+
+    scheduler = _WsScheduler(lambda payload, to: emitted.append(payload), lambda fn: None, sleep)
+    with scheduler.tick():
+        scheduler.send("client", _update(("x", 1)), "sid")
+        scheduler._WsScheduler__flush_late_messages()  # type: ignore
+        assert len(emitted) == 1
+    assert len(emitted) == 1
+    assert len(sleeps) == 2
+
+
+def test_forget():
+    scheduler, _, _ = _scheduler()
+    scheduler.send("client", _update(("x", 1)), "sid")
+    scheduler.forget("client")
+    assert "client" not in scheduler.get_metrics()
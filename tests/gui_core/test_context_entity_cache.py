@@ -0,0 +1,180 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+from taipy.common.config.common.frequency import Frequency
+from taipy.common.config.common.scope import Scope
+from taipy.core import Cycle, CycleId, Job, JobId, Scenario, Task
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.notification.event import Event, EventEntityType, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+
+a_cycle = Cycle(Frequency.DAILY, {}, datetime.now(), datetime.now(), datetime.now(), id=CycleId("CYCLE_id"))
+a_scenario = Scenario("scenario_config_id", None, {})
+another_scenario = Scenario("scenario_config_id", None, {}, cycle=a_cycle)
+a_task = Task("task_config_id", {}, print)
+a_job = Job(t.cast(JobId, "JOB_job_id"), a_task, "submit_id", a_scenario.id)
+another_job = Job(t.cast(JobId, "JOB_another_job_id"), a_task, "submit_id", a_scenario.id)
+a_datanode = PickleDataNode("data_node_config_id", Scope.SCENARIO, owner_id=a_scenario.id)
+
+
+def mock_core_get(entity_id):
+    return next((e for e in (a_scenario, another_scenario, a_job, another_job, a_datanode) if e.id == entity_id), None)
+
+
+def mock_is_true(entity_id):
+    return True
+
+
+class TestGuiCoreContext_entity_cache:
+    def test_jobs_cache(self):
+        with patch("taipy.gui_core._context.core_get", side_effect=mock_core_get) as core_get:
+            gui_core_context = _GuiCoreContext(Mock())
+            gui_core_context.jobs_list = [a_job]
+            gui_core_context.process_event(
+                Event(EventEntityType.JOB, EventOperation.UPDATE, entity_id=a_job.id, attribute_name="status")
+            )
+            assert gui_core_context.jobs_list == [a_job]
+            core_get.assert_not_called()
+            gui_core_context.process_event(
+                Event(EventEntityType.JOB, EventOperation.CREATION, entity_id=another_job.id)
+            )
+            assert gui_core_context.jobs_list == [a_job, another_job]
+            gui_core_context.process_event(Event(EventEntityType.JOB, EventOperation.DELETION, entity_id=a_job.id))
+            assert gui_core_context.jobs_list == [another_job]
+            gui_core_context.gui._broadcast.assert_called_with(
+                _GuiCoreContext._CORE_CHANGED_NAME, {"jobs": a_job.id}, None
+            )
+            gui_core_context.process_event(
+                Event(EventEntityType.JOB, EventOperation.DELETION, metadata={"delete_all": True})
+            )
+            assert gui_core_context.jobs_list is None
+
+    def test_scenarios_cache(self):
+        with (
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get),
+            patch("taipy.gui_core._context.is_readable", side_effect=mock_is_true),
+        ):
+            gui_core_context = _GuiCoreContext(MagicMock())
+            gui_core_context.scenario_by_cycle = {None: [a_scenario]}
+            gui_core_context.process_event(
+                Event(EventEntityType.SCENARIO, EventOperation.CREATION, entity_id=another_scenario.id)
+            )
+            assert gui_core_context.scenario_by_cycle == {None: [a_scenario], a_cycle: [another_scenario]}
+            gui_core_context.gui._broadcast.assert_called_with(
+                _GuiCoreContext._CORE_CHANGED_NAME, {"scenario": another_scenario.id}, None
+            )
+            gui_core_context.process_event(
+                Event(EventEntityType.SCENARIO, EventOperation.DELETION, entity_id=another_scenario.id)
+            )
+            assert gui_core_context.scenario_by_cycle == {None: [a_scenario]}
+            gui_core_context.process_event(
+                Event(EventEntityType.SCENARIO, EventOperation.DELETION, metadata={"delete_by_version": "1.0"})
+            )
+            assert gui_core_context.scenario_by_cycle is None
+
+    def test_data_nodes_cache(self):
+        with patch("taipy.gui_core._context.core_get", side_effect=mock_core_get):
+            gui_core_context = _GuiCoreContext(Mock())
+            gui_core_context.data_nodes_by_owner = {}
+            gui_core_context.process_event(
+                Event(EventEntityType.DATA_NODE, EventOperation.CREATION, entity_id=a_datanode.id)
+            )
+            assert gui_core_context.data_nodes_by_owner == {a_scenario.id: [a_datanode]}
+            gui_core_context.process_event(
+                Event(EventEntityType.DATA_NODE, EventOperation.DELETION, entity_id=a_datanode.id)
+            )
+            assert gui_core_context.data_nodes_by_owner == {}
+            gui_core_context.gui._broadcast.assert_called_with(
+                _GuiCoreContext._CORE_CHANGED_NAME, {"datanode": a_datanode.id}, None
+            )
+
+    def test_jobs_query(self):
+        with (
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get) as core_get,
+            patch("taipy.gui_core._context.is_readable", side_effect=mock_is_true),
+            patch("taipy.gui_core._context.is_deletable", side_effect=mock_is_true),
+            patch("taipy.gui_core._context.is_editable", side_effect=mock_is_true),
+            patch.object(Job, "get_simple_label", lambda job: job.id),
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            gui_core_context.jobs_list = [a_job, another_job]
+            assert gui_core_context.get_jobs_list() == [a_job, another_job]
+            assert gui_core_context.get_jobs_count() == 2
+            # the projection of the jobs is computed once
+            assert core_get.call_count == 2
+            assert gui_core_context.get_jobs_list(None, [{"col": 0, "order": False}]) == [a_job, another_job]
+            assert gui_core_context.get_jobs_list(None, [{"col": 0, "order": True}]) == [another_job, a_job]
+            assert gui_core_context.get_jobs_list([{"data": 0, "operator": "is", "value": "ANOTHER"}]) == [another_job]
+            assert gui_core_context.get_jobs_list([{"data": 0, "operator": "isnot", "value": "another"}]) == [a_job]
+            status = a_job.status.name.lower()
+            assert gui_core_context.get_jobs_list([{"data": 7, "operator": "is", "value": status}]) == [
+                j for j in (a_job, another_job) if j.status.name.lower() == status
+            ]
+            assert gui_core_context.get_jobs_list(None, None, {"start": 1, "end": 10}) == [another_job]
+            assert core_get.call_count == 2
+            # the authorization checks are not shared between the clients
+            assert len(gui_core_context.job_rows[a_job.id]) == 8
+            assert gui_core_context.job_adapter(a_job)[:8] == gui_core_context.job_rows[a_job.id]
+            # rows are computed again when the job changes
+            gui_core_context.process_event(
+                Event(EventEntityType.JOB, EventOperation.UPDATE, entity_id=a_job.id, attribute_name="status")
+            )
+            assert a_job.id not in gui_core_context.job_rows
+            assert gui_core_context.get_jobs_count() == 2
+            assert core_get.call_count == 3
+
+    def test_scenarios_query(self):
+        with (
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get),
+            patch("taipy.gui_core._context.is_readable", side_effect=mock_is_true),
+            patch("taipy.gui_core._context.get_cycles_scenarios", return_value={None: [a_scenario]}),
+        ):
+            gui_core_context = _GuiCoreContext(MagicMock())
+            with patch.object(
+                gui_core_context, "get_sorted_scenario_list", side_effect=gui_core_context.get_sorted_scenario_list
+            ) as get_sorted:
+                assert gui_core_context.get_scenarios(None, None, None) == [a_scenario]
+                assert gui_core_context.get_scenarios(None, None, None) == [a_scenario]
+                assert get_sorted.call_count == 1
+                gui_core_context.process_event(
+                    Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id=a_scenario.id)
+                )
+                assert gui_core_context.get_scenarios(None, None, None) == [a_scenario]
+                assert get_sorted.call_count == 2
+            row = gui_core_context.scenario_adapter(a_scenario)
+            assert row == gui_core_context.scenario_rows[a_scenario.id]
+            assert row is not gui_core_context.scenario_rows[a_scenario.id]
+
+    def test_data_node_history(self):
+        edits = [{"timestamp": datetime(2024, 1, i + 1), "job_id": a_job.id} for i in range(5)]
+        edits.append({"timestamp": datetime(2024, 2, 1), "writer_identifier": "user", "comment": "manual"})
+        datanode = Mock(spec=PickleDataNode, edits=edits)
+        with (
+            patch(
+                "taipy.gui_core._context.core_get",
+                side_effect=lambda id: datanode if id == "DATANODE_id" else mock_core_get(id),
+            ) as core_get,
+            patch("taipy.gui_core._context.is_readable", side_effect=mock_is_true),
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            history = gui_core_context.get_data_node_history("DATANODE_id", 3)
+            assert [h[0] for h in history] == [datetime(2024, 2, 1), datetime(2024, 1, 5), datetime(2024, 1, 4)]
+            assert history[0][1:] == ("user", "manual")
+            assert history[1][1] == a_job.id
+            # the job is read once for all its edits
+            assert core_get.call_count == 2
+            assert len(gui_core_context.get_data_node_history("DATANODE_id")) == 6
+            assert gui_core_context.get_data_node_history_count("DATANODE_id") == 6
+            assert core_get.call_count == 4
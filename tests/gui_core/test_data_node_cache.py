@@ -0,0 +1,98 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pandas as pd
+
+from taipy.core import DataNode
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.notification.event import Event, EventEntityType, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+from taipy.gui_core._data_node_cache import _DataNodeReadCache, _get_size
+
+
+def _datanode(id: str, value, spec=PickleDataNode):
+    return Mock(spec=spec, id=id, last_edit_date=datetime(2024, 1, 1), read=Mock(return_value=value))
+
+
+class TestDataNodeReadCache:
+    def test_read(self):
+        cache = _DataNodeReadCache(10_000)
+        dn = _datanode("DATANODE_1", pd.DataFrame({"a": [1, 2, 3]}))
+        value = cache.read(dn)
+        assert cache.read(dn) is value
+        assert dn.read.call_count == 1
+        assert cache.get_stats()["hit_rate"] == 0.5
+        # a new edit is read again
+        dn.last_edit_date = datetime(2024, 1, 2)
+        cache.read(dn)
+        assert dn.read.call_count == 2
+        assert cache.get_stats()["entries"] == 1
+        cache.invalidate(dn.id)
+        cache.read(dn)
+        assert dn.read.call_count == 3
+
+    def test_budget(self):
+        value = list(range(100))
+        size = _get_size(value)
+        cache = _DataNodeReadCache(size * 2)
+        dn1, dn2, dn3 = (_datanode(f"DATANODE_{i}", list(range(100))) for i in range(3))
+        cache.read(dn1)
+        cache.read(dn2)
+        cache.read(dn1)
+        cache.read(dn3)
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["size"] <= size * 2
+        # least recently used entry was evicted
+        cache.read(dn1)
+        assert dn1.read.call_count == 1
+        cache.read(dn2)
+        assert dn2.read.call_count == 2
+        # values larger than the budget are not cached
+        big = _datanode("DATANODE_big", list(range(1000)))
+        cache.read(big)
+        cache.read(big)
+        assert big.read.call_count == 2
+
+    def test_disabled(self):
+        cache = _DataNodeReadCache(0)
+        dn = _datanode("DATANODE_1", [1, 2])
+        cache.read(dn)
+        cache.read(dn)
+        assert dn.read.call_count == 2
+
+    def test_non_file_data_nodes_are_not_cached(self):
+        cache = _DataNodeReadCache(10_000)
+        dn = _datanode("DATANODE_1", [1, 2], DataNode)
+        cache.read(dn)
+        cache.read(dn)
+        assert dn.read.call_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+    def test_invalidated_by_events(self):
+        gui = Mock()
+        gui._get_config.return_value = 10_000
+        gui_core_context = _GuiCoreContext(gui)
+        dn = _datanode("DATANODE_1", [1, 2])
+        gui_core_context.get_data_node_tabular_data("")  # starts the context
+        gui_core_context.data_node_cache.read(dn)
+        gui_core_context.process_event(
+            Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id=dn.id, attribute_name="last_edit_date")
+        )
+        gui_core_context.data_node_cache.read(dn)
+        assert dn.read.call_count == 2
+        gui_core_context.process_event(
+            Event(EventEntityType.DATA_NODE, EventOperation.DELETION, metadata={"delete_all": True})
+        )
+        assert gui_core_context.data_node_cache.get_stats()["entries"] == 0
@@ -45,6 +45,7 @@ extras_require = {
         "python-magic-bin>=0.4.14,<0.5;platform_system=='Windows'",
     ],
     "arrow": ["pyarrow>=17.0.0,<18.0"],
+    "asgi": ["uvicorn>=0.29,<1.0", "asgiref>=3.7,<4.0"],
 }
 
 
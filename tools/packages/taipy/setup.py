@@ -57,6 +57,7 @@ setup(
         ],
         "rdp": ["rdp>=0.8"],
         "arrow": ["pyarrow>=17.0.0,<18.0"],
+        "asgi": ["uvicorn>=0.29,<1.0", "asgiref>=3.7,<4.0"],
         "mssql": ["pyodbc>=4"],
     },
     cmdclass={"build_py": NPMInstall},